@@ -0,0 +1,91 @@
+"""
+Micro-benchmark for chart-response parsing in get_history
+Compares the old per-bar list-comprehension parser with the vectorized
+_parse_chart_history on synthetic 20-year daily payloads.
+
+Usage: python benchmarks/bench_chart_parse.py [--years 20] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from yahoo_api_direct import _parse_chart_history
+
+
+def make_chart_payload(years=20, seed=0):
+    """Build a /v8/finance/chart style payload with ~252 bars per year and a few null bars"""
+    rng = np.random.default_rng(seed)
+    bars = years * 252
+    start = 946900800  # 2000-01-03 14:30 UTC
+    timestamps = (start + np.arange(bars) * 86400).tolist()
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    quote = {
+        'open': (close * 0.999).tolist(),
+        'high': (close * 1.01).tolist(),
+        'low': (close * 0.99).tolist(),
+        'close': close.tolist(),
+        'volume': rng.integers(1_000_000, 50_000_000, bars).tolist(),
+    }
+    # Yahoo returns nulls for halted days
+    for i in rng.choice(bars, size=max(1, bars // 500), replace=False):
+        for key in quote:
+            quote[key][i] = None
+    return {'chart': {'result': [{'timestamp': timestamps, 'indicators': {'quote': [quote]}}]}}
+
+
+def legacy_parse(symbol, data):
+    """The previous parser: one datetime object per bar and list-backed columns"""
+    result = data['chart']['result'][0]
+    timestamps = result['timestamp']
+    quotes = result['indicators']['quote'][0]
+    df = pd.DataFrame({
+        'Open': quotes['open'],
+        'High': quotes['high'],
+        'Low': quotes['low'],
+        'Close': quotes['close'],
+        'Volume': quotes['volume']
+    }, index=[datetime.fromtimestamp(ts) for ts in timestamps])
+    df = df.dropna(how='all')
+    df.index.name = 'Date'
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--years', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    
+    payload = make_chart_payload(args.years)
+    bars = len(payload['chart']['result'][0]['timestamp'])
+    
+    # Same values either way; only the index timezone convention differs
+    legacy = legacy_parse('BENCH', payload)
+    vectorized = _parse_chart_history('BENCH', payload, float32=False)
+    assert np.allclose(legacy['Close'].to_numpy(dtype=float), vectorized['Close'].to_numpy(), equal_nan=True)
+    assert len(legacy) == len(vectorized)
+    
+    print(f"Chart parse benchmark: {bars} bars ({args.years} years), best of {args.repeat}")
+    cases = [
+        ('legacy list/datetime', lambda: legacy_parse('BENCH', payload)),
+        ('vectorized float64', lambda: _parse_chart_history('BENCH', payload, float32=False)),
+        ('vectorized float32', lambda: _parse_chart_history('BENCH', payload, float32=True)),
+    ]
+    baseline = None
+    for name, fn in cases:
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        memory = fn().memory_usage(deep=True).sum()
+        print(f"  {name:<22} {best * 1000:8.2f} ms  {baseline / best:5.1f}x  {memory / 1024:8.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark for HTML fundamentals extraction
+Compares the old per-pattern regex extraction with the precompiled single-pass
+scanner (_scan_html_json/_scan_html_table) used by DirectYahooFinance._extract_fundamentals_from_html.
+
+Runs over saved Yahoo pages (*.html in --fixtures) when given, otherwise over
+synthetic pages shaped like the three layouts Yahoo has served: a legacy
+root.App.main store, a SvelteKit page with escaped JSON bodies, and a plain
+key-statistics table, each padded to --size-mb with unrelated markup.
+
+Usage: python benchmarks/bench_html_scan.py [--fixtures DIR] [--size-mb 0.25] [--repeat 3]
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yahoo_api_direct
+from yahoo_api_direct import DirectYahooFinance
+
+SUMMARY = {
+    'summaryDetail': {
+        'marketCap': {'raw': 3200000000000, 'fmt': '3.2T'},
+        'trailingPE': {'raw': 28.53, 'fmt': '28.53'},
+        'forwardPE': {'raw': 26.1, 'fmt': '26.10'},
+        'dividendYield': {'raw': 0.0045, 'fmt': '0.45%'},
+    },
+    'defaultKeyStatistics': {
+        'priceToBook': {'raw': 45.2, 'fmt': '45.20'},
+        'trailingEps': {'raw': 6.42, 'fmt': '6.42'},
+    },
+}
+
+STATS_ROWS = [
+    ('Market Cap (intraday)', '3.20T'),
+    ('Trailing P/E', '28.53'),
+    ('Forward P/E', '26.10'),
+    ('Price/Book (mrq)', '45.20'),
+    ('Diluted EPS (ttm)', '6.42'),
+    ('Forward Annual Dividend Yield', '0.45%'),
+]
+
+
+def filler(size_bytes):
+    """Unrelated page markup; one block in 25 is a headline with words the loose legacy patterns latch onto"""
+    plain = ('<div class="row"><a href="/quote/X" data-id="1">Some ticker</a>'
+             '<span class="num">12,345</span><script>{"id": 1}</script></div>\n')
+    headline = ('<div class="news"><a href="/news/x">Markets open as PE firms and Book '
+                'publishers report; Dividend calendar and Yield curve in focus</a></div>\n')
+    block = plain * 24 + headline
+    return block * max(1, size_bytes // len(block))
+
+
+def make_fixtures(size_mb):
+    pad = filler(int(size_mb * 1024 * 1024))
+    app_main = json.dumps({'context': {'dispatcher': {'stores': {'QuoteSummaryStore': SUMMARY}}}})
+    svelte_body = json.dumps({'quoteSummary': {'result': [SUMMARY]}})
+    svelte = json.dumps({'status': 200, 'body': svelte_body})
+    table = ''.join(
+        f'<tr><td class="label">{label}</td><td class="value">{value}</td></tr>'
+        for label, value in STATS_ROWS
+    )
+    return {
+        'root-app-main': f'<html><body>{pad}<script>root.App.main = {app_main};</script>{pad}</body></html>',
+        'sveltekit': (f'<html><body>{pad}<script type="application/json" data-sveltekit-fetched '
+                      f'data-url="https://query1.finance.yahoo.com/v10/finance/quoteSummary/X">{svelte}</script>'
+                      f'{pad}</body></html>'),
+        'statistics-table': f'<html><body>{pad}<table>{table}</table>{pad}</body></html>',
+    }
+
+
+def legacy_extract(api, html):
+    """The previous _extract_fundamentals_from_html: every pattern compiled and run over the whole page"""
+    fundamentals = {}
+    json_patterns = [
+        r'root\.App\.main\s*=\s*(\{.*?\});',
+        r'"QuoteSummaryStore":\s*(\{.*?"summaryDetail"[^}]*\})',
+        r'"defaultKeyStatistics":\s*(\{.*?\})',
+        r'"summaryDetail":\s*(\{.*?\})',
+        r'"financialData":\s*(\{.*?\})'
+    ]
+    for pattern in json_patterns:
+        for match in re.finditer(pattern, html, re.DOTALL):
+            try:
+                fundamentals.update(api._extract_from_json_recursive(json.loads(match.group(1))))
+            except ValueError:
+                continue
+    
+    text_patterns = {
+        'trailingPE': [r'P/E\s*(?:Ratio)?\s*(?:\(ttm\))?\s*</?\w*>\s*([0-9.,]+)', r'Trailing P/E.*?([0-9.,]+)',
+                       r'PE.*?([0-9.,]+)', r'pe-ratio[^>]*>([0-9.,]+)'],
+        'forwardPE': [r'Forward P/E.*?([0-9.,]+)', r'Forward PE.*?([0-9.,]+)'],
+        'priceToBook': [r'Price/Book.*?([0-9.,]+)', r'P/B.*?([0-9.,]+)', r'Book.*?([0-9.,]+)'],
+        'marketCap': [r'Market Cap.*?\$([0-9.,KMBT]+)', r'Market Capitalization.*?\$([0-9.,KMBT]+)',
+                      r'Mkt Cap.*?\$([0-9.,KMBT]+)'],
+        'dividendYield': [r'Dividend.*?Yield.*?([0-9.,]+)%', r'Yield.*?([0-9.,]+)%', r'dividend.*?([0-9.,]+)%']
+    }
+    for metric, patterns in text_patterns.items():
+        if metric in fundamentals:
+            continue
+        for pattern in patterns:
+            for match in re.findall(pattern, html, re.IGNORECASE | re.DOTALL):
+                try:
+                    value = float(match.replace(',', '').rstrip('KMBT') or 'x')
+                except ValueError:
+                    continue
+                fundamentals[metric] = value
+                break
+            if metric in fundamentals:
+                break
+    return fundamentals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixtures', help='directory of saved Yahoo quote/statistics pages (*.html)')
+    parser.add_argument('--size-mb', type=float, default=0.25)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help='only time the new scanner (the legacy patterns go quadratic on large pages)')
+    args = parser.parse_args()
+    
+    if args.fixtures:
+        pages = {}
+        for path in sorted(glob.glob(os.path.join(args.fixtures, '*.html'))):
+            with open(path, encoding='utf-8', errors='replace') as f:
+                pages[os.path.basename(path)] = f.read()
+    else:
+        pages = make_fixtures(args.size_mb)
+    
+    api = DirectYahooFinance()
+    print(f"HTML fundamentals benchmark, best of {args.repeat}")
+    for name, html in pages.items():
+        def scan():
+            # Bypass the per-page cache so every run does the full pass
+            yahoo_api_direct._scan_html_json.cache_clear()
+            yahoo_api_direct._scan_html_table.cache_clear()
+            return api._extract_fundamentals_from_html(html)
+        
+        new_time = min(timeit.repeat(scan, number=1, repeat=args.repeat))
+        line = f"  {name:<20} {len(html) / 1e6:5.1f} MB  scanner {new_time * 1000:8.1f} ms"
+        if not args.skip_legacy:
+            # One run only - the legacy patterns take seconds to minutes on a page
+            legacy_time = timeit.timeit(lambda: legacy_extract(api, html), number=1)
+            line += f"  legacy {legacy_time * 1000:9.1f} ms  {legacy_time / new_time:6.1f}x"
+        print(line)
+        print(f"    found: {scan()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Offline end-to-end benchmark against the local Yahoo stand-in server
+Starts yahoo_standin_server on a background thread, points yahoo_api_direct
+at it and times batch quotes, get_info, get_history, a full two-phase value
+screen (cold, re-scored and with looser thresholds, plus screen_stocks_async
+and the thread-pool fetch path) and the single-stock analysis, with
+reproducible latency and fault injection instead of live Yahoo.
+
+Record fixtures first (optional) by running the app or this script against
+Yahoo with YAHOO_RECORD_DIR=fixtures/, then replay them with --fixtures.
+
+Usage: python benchmarks/bench_offline_screening.py [--symbols 300] [--latency-ms 80]
+       [--jitter-ms 40] [--rate-429 0.02] [--error-rate 0.01] [--fixtures DIR]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=300, help='size of the screening universe')
+    parser.add_argument('--fixtures', help='replay responses recorded with YAHOO_RECORD_DIR')
+    parser.add_argument('--latency-ms', type=float, default=80)
+    parser.add_argument('--jitter-ms', type=float, default=40)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--rate-limit', type=float, default=200.0,
+                        help='starting requests/second per host and endpoint family for the client limiter')
+    parser.add_argument('--skip-dashboard', action='store_true', help='skip the single-stock analysis timing')
+    return parser.parse_args()
+
+
+def universe(size):
+    """Deterministic mix of US and European-looking tickers"""
+    suffixes = ['', '', '', '.L', '.PA', '.DE', '.AS', '.MI']
+    symbols = {}
+    for i in range(size):
+        symbol = f"S{i:04d}{suffixes[i % len(suffixes)]}"
+        symbols[symbol] = f"Synthetic {i}"
+    return symbols
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34} {elapsed * 1000:10.1f} ms")
+    return result
+
+
+def main():
+    args = parse_args()
+    
+    # Settings read at import time: no on-disk cache, market store or job
+    # checkpoints (every run hits the server) and a limiter sized for
+    # localhost rather than for Yahoo
+    os.environ['YAHOO_RESPONSE_CACHE'] = '0'
+    os.environ['YAHOO_MARKET_STORE'] = '0'
+    os.environ['YAHOO_SCREEN_JOBS'] = '0'
+    os.environ.setdefault('YAHOO_RATE_LIMIT_INITIAL', str(args.rate_limit))
+    os.environ.setdefault('YAHOO_RATE_LIMIT_MAX', str(max(args.rate_limit, 20.0)))
+    os.environ.setdefault('YAHOO_RATE_LIMIT_BURST', str(args.rate_limit))
+    
+    import yahoo_api_direct
+    from yahoo_standin_server import start_standin_server
+    
+    server, base = start_standin_server(
+        fixtures_dir=args.fixtures, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, rate_429=args.rate_429, seed=args.seed
+    )
+    yahoo_api_direct.configure_api_base(base)
+    symbols = universe(args.symbols)
+    names = list(symbols)
+    print(f"Offline benchmark against {base}: {len(names)} symbols, "
+          f"latency {args.latency_ms}±{args.jitter_ms} ms, 429 rate {args.rate_429}, error rate {args.error_rate}")
+    
+    try:
+        api = yahoo_api_direct.DirectYahooFinance()
+        print("API client")
+        timed('get_quotes (batched)', lambda: api.get_quotes(names))
+        timed('get_info x20 (hedged)', lambda: [api.get_info(s) for s in names[:20]])
+        timed('get_history 2y x20 (cold)', lambda: [api.get_history(s, '2y') for s in names[:20]])
+        timed('get_history 2y x20 (store)', lambda: [api.get_history(s, '2y') for s in names[:20]])
+        timed('get_statements x20', lambda: [api.get_statements(s) for s in names[:20]])
+        
+        import stock_value_dashboard as dashboard
+        analyzer = dashboard.ValueInvestmentAnalyzer()
+        screening_params = {
+            'type': 'value',
+            'params': {
+                'min_market_cap_millions': 100,
+                'max_market_cap_billions': 5000,
+                'max_pe_ratio': 20.0,
+                'max_pb_ratio': 2.0,
+                'min_roe_percent': 10.0,
+                'max_debt_equity_percent': 100.0,
+                'min_current_ratio': 1.0,
+                'min_fcf_yield_percent': 2.0
+            }
+        }
+        print("Screening")
+        timed('screen_universe (cold snapshot)', lambda: analyzer.screen_universe(symbols, screening_params, refresh=True))
+        print(f"    {analyzer.format_screen_report(analyzer.last_screen_report)}")
+        timed('screen_universe (re-score)', lambda: analyzer.screen_universe(symbols, screening_params))
+        looser = {'type': 'value', 'params': dict(screening_params['params'], max_pe_ratio=40.0, max_pb_ratio=4.0)}
+        timed('screen_universe (looser P/E, P/B)', lambda: analyzer.screen_universe(symbols, looser))
+        print(f"    {analyzer.format_screen_report(analyzer.last_screen_report)}")
+        if yahoo_api_direct.AIOHTTP_AVAILABLE:
+            timed('screen_stocks_async (cold snapshot)',
+                  lambda: asyncio.run(analyzer.screen_stocks_async(symbols, screening_params, refresh=True)))
+        timed('info fetch (threads)', lambda: analyzer._fetch_infos_parallel(names, refresh=True))
+        
+        if not args.skip_dashboard:
+            print("Dashboard analysis")
+            timed('fetch_stock_data', lambda: analyzer.fetch_stock_data(names[0]))
+            timed('calculate_financial_ratios', analyzer.calculate_financial_ratios)
+            timed('calculate_intrinsic_value_detailed', analyzer.calculate_intrinsic_value_detailed)
+        
+        print("Counters")
+        print(f"  server        {server.config.counters}")
+        print(f"  single-flight {yahoo_api_direct.single_flight_stats()}")
+        print(f"  limiters      {yahoo_api_direct.rate_limiter_stats()}")
+        print(f"  hedging       {yahoo_api_direct.info_hedge_stats()}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
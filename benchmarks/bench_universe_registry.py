@@ -0,0 +1,119 @@
+"""
+Benchmark for the data-file-backed universe registry at 5,000+ symbols
+Writes a synthetic registry (one CSV shard per market, with duplicate rows
+and retired symbols mixed in) to a temporary directory, then times loading
+it, index selections and splitting it into fetch shards. With --fetch it
+also acquires the data snapshot shard by shard from the local stand-in
+server, as the dashboard does for universes over SCREEN_SHARD_SIZE.
+
+Usage: python benchmarks/bench_universe_registry.py [--symbols 6000] [--shard-size 500] [--fetch]
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from universe_registry import CAP_BUCKETS, EXCHANGE_SUFFIXES, UniverseRegistry
+
+SECTORS = ('Technology', 'Healthcare', 'Financial Services', 'Consumer Cyclical', 'Consumer Defensive', 'Energy',
+           'Industrials', 'Basic Materials', 'Communication Services', 'Utilities', 'Real Estate')
+VALUE_SCREEN = {'type': 'value', 'params': {
+    'min_market_cap_millions': 100, 'max_market_cap_billions': 5000, 'max_pe_ratio': 20.0, 'max_pb_ratio': 2.0,
+    'min_roe_percent': 10.0, 'max_debt_equity_percent': 100.0, 'min_current_ratio': 1.0, 'min_fcf_yield_percent': 2.0
+}}
+
+
+def write_registry(directory, size, seed=0):
+    """size distinct symbols spread over one shard per exchange suffix, plus 1% duplicate rows and 20 retired"""
+    rng = random.Random(seed)
+    suffixes = list(EXCHANGE_SUFFIXES)
+    shards = {suffix: [] for suffix in suffixes}
+    for i in range(size):
+        suffix = suffixes[i % len(suffixes)]
+        shards[suffix].append({
+            'symbol': f"R{i:05d}{suffix}", 'name': f"Registry Co {i}", 'cap': rng.choice(CAP_BUCKETS),
+            'sector': rng.choice(SECTORS), 'lists': 'core' if i % 10 == 0 else 'broad'
+        })
+    for suffix, rows in shards.items():
+        rows.extend(rng.sample(rows, max(1, len(rows) // 100)))  # Duplicates the loader must drop
+        name = EXCHANGE_SUFFIXES[suffix][0].lower().replace(' ', '-')
+        with open(os.path.join(directory, f"{name}.csv"), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['symbol', 'name', 'cap', 'sector', 'lists'], lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(rows)
+    with open(os.path.join(directory, 'retired.csv'), 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['symbol', 'replacement', 'reason'])
+        for i in range(0, 20 * len(suffixes), len(suffixes)):
+            writer.writerow([f"R{i:05d}", '', 'synthetic delisting'])
+
+
+def timed(label, fn, repeat=1):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<44} {best * 1000:9.2f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=6000)
+    parser.add_argument('--shard-size', type=int, default=500)
+    parser.add_argument('--fetch', action='store_true', help='acquire the snapshot shard by shard from the stand-in')
+    parser.add_argument('--latency-ms', type=float, default=20)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        write_registry(directory, args.symbols)
+        print(f"Registry of {args.symbols} symbols in {len(EXCHANGE_SUFFIXES)} shard files")
+        registry = timed('load + de-duplicate + index', lambda: UniverseRegistry.from_directory(directory), repeat=3)
+        print(f"  {len(registry)} symbols kept, {len(registry.duplicates)} duplicate rows "
+              f"and {len(registry.retired)} retired symbols dropped")
+        
+        everything = timed('select all', registry.select, repeat=10)
+        europe = timed('select region=Europe', lambda: registry.select(region='Europe'), repeat=10)
+        tech = timed('select sector=Technology, cap=large', lambda: registry.select(sector='Technology', cap='large'),
+                     repeat=10)
+        timed('select suffix=.PA, list=core', lambda: registry.select(suffix='.PA', list_name='core'), repeat=10)
+        shards = timed(f'split into shards of <= {args.shard_size}', lambda: registry.split(everything, args.shard_size),
+                       repeat=10)
+        print(f"  {len(europe)} European, {len(tech)} large-cap technology; "
+              f"{len(shards)} shards of {min(map(len, shards))}-{max(map(len, shards))} symbols")
+        
+        if not args.fetch:
+            return
+        
+        # Settings read at import time: nothing from disk, a localhost-sized limiter
+        os.environ.update({
+            'YAHOO_RESPONSE_CACHE': '0', 'YAHOO_MARKET_STORE': '0', 'YAHOO_SCREEN_JOBS': '0',
+            'YAHOO_UNIVERSE_DIR': directory, 'YAHOO_SCREEN_SHARD_SIZE': str(args.shard_size),
+            'YAHOO_RATE_LIMIT_INITIAL': '2000', 'YAHOO_RATE_LIMIT_BURST': '2000', 'YAHOO_RATE_LIMIT_MAX': '2000'
+        })
+        import yahoo_api_direct
+        from stock_value_dashboard import ValueInvestmentAnalyzer
+        from yahoo_standin_server import start_standin_server
+        
+        server, base_url = start_standin_server(latency_ms=args.latency_ms)
+        yahoo_api_direct.configure_api_base(base_url)
+        try:
+            analyzer = ValueInvestmentAnalyzer()
+            snapshot = timed(f'snapshot of {len(everything)} symbols, by shard',
+                             lambda: analyzer.get_screening_snapshot(everything))
+            print(f"  {snapshot.covered()}/{len(snapshot)} symbols with data, "
+                  f"{server.config.counters['requests']} requests")
+            timed('re-screen from the snapshot', lambda: analyzer.screen_universe(everything, VALUE_SCREEN))
+        finally:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Micro-benchmark for the vectorized screening scorers
+Builds a UniverseSnapshot from the stand-in server's synthetic fundamentals
+and scores it with universe_snapshot.score_snapshot and with the per-symbol
+calculate_*_score_configurable ladders, checking the scores are identical.
+
+Usage: python benchmarks/bench_vectorized_scoring.py [--symbols 5000] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from universe_snapshot import SNAPSHOT_FIELDS, UniverseSnapshot, score_snapshot
+from yahoo_standin_server import company_profile
+
+SCREENS = {
+    'value': {
+        'min_market_cap_millions': 100, 'max_market_cap_billions': 5000, 'max_pe_ratio': 20.0,
+        'max_pb_ratio': 2.0, 'min_roe_percent': 10.0, 'max_debt_equity_percent': 100.0,
+        'min_current_ratio': 1.0, 'min_fcf_yield_percent': 2.0
+    },
+    'growth': {
+        'min_market_cap_millions': 100, 'max_market_cap_billions': 5000, 'min_revenue_growth_percent': 10.0,
+        'min_earnings_growth_percent': 15.0, 'min_roe_percent': 15.0, 'min_operating_margin_percent': 10.0,
+        'max_peg_ratio': 2.0, 'max_ps_ratio': 10.0
+    },
+    'valuegrowth': {
+        'min_market_cap_millions': 100, 'max_market_cap_billions': 5000, 'max_pe_ratio': 20.0,
+        'max_pb_ratio': 3.0, 'max_debt_equity_percent': 100.0, 'min_revenue_growth_percent': 10.0,
+        'min_earnings_growth_percent': 10.0, 'max_peg_ratio': 2.0, 'min_roe_percent': 10.0,
+        'min_operating_margin_percent': 10.0, 'min_current_ratio': 1.0, 'max_ps_ratio': 10.0,
+        'min_fcf_yield_percent': 2.0, 'min_gross_margin_percent': 20.0
+    }
+}
+
+
+def synthetic_infos(size):
+    """Info dicts shaped like get_info's, from the stand-in's deterministic profiles"""
+    universe = {f"S{i:05d}": f"Synthetic {i}" for i in range(size)}
+    infos = {}
+    for symbol in universe:
+        profile = company_profile(symbol)
+        info = {field: profile.get(field) for field in SNAPSHOT_FIELDS}
+        info['currentPrice'] = profile['price']
+        infos[symbol] = info
+    return universe, infos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    
+    os.environ.setdefault('YAHOO_RESPONSE_CACHE', '0')
+    from stock_value_dashboard import ValueInvestmentAnalyzer
+    
+    universe, infos = synthetic_infos(args.symbols)
+    start = timeit.default_timer()
+    snapshot = UniverseSnapshot.from_infos(universe, infos)
+    print(f"{args.symbols} symbols, snapshot built in {(timeit.default_timer() - start) * 1000:.1f} ms")
+    
+    analyzer = ValueInvestmentAnalyzer()
+    
+    def scalar_scores(screening_params):
+        scores = []
+        for symbol, company_name in universe.items():
+            analyzer.stock_info = infos[symbol]
+            row = analyzer.score_stock_for_screening(symbol, company_name, screening_params)
+            scores.append(np.nan if row is None else row['total_score'])
+        return np.array(scores, dtype=np.float64)
+    
+    for screening_type, params in SCREENS.items():
+        screening_params = {'type': screening_type, 'params': params}
+        identical = np.array_equal(score_snapshot(snapshot, screening_params), scalar_scores(screening_params),
+                                   equal_nan=True)
+        vectorized = min(timeit.repeat(lambda: score_snapshot(snapshot, screening_params),
+                                       number=1, repeat=args.repeat))
+        scalar = min(timeit.repeat(lambda: scalar_scores(screening_params), number=1, repeat=max(1, args.repeat // 10)))
+        print(f"  {screening_type:<12} vectorized {vectorized * 1000:8.2f} ms   scalar {scalar * 1000:8.1f} ms   "
+              f"speedup {scalar / vectorized:5.1f}x   identical={identical}")
+
+
+if __name__ == '__main__':
+    main()
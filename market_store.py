@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Persistent local market-data store: daily OHLCV bars, info snapshots and statements
+One SQLite file whose tables are keyed by symbol first (WITHOUT ROWID), so
+each symbol's rows sit together on disk and a symbol is read, replaced or
+dropped as one partition. Every write is a single transaction, the schema
+version lives in PRAGMA user_version, and `python market_store.py compact`
+prunes old data and vacuums the file.
+
+Usage: python market_store.py [stats | compact [--max-age-days 30] [--history-years 20]] [--path FILE]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+MARKET_STORE_ENABLED = os.environ.get('YAHOO_MARKET_STORE', '1') == '1'
+MARKET_STORE_PATH = os.environ.get(
+    'YAHOO_MARKET_STORE_PATH',
+    os.path.join(os.environ.get('YAHOO_RESPONSE_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'valueboard')),
+                 'market_store.sqlite3')
+)
+MARKET_STORE_MAX_STALE = float(os.environ.get('YAHOO_MARKET_STORE_MAX_STALE_SECONDS', 7 * 24 * 60 * 60))
+MARKET_STORE_SCHEMA_VERSION = 1
+
+HISTORY_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+_SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS history (
+        symbol TEXT NOT NULL,
+        day INTEGER NOT NULL,
+        ts INTEGER NOT NULL,
+        open REAL, high REAL, low REAL, close REAL, volume REAL,
+        PRIMARY KEY (symbol, day)
+    ) WITHOUT ROWID''',
+    '''CREATE TABLE IF NOT EXISTS history_meta (
+        symbol TEXT PRIMARY KEY,
+        start INTEGER NOT NULL,
+        last_event INTEGER NOT NULL,
+        checked_at REAL NOT NULL
+    ) WITHOUT ROWID''',
+    '''CREATE TABLE IF NOT EXISTS info (
+        symbol TEXT PRIMARY KEY,
+        body BLOB NOT NULL,
+        fetched_at REAL NOT NULL
+    ) WITHOUT ROWID''',
+    '''CREATE TABLE IF NOT EXISTS statements (
+        symbol TEXT PRIMARY KEY,
+        body BLOB NOT NULL,
+        fetched_at REAL NOT NULL
+    ) WITHOUT ROWID''',
+)
+
+# user_version -> statements that bring the file to user_version + 1
+_MIGRATIONS = {}
+
+def _pack(value):
+    return zlib.compress(json.dumps(value, separators=(',', ':'), default=str).encode('utf-8'))
+
+def _unpack(body):
+    try:
+        return json.loads(zlib.decompress(body))
+    except (zlib.error, ValueError):
+        return None
+
+class MarketStore:
+    """Symbol-partitioned SQLite store for bars, info snapshots and raw statement responses"""
+    
+    def __init__(self, path, max_stale=MARKET_STORE_MAX_STALE):
+        self.path = path
+        self.max_stale = max_stale
+        self.lock = threading.Lock()
+        self.reads = 0
+        self.read_hits = 0
+        self.writes = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self._migrate()
+    
+    def _migrate(self):
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        if version > MARKET_STORE_SCHEMA_VERSION:
+            raise sqlite3.DatabaseError(
+                f"{self.path} has schema version {version}, newer than {MARKET_STORE_SCHEMA_VERSION}"
+            )
+        
+        with self._transaction():
+            if version == 0:
+                for statement in _SCHEMA:
+                    self.connection.execute(statement)
+            else:
+                while version < MARKET_STORE_SCHEMA_VERSION:
+                    for statement in _MIGRATIONS[version]:
+                        self.connection.execute(statement)
+                    version += 1
+            self.connection.execute(f'PRAGMA user_version = {MARKET_STORE_SCHEMA_VERSION}')
+    
+    @contextmanager
+    def _transaction(self):
+        """All-or-nothing write: readers see the old rows or the new ones, never a mix"""
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                raise
+            self.connection.execute('COMMIT')
+            self.writes += 1
+    
+    def _read(self, sql, args):
+        with self.lock:
+            self.reads += 1
+            rows = self.connection.execute(sql, args).fetchall()
+            if rows:
+                self.read_hits += 1
+        return rows
+    
+    # Daily bars
+    
+    def get_history(self, symbol):
+        """(bars, meta) as HistoryStore keeps them, or None when the symbol isn't stored"""
+        symbol = symbol.upper()
+        meta = self._read('SELECT start, last_event, checked_at FROM history_meta WHERE symbol = ?', (symbol,))
+        if not meta:
+            return None
+        rows = self._read(
+            'SELECT ts, open, high, low, close, volume FROM history WHERE symbol = ? ORDER BY day', (symbol,)
+        )
+        if not rows:
+            return None
+        
+        values = np.array(rows, dtype=np.float64)
+        bars = pd.DataFrame(
+            {column: values[:, i + 1] for i, column in enumerate(HISTORY_COLUMNS)},
+            index=pd.DatetimeIndex(values[:, 0].astype(np.int64).astype('datetime64[s]'), name='Date')
+        )
+        start, last_event, checked_at = meta[0]
+        return bars, {'start': start, 'last_event': last_event, 'checked_at': checked_at}
+    
+    def put_history(self, symbol, bars, start, last_event, checked_at, replace=True):
+        """Store bars for a symbol; replace=False upserts them over what is stored, day by day"""
+        symbol = symbol.upper()
+        timestamps = bars.index.to_numpy(dtype='datetime64[s]').astype(np.int64)
+        prices = bars[list(HISTORY_COLUMNS)].to_numpy(dtype=np.float64)
+        rows = [
+            (symbol, int(ts) // 86400, int(ts), *[None if np.isnan(value) else float(value) for value in row])
+            for ts, row in zip(timestamps, prices)
+        ]
+        with self._transaction() as connection:
+            if replace:
+                connection.execute('DELETE FROM history WHERE symbol = ?', (symbol,))
+            connection.executemany(
+                'INSERT OR REPLACE INTO history (symbol, day, ts, open, high, low, close, volume) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows
+            )
+            connection.execute(
+                'INSERT OR REPLACE INTO history_meta (symbol, start, last_event, checked_at) VALUES (?, ?, ?, ?)',
+                (symbol, int(start), int(last_event), checked_at)
+            )
+    
+    def delete_history(self, symbol):
+        symbol = symbol.upper()
+        with self._transaction() as connection:
+            connection.execute('DELETE FROM history WHERE symbol = ?', (symbol,))
+            connection.execute('DELETE FROM history_meta WHERE symbol = ?', (symbol,))
+    
+    # Info snapshots and statement responses
+    
+    def _get_blob(self, table, symbol, max_age):
+        rows = self._read(f'SELECT body, fetched_at FROM {table} WHERE symbol = ?', (symbol.upper(),))
+        if not rows:
+            return None
+        body, fetched_at = rows[0]
+        limit = self.max_stale if max_age is None else max_age
+        if time.time() - fetched_at >= limit:
+            return None
+        return _unpack(body)
+    
+    def _put_blob(self, table, symbol, value, fetched_at=None):
+        with self._transaction() as connection:
+            # Never replace a newer snapshot with an older one
+            connection.execute(
+                f'INSERT INTO {table} (symbol, body, fetched_at) VALUES (?, ?, ?) '
+                f'ON CONFLICT (symbol) DO UPDATE SET body = excluded.body, fetched_at = excluded.fetched_at '
+                f'WHERE excluded.fetched_at >= {table}.fetched_at',
+                (symbol.upper(), _pack(value), fetched_at or time.time())
+            )
+    
+    def get_info(self, symbol, max_age=None):
+        """Info dict stored within max_age seconds (max_stale when None), or None"""
+        return self._get_blob('info', symbol, max_age)
+    
+    def put_info(self, symbol, info, fetched_at=None):
+        """Store an info snapshot; fetched_at backdates it (e.g. data demoted from memory)"""
+        self._put_blob('info', symbol, info, fetched_at)
+    
+    def get_statements(self, symbol, max_age=None):
+        """Raw fundamentals time-series response stored within max_age seconds, or None"""
+        return self._get_blob('statements', symbol, max_age)
+    
+    def put_statements(self, symbol, data):
+        self._put_blob('statements', symbol, data)
+    
+    # Maintenance
+    
+    def _file_bytes(self):
+        # The write-ahead log holds recent writes until a checkpoint
+        return sum(os.path.getsize(path) for path in (self.path, self.path + '-wal') if os.path.exists(path))
+    
+    def compact(self, max_age_days=None, history_years=20):
+        """Drop snapshots older than max_age_days and bars older than history_years, then VACUUM"""
+        now = time.time()
+        max_age = self.max_stale if max_age_days is None else max_age_days * 86400
+        oldest_day = int(now // 86400) - int(history_years * 366)
+        
+        with self._transaction() as connection:
+            removed = {
+                'info': connection.execute('DELETE FROM info WHERE fetched_at < ?', (now - max_age,)).rowcount,
+                'statements': connection.execute(
+                    'DELETE FROM statements WHERE fetched_at < ?', (now - max_age,)
+                ).rowcount,
+                'bars': connection.execute('DELETE FROM history WHERE day < ?', (oldest_day,)).rowcount,
+            }
+            connection.execute(
+                'DELETE FROM history_meta WHERE symbol NOT IN (SELECT DISTINCT symbol FROM history)'
+            )
+        
+        size_before = self._file_bytes()
+        with self.lock:
+            self.connection.execute('VACUUM')
+            self.connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        removed['bytes_reclaimed'] = size_before - self._file_bytes()
+        return removed
+    
+    def clear(self):
+        with self._transaction() as connection:
+            for table in ('history', 'history_meta', 'info', 'statements'):
+                connection.execute(f'DELETE FROM {table}')
+    
+    def stats(self):
+        with self.lock:
+            counts = {
+                table: self.connection.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                for table in ('history_meta', 'history', 'info', 'statements')
+            }
+            return {
+                'path': self.path,
+                'schema_version': MARKET_STORE_SCHEMA_VERSION,
+                'bytes': self._file_bytes(),
+                'history_symbols': counts['history_meta'],
+                'bars': counts['history'],
+                'info_snapshots': counts['info'],
+                'statements': counts['statements'],
+                'reads': self.reads,
+                'read_hits': self.read_hits,
+                'writes': self.writes
+            }
+
+# Data fetched from another API host (configure_api_base, e.g. a yahoo_standin_server)
+# must never be served as Yahoo's, so each host gets its own files
+_store_namespace = os.environ.get('YAHOO_API_BASE', '').rstrip('/')
+
+def configure_store_namespace(namespace):
+    """Keep persistent data for another API base apart from Yahoo's; '' or None is Yahoo itself"""
+    global _store_namespace
+    _store_namespace = (namespace or '').rstrip('/')
+
+def namespaced_path(path):
+    """path as is for Yahoo, else with a hash of the API base before the extension"""
+    if not _store_namespace:
+        return path
+    root, extension = os.path.splitext(path)
+    return f"{root}-{hashlib.sha1(_store_namespace.encode('utf-8')).hexdigest()[:12]}{extension}"
+
+_market_stores = {}
+_market_store_lock = threading.Lock()
+_market_store_failed = set()
+
+def get_market_store():
+    """MarketStore for the current API base, or None when disabled or the store file isn't usable"""
+    if not MARKET_STORE_ENABLED:
+        return None
+    path = namespaced_path(MARKET_STORE_PATH)
+    store = _market_stores.get(path)
+    if store is None and path not in _market_store_failed:
+        with _market_store_lock:
+            store = _market_stores.get(path)
+            if store is None and path not in _market_store_failed:
+                try:
+                    store = _market_stores[path] = MarketStore(path)
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Market data store disabled: {e}")
+                    _market_store_failed.add(path)
+    return store
+
+def market_store_stats():
+    store = get_market_store()
+    return store.stats() if store is not None else {}
+
+def main():
+    parser = argparse.ArgumentParser(description='Maintain the local market-data store')
+    parser.add_argument('command', choices=('stats', 'compact'), nargs='?', default='stats')
+    parser.add_argument('--path', default=MARKET_STORE_PATH)
+    parser.add_argument('--max-age-days', type=float, help='drop info/statement snapshots older than this')
+    parser.add_argument('--history-years', type=float, default=20, help='drop bars older than this')
+    args = parser.parse_args()
+    
+    store = MarketStore(args.path)
+    if args.command == 'compact':
+        print(f"Compacted {args.path}: {store.compact(args.max_age_days, args.history_years)}")
+    print(json.dumps(store.stats(), indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+On-disk cache for Yahoo Finance API responses
+Keyed by normalized URL+params, with a TTL class per endpoint, stale reads
+when Yahoo is failing and a disk budget enforced by LRU eviction
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, parse_qsl
+
+try:
+    from zoneinfo import ZoneInfo
+    ZONEINFO_AVAILABLE = True
+except ImportError:
+    ZONEINFO_AVAILABLE = False
+
+RESPONSE_CACHE_ENABLED = os.environ.get('YAHOO_RESPONSE_CACHE', '1') == '1'
+RESPONSE_CACHE_DIR = os.environ.get(
+    'YAHOO_RESPONSE_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'valueboard')
+)
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get('YAHOO_RESPONSE_CACHE_MAX_MB', 256)) * 1024 * 1024
+RESPONSE_CACHE_MAX_STALE = float(os.environ.get('YAHOO_RESPONSE_CACHE_MAX_STALE_SECONDS', 7 * 24 * 60 * 60))
+
+# TTL classes (seconds); daily chart data lives until the next session close instead
+TTL_QUOTE = 60
+TTL_FUNDAMENTALS = 24 * 60 * 60
+TTL_SEARCH = 7 * 24 * 60 * 60
+
+# Exchange suffix -> (timezone, close hour, close minute); anything else closes with New York
+SESSION_CLOSES = {
+    '': ('America/New_York', 16, 0),
+    '.TO': ('America/Toronto', 16, 0),
+    '.L': ('Europe/London', 16, 30),
+    '.PA': ('Europe/Paris', 17, 30),
+    '.AS': ('Europe/Amsterdam', 17, 30),
+    '.BR': ('Europe/Brussels', 17, 30),
+    '.DE': ('Europe/Berlin', 17, 30),
+    '.F': ('Europe/Berlin', 17, 30),
+    '.MI': ('Europe/Rome', 17, 30),
+    '.MC': ('Europe/Madrid', 17, 30),
+    '.SW': ('Europe/Zurich', 17, 30),
+    '.ST': ('Europe/Stockholm', 17, 30),
+    '.CO': ('Europe/Copenhagen', 17, 0),
+    '.OL': ('Europe/Oslo', 16, 20),
+    '.HE': ('Europe/Helsinki', 18, 30),
+    '.T': ('Asia/Tokyo', 15, 0),
+    '.HK': ('Asia/Hong_Kong', 16, 0),
+    '.AX': ('Australia/Sydney', 16, 0),
+}
+
+# Params that only change the response by less than a day of bars
+_DAY_ROUNDED_PARAMS = ('period1', 'period2')
+
+def normalize_request(url, params=None):
+    """(scheme://host/path, sorted params) with any query string folded into the params"""
+    parts = urlsplit(url)
+    merged = dict(parse_qsl(parts.query, keep_blank_values=True))
+    merged.update({str(key): str(value) for key, value in (params or {}).items()})
+    base = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    return base, sorted(merged.items())
+
+def cache_key(url, params=None):
+    """Normalized URL+params key; chart/time-series windows are rounded to the day"""
+    base, items = normalize_request(url, params)
+    normalized = []
+    for key, value in items:
+        if key in _DAY_ROUNDED_PARAMS and value.isdigit():
+            value = str(int(value) // 86400 * 86400)
+        normalized.append(f"{key}={value}")
+    return base + '?' + '&'.join(normalized)
+
+def _symbol_from_path(path):
+    return path.rstrip('/').rsplit('/', 1)[-1]
+
+def seconds_until_session_close(symbol, now=None):
+    """Seconds until the next regular-session close of the symbol's exchange (weekdays only)"""
+    now = now or time.time()
+    suffix = '.' + symbol.rsplit('.', 1)[1].upper() if '.' in symbol else ''
+    tz_name, hour, minute = SESSION_CLOSES.get(suffix, SESSION_CLOSES[''])
+    
+    if not ZONEINFO_AVAILABLE:
+        return TTL_QUOTE * 60  # An hour - better than guessing at timezones
+    
+    local_now = datetime.fromtimestamp(now, ZoneInfo(tz_name))
+    close = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if close <= local_now:
+        close += timedelta(days=1)
+    while close.weekday() >= 5:
+        close += timedelta(days=1)
+    return max((close - local_now).total_seconds(), TTL_QUOTE)
+
+def ttl_for(url, params=None, now=None):
+    """Seconds a response stays fresh, or None if the endpoint shouldn't be cached"""
+    parts = urlsplit(url)
+    path = parts.path
+    query = dict(normalize_request(url, params)[1])
+    
+    if '/finance/chart/' in path:
+        if query.get('range') == '1d' and 'period1' not in query:
+            return TTL_QUOTE  # The chart endpoint used as a quote
+        if query.get('interval', '1d') not in ('1d', '1wk', '1mo'):
+            return TTL_QUOTE  # Intraday bars move all session
+        return seconds_until_session_close(_symbol_from_path(path), now)
+    if '/v7/finance/' in path:
+        return TTL_QUOTE
+    if '/finance/quoteSummary/' in path or '/fundamentals-timeseries/' in path:
+        return TTL_FUNDAMENTALS
+    if '/finance/search' in path:
+        return TTL_SEARCH
+    return None
+
+class ResponseCache:
+    """SQLite file of compressed JSON responses with expiry and LRU eviction
+    
+    get() returns only fresh entries unless allow_stale=True, which is how
+    callers fall back to old data when Yahoo fails. Size is tracked as the
+    compressed bytes stored; once it passes max_bytes the least recently
+    used entries are dropped down to 90% of the budget.
+    """
+    
+    ACCESS_TOUCH_INTERVAL = 60  # Don't rewrite last_access on every read
+    
+    def __init__(self, path, max_bytes=RESPONSE_CACHE_MAX_BYTES, max_stale=RESPONSE_CACHE_MAX_STALE):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_stale = max_stale
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)')
+        self.total_bytes = self.connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+    
+    def get(self, url, params=None, allow_stale=False):
+        """Cached JSON for the request, or None"""
+        key = cache_key(url, params)
+        now = time.time()
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT body, expires_at, last_access FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            
+            body, expires_at, last_access = row
+            fresh = now < expires_at
+            if not fresh and not (allow_stale and now < expires_at + self.max_stale):
+                self.misses += 1
+                return None
+            
+            if now - last_access > self.ACCESS_TOUCH_INTERVAL:
+                self.connection.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+        
+        try:
+            return json.loads(zlib.decompress(body))
+        except (zlib.error, ValueError):
+            return None
+    
+    def put(self, url, params, value, ttl=None):
+        """Store a response; does nothing for endpoints without a TTL class"""
+        if ttl is None:
+            ttl = ttl_for(url, params)
+        if ttl is None or value is None:
+            return
+        
+        key = cache_key(url, params)
+        body = zlib.compress(json.dumps(value, separators=(',', ':')).encode('utf-8'))
+        now = time.time()
+        with self.lock:
+            previous = self.connection.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self.connection.execute(
+                'INSERT OR REPLACE INTO responses (key, body, size, stored_at, expires_at, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, body, len(body), now, now + ttl, now)
+            )
+            self.total_bytes += len(body) - (previous[0] if previous else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict(int(self.max_bytes * 0.9))
+    
+    def _evict(self, target_bytes):
+        # Least recently used first, in batches
+        while self.total_bytes > target_bytes:
+            rows = self.connection.execute(
+                'SELECT key, size FROM responses ORDER BY last_access LIMIT 256'
+            ).fetchall()
+            if not rows:
+                self.total_bytes = 0
+                break
+            for key, size in rows:
+                self.connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self.total_bytes -= size
+                self.evictions += 1
+                if self.total_bytes <= target_bytes:
+                    break
+    
+    def clear(self):
+        with self.lock:
+            self.connection.execute('DELETE FROM responses')
+            self.total_bytes = 0
+    
+    def stats(self):
+        with self.lock:
+            entries = self.connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            return {
+                'entries': entries,
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+_response_cache_failed = False
+
+def get_response_cache():
+    """Process-wide ResponseCache, or None when disabled or the cache dir isn't usable"""
+    global _response_cache, _response_cache_failed
+    if not RESPONSE_CACHE_ENABLED or _response_cache_failed:
+        return None
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None and not _response_cache_failed:
+                try:
+                    _response_cache = ResponseCache(os.path.join(RESPONSE_CACHE_DIR, 'responses.sqlite3'))
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Response cache disabled: {e}")
+                    _response_cache_failed = True
+    return _response_cache
+
+def response_cache_stats():
+    cache = get_response_cache()
+    return cache.stats() if cache is not None else {}
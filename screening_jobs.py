@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Checkpointed, resumable screening jobs
+A job acquires the data snapshot for one screening universe on a background
+thread and checkpoints every symbol's info to a local SQLite file as it
+settles. The job outlives the session that started it: a reconnecting
+browser or another session attaches to it, and after a restart the next
+screen of that universe resumes it, fetching only symbols without a
+checkpoint newer than SCREEN_JOB_TTL.
+
+Usage: python screening_jobs.py [list | prune [--max-age-days 7]] [--path FILE]
+"""
+
+import argparse
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from contextlib import contextmanager
+
+from market_store import namespaced_path
+from universe_snapshot import SNAPSHOT_TTL, universe_key
+
+SCREEN_JOBS_ENABLED = os.environ.get('YAHOO_SCREEN_JOBS', '1') == '1'
+SCREEN_JOBS_PATH = os.environ.get(
+    'YAHOO_SCREEN_JOBS_PATH',
+    os.path.join(os.environ.get('YAHOO_RESPONSE_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'valueboard')),
+                 'screen_jobs.sqlite3')
+)
+SCREEN_JOB_TTL = float(os.environ.get('YAHOO_SCREEN_JOB_TTL_SECONDS', SNAPSHOT_TTL))
+SCREEN_JOB_STALE = 60  # Seconds without a checkpoint before a job not running here counts as interrupted
+SCREEN_JOB_SCHEMA_VERSION = 1
+
+_SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS jobs (
+        job_id TEXT PRIMARY KEY,
+        universe_key TEXT NOT NULL,
+        universe BLOB NOT NULL,
+        total INTEGER NOT NULL,
+        refresh INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL
+    ) WITHOUT ROWID''',
+    'CREATE INDEX IF NOT EXISTS jobs_by_universe ON jobs (universe_key, status, created_at)',
+    '''CREATE TABLE IF NOT EXISTS checkpoints (
+        job_id TEXT NOT NULL,
+        symbol TEXT NOT NULL,
+        info BLOB,
+        finished_at REAL NOT NULL,
+        PRIMARY KEY (job_id, symbol)
+    ) WITHOUT ROWID''',
+    'CREATE INDEX IF NOT EXISTS checkpoints_by_age ON checkpoints (finished_at)',
+)
+
+def _pack(value):
+    return zlib.compress(json.dumps(value, separators=(',', ':'), default=str).encode('utf-8'))
+
+def _unpack(body):
+    try:
+        return json.loads(zlib.decompress(body))
+    except (zlib.error, ValueError):
+        return None
+
+class JobStore:
+    """SQLite file of screening jobs and their per-symbol checkpoints
+    
+    A checkpoint holds the symbol's info dict, or NULL when no data could be
+    fetched; writing one also stamps the job's updated_at, which is how an
+    interrupted job is told from one still running in another process.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self._migrate()
+    
+    def _migrate(self):
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        if version > SCREEN_JOB_SCHEMA_VERSION:
+            raise sqlite3.DatabaseError(
+                f"{self.path} has schema version {version}, newer than {SCREEN_JOB_SCHEMA_VERSION}"
+            )
+        with self._transaction():
+            for statement in _SCHEMA:
+                self.connection.execute(statement)
+            self.connection.execute(f'PRAGMA user_version = {SCREEN_JOB_SCHEMA_VERSION}')
+    
+    @contextmanager
+    def _transaction(self):
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                raise
+            self.connection.execute('COMMIT')
+    
+    def _read(self, sql, args=()):
+        with self.lock:
+            return self.connection.execute(sql, args).fetchall()
+    
+    # Jobs
+    
+    def create_job(self, stock_universe, refresh=False):
+        job_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                'INSERT INTO jobs (job_id, universe_key, universe, total, refresh, status, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (job_id, universe_key(stock_universe), _pack(dict(stock_universe)), len(stock_universe),
+                 int(refresh), 'running', now, now)
+            )
+        return job_id
+    
+    def _job(self, row, with_universe=False):
+        job_id, key, universe, total, refresh, status, created_at, updated_at = row
+        checkpointed, failed = self._read(
+            'SELECT COUNT(*), COUNT(*) - COUNT(info) FROM checkpoints WHERE job_id = ?', (job_id,)
+        )[0]
+        job = {
+            'job_id': job_id, 'universe_key': key, 'total': total, 'refresh': bool(refresh),
+            'status': status, 'created_at': created_at, 'updated_at': updated_at,
+            'checkpointed': checkpointed, 'failed': failed
+        }
+        if with_universe:
+            job['universe'] = _unpack(universe) or {}
+        return job
+    
+    def get_job(self, job_id, with_universe=False):
+        rows = self._read('SELECT * FROM jobs WHERE job_id = ?', (job_id,))
+        return self._job(rows[0], with_universe) if rows else None
+    
+    def unfinished_job(self, key):
+        """Latest job for the universe that never finished, or None"""
+        rows = self._read(
+            "SELECT * FROM jobs WHERE universe_key = ? AND status = 'running' ORDER BY created_at DESC LIMIT 1",
+            (key,)
+        )
+        return self._job(rows[0]) if rows else None
+    
+    def list_jobs(self, limit=20):
+        return [self._job(row) for row in self._read('SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?', (limit,))]
+    
+    def finish_job(self, job_id, status='done'):
+        with self._transaction() as connection:
+            connection.execute('UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ?',
+                               (status, time.time(), job_id))
+    
+    # Checkpoints
+    
+    def checkpoint(self, job_id, symbol, info):
+        """Record one settled symbol; info None means no data could be fetched for it"""
+        self.checkpoint_many(job_id, [(symbol, info)])
+    
+    def checkpoint_many(self, job_id, settled):
+        """Record [(symbol, info)] in one transaction"""
+        now = time.time()
+        rows = [(job_id, symbol, _pack(dict(dict.items(info))) if info else None, now) for symbol, info in settled]
+        with self._transaction() as connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO checkpoints (job_id, symbol, info, finished_at) VALUES (?, ?, ?, ?)', rows
+            )
+            connection.execute('UPDATE jobs SET updated_at = ? WHERE job_id = ?', (now, job_id))
+    
+    def fresh_infos(self, symbols, max_age=SCREEN_JOB_TTL, job_id=None):
+        """{symbol: (info, finished_at)} from the newest checkpoints within max_age
+        
+        Any job's checkpoints count unless job_id limits them to one job (a
+        refresh job must not pick up data older than itself).
+        """
+        sql = 'SELECT symbol, info, finished_at FROM checkpoints WHERE finished_at >= ? AND info IS NOT NULL'
+        args = [time.time() - max_age]
+        if job_id is not None:
+            sql += ' AND job_id = ?'
+            args.append(job_id)
+        wanted = set(symbols)
+        infos = {}
+        for symbol, body, finished_at in self._read(sql, args):
+            if symbol in wanted and (symbol not in infos or finished_at > infos[symbol][1]):
+                infos[symbol] = (body, finished_at)
+        unpacked = {}
+        for symbol, (body, finished_at) in infos.items():
+            info = _unpack(body)
+            if info:
+                unpacked[symbol] = (info, finished_at)
+        return unpacked
+    
+    # Maintenance
+    
+    def prune(self, max_age_days=7):
+        """Drop jobs created more than max_age_days ago along with their checkpoints"""
+        cutoff = time.time() - max_age_days * 86400
+        with self._transaction() as connection:
+            removed = {
+                'checkpoints': connection.execute(
+                    'DELETE FROM checkpoints WHERE job_id IN (SELECT job_id FROM jobs WHERE created_at < ?)', (cutoff,)
+                ).rowcount,
+                'jobs': connection.execute('DELETE FROM jobs WHERE created_at < ?', (cutoff,)).rowcount,
+            }
+        with self.lock:
+            self.connection.execute('VACUUM')
+        return removed
+    
+    def clear(self):
+        with self._transaction() as connection:
+            connection.execute('DELETE FROM checkpoints')
+            connection.execute('DELETE FROM jobs')
+
+_job_stores = {}
+_job_store_lock = threading.Lock()
+_job_store_failed = set()
+
+def get_job_store():
+    """JobStore for the current API base (see market_store.namespaced_path), or None when disabled or unusable"""
+    if not SCREEN_JOBS_ENABLED:
+        return None
+    path = namespaced_path(SCREEN_JOBS_PATH)
+    store = _job_stores.get(path)
+    if store is None and path not in _job_store_failed:
+        with _job_store_lock:
+            store = _job_stores.get(path)
+            if store is None and path not in _job_store_failed:
+                try:
+                    store = _job_stores[path] = JobStore(path)
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Screening jobs disabled: {e}")
+                    _job_store_failed.add(path)
+    return store
+
+class CheckpointWriter:
+    """Writes a job's checkpoints on its own thread, batching whatever has queued up
+    
+    add() never touches the disk, so it is safe to call from an event loop;
+    close() writes what is left and waits for it.
+    """
+    
+    def __init__(self, store, job_id):
+        self.store = store
+        self.job_id = job_id
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name=f'screen-job-{job_id}-checkpoints', daemon=True)
+        self.thread.start()
+    
+    def add(self, symbol, info):
+        self.queue.put((symbol, info))
+    
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+    
+    def _run(self):
+        closed = False
+        while not closed:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            closed = None in batch
+            batch = [item for item in batch if item is not None]
+            if not batch:
+                continue
+            try:
+                self.store.checkpoint_many(self.job_id, batch)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Could not checkpoint screening job {self.job_id}: {e}")
+
+# Jobs running in this process
+
+class ActiveJob:
+    """A job running on a background thread of this process
+    
+    events is the list of (symbol, info, cached) in the order symbols
+    settled; it only grows, so any number of sessions can follow it by index.
+    """
+    
+    def __init__(self, job_id, key, refresh=False):
+        self.job_id = job_id
+        self.key = key
+        self.refresh = refresh
+        self.events = []
+        self.snapshot = None
+        self.error = None
+        self.started = time.time()
+        self.thread = None
+    
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+    
+    def wait(self, timeout=None):
+        self.thread.join(timeout)
+        return not self.is_running()
+
+_active_jobs = {}
+_active_lock = threading.Lock()
+
+def active_job(job_id):
+    with _active_lock:
+        return _active_jobs.get(job_id)
+
+def job_state(job):
+    """'running' here, 'done', or 'interrupted' for an unfinished job nothing is checkpointing"""
+    return _job_state(job, active_job(job['job_id']))
+
+def _job_state(job, active):
+    if active is not None and active.is_running():
+        return 'running'
+    if job['status'] == 'running':
+        return 'running' if time.time() - job['updated_at'] < SCREEN_JOB_STALE and active is None else 'interrupted'
+    return job['status']
+
+def start_screening_job(stock_universe, run, refresh=False):
+    """ActiveJob acquiring the universe's snapshot, or None when jobs are disabled
+    
+    Attaches to the job already running here for the universe, else resumes
+    its latest unfinished job if that is interrupted (a job another process
+    is still checkpointing is left to it), else creates one. refresh=True
+    attaches only to a refresh job running here and never resumes. run(active,
+    job) does the work on the job's thread and returns the snapshot; the job
+    is marked done (or failed) when it returns.
+    """
+    store = get_job_store()
+    if store is None:
+        return None
+    key = universe_key(stock_universe)
+    
+    with _active_lock:
+        for job_id, active in list(_active_jobs.items()):
+            if not active.is_running():
+                del _active_jobs[job_id]
+            elif active.key == key and (active.refresh or not refresh):
+                return active
+        
+        job = None if refresh else store.unfinished_job(key)
+        if job is not None and _job_state(job, _active_jobs.get(job['job_id'])) != 'interrupted':
+            job = None
+        job_id = job['job_id'] if job else store.create_job(stock_universe, refresh)
+        job = store.get_job(job_id, with_universe=True)
+        active = ActiveJob(job_id, key, job['refresh'])
+        
+        def target():
+            try:
+                active.snapshot = run(active, job)
+                store.finish_job(job_id, 'done')
+            except Exception as e:
+                print(f"Screening job {job_id} failed: {e}")
+                active.error = e
+                store.finish_job(job_id, 'failed')
+        
+        active.thread = threading.Thread(target=target, name=f'screen-job-{job_id}', daemon=True)
+        _active_jobs[job_id] = active
+        active.thread.start()
+    if job['checkpointed']:
+        print(f"Resuming screening job {job_id}: {job['checkpointed']}/{job['total']} symbols checkpointed")
+    return active
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or prune checkpointed screening jobs')
+    parser.add_argument('command', choices=('list', 'prune'), nargs='?', default='list')
+    parser.add_argument('--path', default=SCREEN_JOBS_PATH)
+    parser.add_argument('--max-age-days', type=float, default=7, help='prune jobs created before this')
+    args = parser.parse_args()
+    
+    store = JobStore(args.path)
+    if args.command == 'prune':
+        print(f"Pruned {args.path}: {store.prune(args.max_age_days)}")
+    for job in store.list_jobs():
+        print(f"{job['job_id']}  {job_state(job):<11} {job['checkpointed']:>5}/{job['total']:<5} "
+              f"failed {job['failed']:<4} {time.strftime('%Y-%m-%d %H:%M', time.localtime(job['created_at']))}"
+              f"{'  refresh' if job['refresh'] else ''}")
+
+if __name__ == '__main__':
+    main()
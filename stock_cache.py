@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Process-wide cache of per-symbol stock data for screening
+Lives in its own module so it survives Streamlit reruns and is shared by
+every session and worker thread. Symbols are spread over shards; a shard's
+lock only guards its maps and a symbol's lock (one of a fixed set of stripes
+per shard) is held just while its entry is read or written, never across a
+network fetch. Stale entries can be
+refreshed on a small background pool (stale-while-revalidate), and memory
+is bounded by a byte budget with least-recently-used eviction.
+"""
+
+import concurrent.futures
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+
+import pandas as pd
+
+STOCK_CACHE_SHARDS = int(os.environ.get('YAHOO_STOCK_CACHE_SHARDS', 16))
+STOCK_CACHE_TTL = float(os.environ.get('YAHOO_STOCK_CACHE_TTL_SECONDS', 60 * 60))
+STOCK_CACHE_REFRESH_WORKERS = int(os.environ.get('YAHOO_STOCK_CACHE_REFRESH_WORKERS', 4))
+STOCK_CACHE_MAX_BYTES = int(float(os.environ.get('YAHOO_STOCK_CACHE_MAX_MB', 512)) * 1024 * 1024)
+STOCK_CACHE_DEMOTE = os.environ.get('YAHOO_STOCK_CACHE_DEMOTE', '1') == '1'  # Save evicted info to the market store
+EVICTION_RATE_WINDOW = 300  # Seconds of evictions behind the reported rate
+SYMBOL_LOCK_STRIPES = 64  # Symbol locks per shard, shared by the symbols hashing to them
+
+def estimate_size(value, _depth=0):
+    """Approximate bytes held by a cached value
+    
+    DataFrames and Series report memory_usage(deep=True); dicts and lists
+    are walked (a few levels deep) adding sys.getsizeof for each container,
+    key and value. Dict subclasses are read with dict.items, so a lazy info
+    dict is measured as loaded and never triggers a fetch.
+    """
+    if value is None:
+        return 0
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    size = sys.getsizeof(value)
+    if _depth >= 4:
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            sys.getsizeof(key) + estimate_size(item, _depth + 1) for key, item in dict.items(value)
+        )
+    if isinstance(value, (list, tuple, set)):
+        return size + sum(estimate_size(item, _depth + 1) for item in value)
+    return size
+
+class StockCacheEntry:
+    """Cached fields for one symbol plus when and how they were fetched"""
+    
+    __slots__ = ('data', 'fetched_at', 'source', 'size')
+    
+    def __init__(self, data, fetched_at=None, source='network', size=0):
+        self.data = data
+        self.fetched_at = fetched_at or time.time()
+        self.source = source
+        self.size = size
+    
+    def age(self, now=None):
+        return (now or time.time()) - self.fetched_at
+    
+    def is_fresh(self, max_age=None, now=None):
+        return self.age(now) < (STOCK_CACHE_TTL if max_age is None else max_age)
+    
+    def has(self, *fields):
+        return all(self.data.get(field) is not None for field in fields)
+
+class _Shard:
+    __slots__ = ('lock', 'entries', 'symbol_locks', 'bytes')
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # Least recently used first
+        # A fixed stripe set rather than a lock per symbol ever seen, so lookups
+        # of many distinct (or missing) symbols don't grow the shard
+        self.symbol_locks = [threading.Lock() for _ in range(SYMBOL_LOCK_STRIPES)]
+        self.bytes = 0
+
+def _demote_to_market_store(symbol, entry):
+    """Keep an evicted symbol's info on disk so reloading it needs no request
+    
+    Bars and statements are already written to the market store when they
+    are fetched; the info dict is the part that may only live here. A lazy
+    info dict is saved only once fully loaded, so a partial snapshot is never
+    taken for a complete one.
+    """
+    info = entry.data.get('stock_info')
+    if not info or not getattr(info, 'is_complete', lambda: True)():
+        return
+    from market_store import get_market_store
+    store = get_market_store()
+    if store is not None:
+        store.put_info(symbol, dict(dict.items(info)), fetched_at=entry.fetched_at)
+
+class StockCache:
+    """Sharded symbol -> StockCacheEntry map with striped symbol locks and a byte budget
+    
+    Entries are shared between callers, so treat their data as read-only
+    and put() a new dict (or merge() some fields) to update a symbol. Each shard gets an equal slice
+    of max_bytes and evicts its least recently used entries past it, handing
+    each one to demote(symbol, entry) first when that is set.
+    """
+    
+    def __init__(self, shards=STOCK_CACHE_SHARDS, max_bytes=STOCK_CACHE_MAX_BYTES, demote=None):
+        self.shards = [_Shard() for _ in range(max(1, shards))]
+        self.max_bytes = max_bytes
+        self.shard_max_bytes = max_bytes // len(self.shards)
+        self.demote = demote
+        self.stats_lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.demotions = 0
+        self.recent_evictions = deque(maxlen=100000)
+        self.refreshing = set()
+        self.refreshes_started = 0
+        self.refreshes_failed = 0
+        self.refresh_executor = None
+    
+    def _shard(self, symbol):
+        return self.shards[zlib.crc32(symbol.encode('utf-8')) % len(self.shards)]
+    
+    def _symbol_lock(self, shard, symbol):
+        # Never held two at a time, so symbols sharing a stripe can't deadlock
+        return shard.symbol_locks[hash(symbol) % len(shard.symbol_locks)]
+    
+    def _count(self, name):
+        with self.stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+    
+    def get(self, symbol, max_age=None, require=()):
+        """The symbol's entry (fresh or not) or None; require names fields that must be present
+        
+        Hits are counted against max_age (STOCK_CACHE_TTL by default); callers
+        decide what to do with a stale entry.
+        """
+        symbol = symbol.upper()
+        shard = self._shard(symbol)
+        with self._symbol_lock(shard, symbol):
+            entry = shard.entries.get(symbol)
+        
+        if entry is None or not entry.has(*require):
+            self._count('misses')
+            return None
+        with shard.lock:
+            if shard.entries.get(symbol) is entry:
+                shard.entries.move_to_end(symbol)
+        self._count('hits' if entry.is_fresh(max_age) else 'stale_hits')
+        return entry
+    
+    def put(self, symbol, data, fetched_at=None, source='network'):
+        symbol = symbol.upper()
+        # Measured before any lock is taken; deep memory_usage walks object columns
+        entry = StockCacheEntry(data, fetched_at, source, estimate_size(data))
+        shard = self._shard(symbol)
+        with self._symbol_lock(shard, symbol):
+            self._replace(shard, symbol, entry)
+        self._count('writes')
+        self._evict(shard, keep=symbol)
+        return entry
+    
+    def merge(self, symbol, fields, fetched_at=None, source='network'):
+        """Set some fields of a symbol's entry and keep the rest (put() replaces the whole entry)
+        
+        An entry is dated by its oldest field: merging into a fresh entry
+        keeps the older of the two timestamps, and an expired entry is
+        replaced by fields rather than made to look fresh.
+        """
+        symbol = symbol.upper()
+        fetched_at = fetched_at or time.time()
+        shard = self._shard(symbol)
+        while True:
+            with self._symbol_lock(shard, symbol):
+                previous = shard.entries.get(symbol)
+            if previous is not None and previous.is_fresh():
+                data = {**previous.data, **fields}
+                entry = StockCacheEntry(data, min(previous.fetched_at, fetched_at), source, estimate_size(data))
+            else:
+                entry = StockCacheEntry(dict(fields), fetched_at, source, estimate_size(fields))
+            with self._symbol_lock(shard, symbol):
+                # Measured outside the lock, so start over if the entry changed meanwhile
+                if shard.entries.get(symbol) is previous:
+                    self._replace(shard, symbol, entry)
+                    break
+        self._count('writes')
+        self._evict(shard, keep=symbol)
+        return entry
+    
+    def _replace(self, shard, symbol, entry):
+        # Caller holds the symbol's lock
+        with shard.lock:
+            previous = shard.entries.pop(symbol, None)
+            shard.entries[symbol] = entry
+            shard.bytes += entry.size - (previous.size if previous else 0)
+    
+    def _evict(self, shard, keep=None):
+        evicted = []
+        with shard.lock:
+            while shard.bytes > self.shard_max_bytes and shard.entries:
+                symbol, entry = next(iter(shard.entries.items()))
+                if symbol == keep and len(shard.entries) == 1:
+                    break  # A single oversized entry still gets cached
+                if symbol == keep:
+                    shard.entries.move_to_end(symbol)
+                    continue
+                del shard.entries[symbol]
+                shard.bytes -= entry.size
+                evicted.append((symbol, entry))
+        if not evicted:
+            return
+        
+        now = time.time()
+        with self.stats_lock:
+            self.evictions += len(evicted)
+            self.recent_evictions.extend([now] * len(evicted))
+        if self.demote is not None:
+            for symbol, entry in evicted:
+                try:
+                    self.demote(symbol, entry)
+                    self._count('demotions')
+                except Exception as e:
+                    print(f"Could not demote {symbol} to disk: {e}")
+    
+    def configure(self, max_bytes=None, demote=False):
+        """Change the byte budget (evicting down to it) and/or the demote hook (None disables)"""
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+            self.shard_max_bytes = max_bytes // len(self.shards)
+        if demote is not False:
+            self.demote = demote
+        for shard in self.shards:
+            self._evict(shard)
+    
+    def revalidate(self, symbol, fetch):
+        """Refresh a symbol in the background with fetch() -> data dict (or None on failure)
+        
+        At most one refresh per symbol runs at a time; returns False when one
+        is already under way. The stale entry stays in place until fetch succeeds.
+        """
+        symbol = symbol.upper()
+        with self.stats_lock:
+            if symbol in self.refreshing:
+                return False
+            self.refreshing.add(symbol)
+            self.refreshes_started += 1
+            if self.refresh_executor is None:
+                self.refresh_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=STOCK_CACHE_REFRESH_WORKERS, thread_name_prefix='stock-cache-refresh'
+                )
+            executor = self.refresh_executor
+        
+        def refresh():
+            try:
+                data = fetch()
+                if data is not None:
+                    self.put(symbol, data, source='revalidate')
+                else:
+                    self._count('refreshes_failed')
+            except Exception as e:
+                print(f"Background refresh failed for {symbol}: {e}")
+                self._count('refreshes_failed')
+            finally:
+                with self.stats_lock:
+                    self.refreshing.discard(symbol)
+        
+        executor.submit(refresh)
+        return True
+    
+    def is_refreshing(self, symbol):
+        with self.stats_lock:
+            return symbol.upper() in self.refreshing
+    
+    def fresh_symbols(self, symbols, max_age=None, require=()):
+        """The subset of symbols with a fresh entry holding the required fields (no counters touched)"""
+        now = time.time()
+        fresh = set()
+        for symbol in symbols:
+            key = symbol.upper()
+            shard = self._shard(key)
+            with self._symbol_lock(shard, key):
+                entry = shard.entries.get(key)
+            if entry is not None and entry.is_fresh(max_age, now) and entry.has(*require):
+                fresh.add(symbol)
+        return fresh
+    
+    def invalidate(self, symbol):
+        symbol = symbol.upper()
+        shard = self._shard(symbol)
+        with self._symbol_lock(shard, symbol):
+            with shard.lock:
+                entry = shard.entries.pop(symbol, None)
+                if entry is not None:
+                    shard.bytes -= entry.size
+    
+    def clear(self):
+        for shard in self.shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.bytes = 0
+    
+    def stats(self):
+        now = time.time()
+        entries = 0
+        fresh = 0
+        total_bytes = 0
+        for shard in self.shards:
+            with shard.lock:
+                values = list(shard.entries.values())
+                total_bytes += shard.bytes
+            entries += len(values)
+            fresh += sum(1 for entry in values if entry.is_fresh(now=now))
+        with self.stats_lock:
+            recent = sum(1 for evicted_at in self.recent_evictions if now - evicted_at < EVICTION_RATE_WINDOW)
+            return {
+                'entries': entries,
+                'fresh': fresh,
+                'bytes': total_bytes,
+                'max_bytes': self.max_bytes,
+                'evictions': self.evictions,
+                'evictions_per_minute': round(recent * 60 / EVICTION_RATE_WINDOW, 2),
+                'demotions': self.demotions,
+                'shards': len(self.shards),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'refreshing': len(self.refreshing),
+                'refreshes_started': self.refreshes_started,
+                'refreshes_failed': self.refreshes_failed
+            }
+
+_stock_cache = StockCache(demote=_demote_to_market_store if STOCK_CACHE_DEMOTE else None)
+
+def get_stock_cache():
+    """The process-wide StockCache"""
+    return _stock_cache
+
+def stock_cache_stats():
+    return _stock_cache.stats()
@@ -19,10 +19,18 @@ from datetime import datetime, timedelta
 import warnings
 import concurrent.futures
 import threading
+import asyncio
 from functools import lru_cache
 import time
 import json
 import os
+from screening_jobs import SCREEN_JOB_TTL, CheckpointWriter, get_job_store, job_state, start_screening_job
+from stock_cache import get_stock_cache
+from universe_registry import get_universe_registry
+from universe_snapshot import (
+    SNAPSHOT_TTL, ScreenProgress, UniverseSnapshot, get_universe_snapshot, put_universe_snapshot, rank_snapshot,
+    universe_key
+)
 warnings.filterwarnings('ignore')
 
 # PWA component will be imported after set_page_config to avoid conflicts
@@ -36,7 +44,109 @@ except ImportError:
     GOOGLE_SHEETS_AVAILABLE = False
     # Don't show warning immediately - only when feature is used
 
+def yahoo_circuit_open():
+    """True while the direct API's chart/quoteSummary circuit breakers are failing fast"""
+    try:
+        from yahoo_api_direct import circuit_breaker_open
+        return circuit_breaker_open('chart', 'quoteSummary')
+    except ImportError:
+        return False
+
+# Fetch primitives shared by every session and worker thread (st.cache_data keys
+# on the arguments and hands each caller its own copy of the result)
+SHARED_HISTORY_TTL = 15 * 60
+SHARED_INFO_TTL = 15 * 60
+SHARED_STATEMENTS_TTL = 24 * 60 * 60
+SHARED_BENCHMARK_TTL = 60 * 60
+SHARED_FX_TTL = 60 * 60
+
+class EmptyFetchResult(Exception):
+    """Raised inside a cached primitive so an empty response is retried instead of cached"""
+
+def _load_history(symbol, period):
+    data = yf.Ticker(symbol).history(period=period)
+    if data is None or data.empty:
+        raise EmptyFetchResult(f"No historical data returned for {symbol}")
+    return data
+
+@st.cache_data(ttl=SHARED_HISTORY_TTL, max_entries=512, show_spinner=False)
+def _shared_history(symbol, period):
+    return _load_history(symbol, period)
+
+@st.cache_data(ttl=SHARED_BENCHMARK_TTL, max_entries=64, show_spinner=False)
+def _shared_benchmark_history(symbol, period):
+    return _load_history(symbol, period)
+
+@st.cache_data(ttl=SHARED_INFO_TTL, max_entries=2048, show_spinner=False)
+def _shared_info(symbol):
+    # A lazy info dict is loaded in full here; the cache stores a plain dict
+    info = dict(yf.Ticker(symbol).info.items())
+    if len(info) < 5:
+        raise EmptyFetchResult(f"Insufficient stock info returned for {symbol}")
+    return info
+
+STATEMENT_ATTRIBUTES = (
+    'financials', 'balance_sheet', 'cashflow',
+    'quarterly_financials', 'quarterly_balance_sheet', 'quarterly_cashflow'
+)
+
+@st.cache_data(ttl=SHARED_STATEMENTS_TTL, max_entries=512, show_spinner=False)
+def _shared_statements(symbol):
+    ticker = yf.Ticker(symbol)
+    statements = {name: getattr(ticker, name) for name in STATEMENT_ATTRIBUTES}
+    if all(frame is None or frame.empty for frame in statements.values()):
+        raise EmptyFetchResult(f"No financial statements returned for {symbol}")
+    return statements
+
+@st.cache_data(ttl=SHARED_FX_TTL, max_entries=64, show_spinner=False)
+def _shared_fx_rate(from_currency, to_currency):
+    quote = yf.Ticker(f"{from_currency}{to_currency}=X").history(period='5d')
+    if quote is None or quote.empty:
+        raise EmptyFetchResult(f"No {from_currency}/{to_currency} rate returned")
+    return float(quote['Close'].dropna().iloc[-1])
+
+def fetch_history_shared(symbol, period='2y'):
+    """Daily history for a symbol, fetched once per period across sessions; empty DataFrame if none"""
+    try:
+        return _shared_history(symbol.upper(), period)
+    except EmptyFetchResult:
+        return pd.DataFrame()
+
+def fetch_info_shared(symbol):
+    """Full info dict for a symbol, fetched once across sessions; {} if Yahoo returned too little"""
+    try:
+        return _shared_info(symbol.upper())
+    except EmptyFetchResult:
+        return {}
+
+def fetch_statements_shared(symbol):
+    """Annual and quarterly statements as {attribute name: DataFrame}; all empty if Yahoo returned none"""
+    try:
+        return _shared_statements(symbol.upper())
+    except EmptyFetchResult:
+        return {name: pd.DataFrame() for name in STATEMENT_ATTRIBUTES}
+
+def fetch_benchmark_history_shared(symbol, period='2y'):
+    """Benchmark index history (longer TTL than stock history - it only feeds relative metrics)"""
+    try:
+        return _shared_benchmark_history(symbol.upper(), period)
+    except EmptyFetchResult:
+        return pd.DataFrame()
+
+def fetch_fx_rate_shared(from_currency, to_currency):
+    """Latest from->to exchange rate, or None when Yahoo has no quote for the pair"""
+    if from_currency == to_currency:
+        return 1.0
+    try:
+        return _shared_fx_rate(from_currency.upper(), to_currency.upper())
+    except Exception:
+        return None
+
 class ValueInvestmentAnalyzer:
+    SCREEN_RESULT_LIMIT = 50  # Rows a screen returns
+    SCREEN_PROGRESS_INTERVAL = 0.25  # Seconds between on_progress calls while a screen runs
+    SCREEN_SHARD_SIZE = int(os.environ.get('YAHOO_SCREEN_SHARD_SIZE', 500))  # Symbols per independently fetched shard
+    
     def __init__(self):
         self.stock_data = None
         self.stock_info = None
@@ -44,8 +154,11 @@ class ValueInvestmentAnalyzer:
         self.financials = None
         self.balance_sheet = None
         self.cashflow = None
-        self._stock_cache = {}  # Cache for stock data
-        self._cache_lock = threading.Lock()  # Thread safety for cache
+        self.quarterly_financials = None
+        self.quarterly_balance_sheet = None
+        self.quarterly_cashflow = None
+        self.last_screen_report = None
+        self.screening_job_id = None
         
         # Initialize direct API for analyst recommendations
         try:
@@ -63,6 +176,13 @@ class ValueInvestmentAnalyzer:
             import json
             import time
             
+            # Route search traffic through the shared keep-alive pool when available
+            try:
+                from yahoo_api_direct import get_shared_session
+                http = get_shared_session()
+            except ImportError:
+                http = requests
+            
             def normalize_name(name):
                 """Remove accents and normalize company name"""
                 # Remove accents and special characters
@@ -70,6 +190,34 @@ class ValueInvestmentAnalyzer:
                 ascii_name = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
                 return ascii_name.strip()
             
+            def first_valid_symbol(candidates):
+                """Return the first candidate with a live quote, validating them in one batch"""
+                candidates = [c for c in candidates if c and len(c) > 1]
+                if not candidates:
+                    return None
+                try:
+                    from yahoo_api_direct import get_default_client
+                    quotes = get_default_client().get_quotes(candidates)
+                    for candidate in candidates:
+                        quote = quotes.get(candidate.upper())
+                        if quote and quote.get('currentPrice') is not None:
+                            return candidate
+                    return None
+                except ImportError:
+                    pass
+                
+                # Standard yfinance has no batch quotes - validate one ticker at a time
+                for candidate in candidates:
+                    try:
+                        test_info = yf.Ticker(candidate).info
+                        if (test_info and 
+                            test_info.get('regularMarketPrice') is not None and
+                            test_info.get('symbol') != 'INVALID'):
+                            return candidate
+                    except:
+                        continue
+                return None
+            
             # Method 1: Yahoo Finance Search API
             def yahoo_finance_search(query):
                 """Use Yahoo Finance search API to find tickers"""
@@ -87,11 +235,12 @@ class ValueInvestmentAnalyzer:
                         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                     }
                     
-                    response = requests.get(search_url, params=params, headers=headers, timeout=5)
+                    response = http.get(search_url, params=params, headers=headers, timeout=5)
                     
                     if response.status_code == 200:
                         data = response.json()
                         quotes = data.get('quotes', [])
+                        matching_symbols = []
                         
                         for quote in quotes:
                             symbol = quote.get('symbol')
@@ -108,17 +257,10 @@ class ValueInvestmentAnalyzer:
                                 query_lower in short_lower or
                                 name_lower.startswith(query_lower) or
                                 short_lower.startswith(query_lower)):
-                                
-                                # Verify this symbol has valid data
-                                try:
-                                    test_ticker = yf.Ticker(symbol)
-                                    test_info = test_ticker.info
-                                    if (test_info and 
-                                        test_info.get('regularMarketPrice') is not None and
-                                        test_info.get('symbol') != 'INVALID'):
-                                        return symbol
-                                except:
-                                    continue
+                                matching_symbols.append(symbol)
+                        
+                        # Verify the matches have valid data (one batch quote request)
+                        return first_valid_symbol(matching_symbols)
                                     
                 except Exception:
                     pass
@@ -431,23 +573,8 @@ class ValueInvestmentAnalyzer:
                     if not candidate.endswith(tuple(global_suffixes)):
                         extended_candidates.append(candidate + suffix)
             
-            # Test candidates with timeout and error handling
-            for candidate in extended_candidates:
-                if len(candidate) > 1:  # Skip empty or single character searches
-                    try:
-                        test_ticker = yf.Ticker(candidate)
-                        info = test_ticker.info
-                        
-                        # Check if we got valid stock info
-                        if (info and 
-                            'symbol' in info and 
-                            info.get('symbol') != 'INVALID' and
-                            info.get('regularMarketPrice') is not None):
-                            return candidate
-                    except:
-                        continue
-            
-            return None
+            # Test all candidates with a single batch quote lookup
+            return first_valid_symbol(extended_candidates)
         except:
             return None
     
@@ -457,6 +584,13 @@ class ValueInvestmentAnalyzer:
             import requests
             import unicodedata
             
+            # Route search traffic through the shared keep-alive pool when available
+            try:
+                from yahoo_api_direct import get_shared_session
+                http = get_shared_session()
+            except ImportError:
+                http = requests
+            
             def normalize_name(name):
                 """Remove accents and normalize company name"""
                 normalized = unicodedata.normalize('NFD', name.lower())
@@ -479,7 +613,7 @@ class ValueInvestmentAnalyzer:
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
                 
-                response = requests.get(search_url, params=params, headers=headers, timeout=10)
+                response = http.get(search_url, params=params, headers=headers, timeout=10)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -694,51 +828,22 @@ class ValueInvestmentAnalyzer:
             try:
                 # Progressive delay with more jitter for cloud environments
                 if attempt > 0:
+                    if yahoo_circuit_open():
+                        # Yahoo endpoints are failing fast - let the caller fall back to cached data
+                        return False
                     delay = base_delay * (2 ** attempt) + random.uniform(0.5, 2.0)
                     st.info(f"⏳ Waiting {delay:.1f}s before retry {attempt + 1}/{max_retries} for {symbol}...")
                     time.sleep(delay)
                 
-                # Add small delay even on first attempt to avoid rapid requests
-                time.sleep(random.uniform(0.2, 0.8))
-                
-                # Use different session and headers to avoid detection
-                # Note: yf is already imported globally with our direct API
-                session = None
-                try:
-                    import requests
-                    session = requests.Session()
-                    
-                    # Rotate User-Agent strings to avoid detection
-                    user_agents = [
-                        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
-                        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:89.0) Gecko/20100101 Firefox/89.0'
-                    ]
-                    
-                    selected_ua = user_agents[attempt % len(user_agents)]
-                    
-                    session.headers.update({
-                        'User-Agent': selected_ua,
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.5',
-                        'Accept-Encoding': 'gzip, deflate',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                        'Sec-Fetch-Dest': 'document',
-                        'Sec-Fetch-Mode': 'navigate',
-                        'Sec-Fetch-Site': 'none',
-                        'Cache-Control': 'max-age=0'
-                    })
-                except:
-                    pass
-                
-                self.ticker = yf.Ticker(symbol, session=session)
+                # Request pacing is handled by the shared per-endpoint rate limiters in yahoo_api_direct
+                # Ticker objects share the process-wide connection pool from yahoo_api_direct,
+                # so retries reuse open connections instead of building a new session
+                self.ticker = yf.Ticker(symbol)
                 
-                # Try to get basic info first (lighter request)
+                # Try to get basic info first (lighter request); info, history and
+                # statements come from the caches shared by all sessions
                 try:
-                    self.stock_info = self.ticker.info
+                    self.stock_info = fetch_info_shared(symbol)
                     if not self.stock_info or len(self.stock_info) < 5:
                         raise Exception("Insufficient stock info returned")
                 except Exception as info_error:
@@ -749,7 +854,7 @@ class ValueInvestmentAnalyzer:
                 
                 # Then get historical data
                 try:
-                    self.stock_data = self.ticker.history(period=period)
+                    self.stock_data = fetch_history_shared(symbol, period)
                     if self.stock_data.empty:
                         raise Exception("No historical data returned")
                 except Exception as hist_error:
@@ -760,14 +865,14 @@ class ValueInvestmentAnalyzer:
                 
                 # Fetch financial statements for advanced metrics (optional)
                 try:
-                    time.sleep(random.uniform(0.1, 0.3))  # Small delay between requests
-                    self.financials = self.ticker.financials
-                    self.balance_sheet = self.ticker.balance_sheet
-                    self.cashflow = self.ticker.cashflow
+                    statements = fetch_statements_shared(symbol)
+                    self.financials = statements['financials']
+                    self.balance_sheet = statements['balance_sheet']
+                    self.cashflow = statements['cashflow']
                     # Get quarterly data for more detailed analysis
-                    self.quarterly_financials = self.ticker.quarterly_financials
-                    self.quarterly_balance_sheet = self.ticker.quarterly_balance_sheet
-                    self.quarterly_cashflow = self.ticker.quarterly_cashflow
+                    self.quarterly_financials = statements['quarterly_financials']
+                    self.quarterly_balance_sheet = statements['quarterly_balance_sheet']
+                    self.quarterly_cashflow = statements['quarterly_cashflow']
                 except:
                     # Financial data is optional - don't fail if we can't get it
                     pass
@@ -1872,8 +1977,7 @@ class ValueInvestmentAnalyzer:
         
         try:
             # Fetch benchmark data (S&P 500 by default)
-            benchmark = yf.Ticker(benchmark_symbol)
-            benchmark_data = benchmark.history(period='2y')
+            benchmark_data = fetch_benchmark_history_shared(benchmark_symbol, '2y')
             
             if benchmark_data.empty:
                 return {'error': 'Could not fetch benchmark data'}
@@ -2099,376 +2203,8 @@ class ValueInvestmentAnalyzer:
     def screen_value_stocks(self):
         """Screen and rank best value stocks from large and medium cap US/European markets"""
         
-        # Comprehensive list of large and medium cap stocks from US and European markets
-        stock_universe = {
-            # US Large Cap
-            'AAPL': 'Apple Inc.',
-            'MSFT': 'Microsoft Corporation', 
-            'GOOGL': 'Alphabet Inc.',
-            'AMZN': 'Amazon.com Inc.',
-            'TSLA': 'Tesla Inc.',
-            'NVDA': 'NVIDIA Corporation',
-            'META': 'Meta Platforms Inc.',
-            'BRK-B': 'Berkshire Hathaway',
-            'JNJ': 'Johnson & Johnson',
-            'V': 'Visa Inc.',
-            'WMT': 'Walmart Inc.',
-            'PG': 'Procter & Gamble',
-            'JPM': 'JPMorgan Chase',
-            'UNH': 'UnitedHealth Group',
-            'MA': 'Mastercard Inc.',
-            'HD': 'Home Depot Inc.',
-            'NFLX': 'Netflix Inc.',
-            'BAC': 'Bank of America',
-            'ABBV': 'AbbVie Inc.',
-            'CRM': 'Salesforce Inc.',
-            'KO': 'Coca-Cola Company',
-            'PEP': 'PepsiCo Inc.',
-            'COST': 'Costco Wholesale',
-            'AVGO': 'Broadcom Inc.',
-            'TMO': 'Thermo Fisher Scientific',
-            'CVX': 'Chevron Corporation',
-            'LLY': 'Eli Lilly and Company',
-            'ACN': 'Accenture plc',
-            'MRK': 'Merck & Co.',
-            'ABT': 'Abbott Laboratories',
-            'ORCL': 'Oracle Corporation',
-            'CSCO': 'Cisco Systems',
-            'XOM': 'Exxon Mobil Corporation',
-            'ADBE': 'Adobe Inc.',
-            'DHR': 'Danaher Corporation',
-            'VZ': 'Verizon Communications',
-            'PFE': 'Pfizer Inc.',
-            'NKE': 'NIKE Inc.',
-            'INTC': 'Intel Corporation',
-            'T': 'AT&T Inc.',
-            'COP': 'ConocoPhillips',
-            'NFLX': 'Netflix Inc.',
-            'QCOM': 'QUALCOMM Inc.',
-            'PM': 'Philip Morris International',
-            'HON': 'Honeywell International',
-            'UPS': 'United Parcel Service',
-            'LOW': 'Lowe\'s Companies',
-            'MS': 'Morgan Stanley',
-            'CAT': 'Caterpillar Inc.',
-            'GS': 'Goldman Sachs Group',
-            'AMD': 'Advanced Micro Devices',
-            'IBM': 'International Business Machines',
-            'SPGI': 'S&P Global Inc.',
-            'BLK': 'BlackRock Inc.',
-            
-            # European Large/Mid Cap
-            'ASML.AS': 'ASML Holding (Netherlands)',
-            'SAP.DE': 'SAP SE (Germany)',
-            'NESN.SW': 'Nestlé SA (Switzerland)',
-            'NOVN.SW': 'Novartis AG (Switzerland)',
-            'ROG.SW': 'Roche Holding (Switzerland)',
-            'MC.PA': 'LVMH (France)',
-            'OR.PA': 'L\'Oréal (France)',
-            'TTE.PA': 'TotalEnergies (France)',
-            'SAN.PA': 'Sanofi (France)',
-            'AIR.PA': 'Airbus SE (France)',
-            'BN.PA': 'Danone (France)',
-            'DG.PA': 'Vinci SA (France)',
-            'BNP.PA': 'BNP Paribas (France)',
-            'RMS.PA': 'Hermès (France)',
-            'AZN.L': 'AstraZeneca (UK)',
-            'SHEL.L': 'Shell plc (UK)',
-            'BP.L': 'BP plc (UK)',
-            'ULVR.L': 'Unilever (UK)',
-            'HSBA.L': 'HSBC Holdings (UK)',
-            'DGE.L': 'Diageo (UK)',
-            'BARC.L': 'Barclays (UK)',
-            'LLOY.L': 'Lloyds Banking Group (UK)',
-            'BT-A.L': 'BT Group (UK)',
-            'TSCO.L': 'Tesco (UK)',
-            'RIO.L': 'Rio Tinto (UK)',
-            'ALV.DE': 'Allianz SE (Germany)',
-            'SIE.DE': 'Siemens AG (Germany)',
-            'BAYN.DE': 'Bayer AG (Germany)',
-            'BAS.DE': 'BASF SE (Germany)',
-            'BMW.DE': 'BMW (Germany)',
-            'VOW3.DE': 'Volkswagen (Germany)',
-            'DBK.DE': 'Deutsche Bank (Germany)',
-            'DTE.DE': 'Deutsche Telekom (Germany)',
-            'IFX.DE': 'Infineon Technologies (Germany)',
-            'ADS.DE': 'Adidas AG (Germany)',
-            'MUV2.DE': 'Munich Re (Germany)',
-            'MBG.DE': 'Mercedes-Benz Group (Germany)',
-            'FRE.DE': 'Fresenius SE (Germany)',
-            'LIN.DE': 'Linde plc (Germany)',
-            'EOAN.DE': 'E.ON SE (Germany)',
-            'RWE.DE': 'RWE AG (Germany)',
-            'CON.DE': 'Continental AG (Germany)',
-            'HEI.DE': 'HeidelbergCement (Germany)',
-            'ABBN.SW': 'ABB Ltd (Switzerland)',
-            'UHR.SW': 'Swatch Group (Switzerland)',
-            'ZURN.SW': 'Zurich Insurance (Switzerland)',
-            'CS.PA': 'AXA SA (France)',
-            'KER.PA': 'Kering SA (France)',
-            'CAP.PA': 'Capgemini SE (France)',
-            'STLA.MI': 'Stellantis (Italy)',
-            'ISP.MI': 'Intesa Sanpaolo (Italy)',
-            'UCG.MI': 'UniCredit (Italy)',
-            'ENI.MI': 'Eni S.p.A. (Italy)',
-            'G.MI': 'Assicurazioni Generali (Italy)',
-            'BBVA.MC': 'Banco Bilbao Vizcaya (Spain)',
-            'IBE.MC': 'Iberdrola SA (Spain)',
-            'TEF.MC': 'Telefónica SA (Spain)',
-            'REP.MC': 'Repsol SA (Spain)',
-            'ITX.MC': 'Inditex SA (Spain)',
-            'SAN.MC': 'Banco Santander (Spain)',
-            'NOVO-B.CO': 'Novo Nordisk (Denmark)',
-            'MAERSK-B.CO': 'A.P. Møller-Mærsk (Denmark)',
-            'CARL-B.CO': 'Carlsberg (Denmark)',
-            'NOKIA.HE': 'Nokia Corporation (Finland)',
-            'NESTE.HE': 'Neste Corporation (Finland)',
-            'VOLV-B.ST': 'Volvo AB (Sweden)',
-            'ERIC-B.ST': 'Ericsson (Sweden)',
-            'HM-B.ST': 'H&M (Sweden)',
-            'SEB-A.ST': 'Skandinaviska Enskilda (Sweden)',
-            'EQNR.OL': 'Equinor ASA (Norway)',
-            'DNB.OL': 'DNB Bank (Norway)',
-            'TEL.OL': 'Telenor ASA (Norway)',
-            'INGA.AS': 'ING Groep (Netherlands)',
-            'PHIA.AS': 'Philips (Netherlands)',
-            'HEIA.AS': 'Heineken (Netherlands)',
-            'ADYEN.AS': 'Adyen (Netherlands)',
-            'DSM.AS': 'Royal DSM (Netherlands)',
-            'AKZA.AS': 'Akzo Nobel (Netherlands)',
-            'UNA.AS': 'Unilever (Netherlands)',
-            'AD.AS': 'Ahold Delhaize (Netherlands)',
-            
-            # Additional US Mid/Small Cap Stocks
-            'AMD': 'Advanced Micro Devices',
-            'CRM': 'Salesforce Inc.',
-            'PYPL': 'PayPal Holdings',
-            'AMGN': 'Amgen Inc.',
-            'GILD': 'Gilead Sciences',
-            'SBUX': 'Starbucks Corporation',
-            'ISRG': 'Intuitive Surgical',
-            'AMAT': 'Applied Materials',
-            'LRCX': 'Lam Research',
-            'ADI': 'Analog Devices',
-            'KLAC': 'KLA Corporation',
-            'MRVL': 'Marvell Technology',
-            'FTNT': 'Fortinet Inc.',
-            'PANW': 'Palo Alto Networks',
-            'CRWD': 'CrowdStrike Holdings',
-            'SNOW': 'Snowflake Inc.',
-            'NET': 'Cloudflare Inc.',
-            'DDOG': 'Datadog Inc.',
-            'ZM': 'Zoom Video',
-            'DOCU': 'DocuSign Inc.',
-            'PTON': 'Peloton Interactive',
-            'ROKU': 'Roku Inc.',
-            'SQ': 'Block Inc.',
-            'TWLO': 'Twilio Inc.',
-            'OKTA': 'Okta Inc.',
-            'SHOP': 'Shopify Inc.',
-            'WDAY': 'Workday Inc.',
-            'VEEV': 'Veeva Systems',
-            'SPLK': 'Splunk Inc.',
-            'NOW': 'ServiceNow Inc.',
-            'MDB': 'MongoDB Inc.',
-            'ZS': 'Zscaler Inc.',
-            'TDOC': 'Teladoc Health',
-            'FICO': 'Fair Isaac Corp',
-            'PAYC': 'Paycom Software',
-            'RNG': 'RingCentral Inc.',
-            'TEAM': 'Atlassian Corp',
-            'SPOT': 'Spotify Technology',
-            'UBER': 'Uber Technologies',
-            'LYFT': 'Lyft Inc.',
-            'DASH': 'DoorDash Inc.',
-            'ABNB': 'Airbnb Inc.',
-            'COIN': 'Coinbase Global',
-            'RBLX': 'Roblox Corporation',
-            'U': 'Unity Software',
-            'PATH': 'UiPath Inc.',
-            'PLTR': 'Palantir Technologies',
-            'RIVN': 'Rivian Automotive',
-            'LCID': 'Lucid Group Inc.',
-            
-            # Additional European Stocks
-            'ASME.L': 'ASOS plc (UK)',
-            'JET2.L': 'Jet2 plc (UK)',
-            'EXPN.L': 'Experian plc (UK)',
-            'REL.L': 'RELX plc (UK)',
-            'IMB.L': 'Imperial Brands (UK)',
-            'GLEN.L': 'Glencore plc (UK)',
-            'ANTO.L': 'Antofagasta plc (UK)',
-            'FRES.L': 'Fresnillo plc (UK)',
-            'POLY.L': 'Polymetal International (UK)',
-            'EVR.L': 'Evraz plc (UK)',
-            'PRU.L': 'Prudential plc (UK)',
-            'LGEN.L': 'Legal & General (UK)',
-            'AVVA.L': 'Aviva plc (UK)',
-            'RSA.L': 'RSA Insurance Group (UK)',
-            'SSE.L': 'SSE plc (UK)',
-            'NG.L': 'National Grid plc (UK)',
-            'UU.L': 'United Utilities (UK)',
-            'SVT.L': 'Severn Trent (UK)',
-            'BDEV.L': 'Barratt Developments (UK)',
-            'PSN.L': 'Persimmon plc (UK)',
-            'TW.L': 'Taylor Wimpey (UK)',
-            'CRDA.L': 'Croda International (UK)',
-            'CCH.L': 'Coca-Cola HBC (UK)',
-            'SBRY.L': 'J Sainsbury plc (UK)',
-            'MRW.L': 'Morrison (WM) Supermarkets (UK)',
-            'OCDO.L': 'Ocado Group (UK)',
-            'JD.L': 'JD Sports Fashion (UK)',
-            'FERG.L': 'Ferguson plc (UK)',
-            'CRH.L': 'CRH plc (UK)',
-            'SMDS.L': 'DS Smith plc (UK)',
-            'MNDI.L': 'Mondi plc (UK)',
-            'WPP.L': 'WPP plc (UK)',
-            'ITV.L': 'ITV plc (UK)',
-            'TALK.L': 'TalkTalk Telecom (UK)',
-            'VOD.L': 'Vodafone Group (UK)',
-            
-            # German Mid Cap
-            'ZAL.DE': 'Zalando SE (Germany)',
-            'DHER.DE': 'Delivery Hero (Germany)',
-            'PUM.DE': 'Puma SE (Germany)',
-            'LHA.DE': 'Lufthansa (Germany)',
-            'TKA.DE': 'ThyssenKrupp (Germany)',
-            'MTX.DE': 'MTU Aero Engines (Germany)',
-            'SOW.DE': 'Software AG (Germany)',
-            'RHM.DE': 'Rheinmetall (Germany)',
-            'SRT3.DE': 'Sartorius (Germany)',
-            'QIA.DE': 'Qiagen (Germany)',
-            'SAZ.DE': 'SAF-HOLLAND (Germany)',
-            'WAF.DE': 'Wirecard AG (Germany)',
-            'FNTN.DE': 'freenet AG (Germany)',
-            'O2D.DE': '1&1 AG (Germany)',
-            'TEG.DE': 'TAG Immobilien (Germany)',
-            'VNA.DE': 'Vonovia SE (Germany)',
-            'LEG.DE': 'LEG Immobilien (Germany)',
-            'DWS.DE': 'DWS Group (Germany)',
-            'BOSS.DE': 'Hugo Boss (Germany)',
-            'HNR1.DE': 'Hannover Re (Germany)',
-            
-            # French Mid Cap
-            'UG.PA': 'Peugeot SA (France)',
-            'RNO.PA': 'Renault SA (France)',
-            'STM.PA': 'STMicroelectronics (France)',
-            'CAP.PA': 'Capgemini SE (France)',
-            'ATO.PA': 'Atos SE (France)',
-            'CS.PA': 'AXA SA (France)',
-            'BNP.PA': 'BNP Paribas (France)',
-            'GLE.PA': 'Société Générale (France)',
-            'CA.PA': 'Carrefour SA (France)',
-            'RF.PA': 'Eurofins Scientific (France)',
-            'DSY.PA': 'Dassault Systèmes (France)',
-            'UBI.PA': 'Ubisoft Entertainment (France)',
-            'ML.PA': 'Michelin (France)',
-            'RI.PA': 'Pernod Ricard (France)',
-            'VIE.PA': 'Veolia Environment (France)',
-            'SGO.PA': 'Saint-Gobain (France)',
-            'PUB.PA': 'Publicis Groupe (France)',
-            'VIV.PA': 'Vivendi SE (France)',
-            'ORA.PA': 'Orange SA (France)',
-            'EN.PA': 'Bouygues SA (France)',
-            
-            # Swiss Mid Cap
-            'CFR.SW': 'Compagnie Financière Richemont (Switzerland)',
-            'GIVN.SW': 'Givaudan SA (Switzerland)',
-            'SLHN.SW': 'Swiss Life Holding (Switzerland)',
-            'SCMN.SW': 'Swisscom AG (Switzerland)',
-            'SGSN.SW': 'SGS SA (Switzerland)',
-            'LONN.SW': 'Lonza Group (Switzerland)',
-            'GEBN.SW': 'Geberit AG (Switzerland)',
-            'SIKA.SW': 'Sika AG (Switzerland)',
-            'STMN.SW': 'Straumann Holding (Switzerland)',
-            'CSGN.SW': 'Credit Suisse Group (Switzerland)',
-            
-            # Nordic Stocks
-            'ATCO-A.ST': 'Atlas Copco (Sweden)',
-            'SAND.ST': 'Sandvik AB (Sweden)',
-            'SKF-B.ST': 'SKF AB (Sweden)',
-            'ALFA.ST': 'Alfa Laval (Sweden)',
-            'INVE-B.ST': 'Investor AB (Sweden)',
-            'SWED-A.ST': 'Swedbank AB (Sweden)',
-            'SHB-A.ST': 'Svenska Handelsbanken (Sweden)',
-            'NDA-SE.ST': 'Nordea Bank (Sweden)',
-            'TELIA.ST': 'Telia Company (Sweden)',
-            'HEXA-B.ST': 'Hexagon AB (Sweden)',
-            'EQT.ST': 'EQT AB (Sweden)',
-            'KINV-B.ST': 'Kinnevik AB (Sweden)',
-            'ELUX-B.ST': 'Electrolux AB (Sweden)',
-            'HUSQ-B.ST': 'Husqvarna AB (Sweden)',
-            'SSAB-A.ST': 'SSAB AB (Sweden)',
-            'STORA.ST': 'Stora Enso (Finland)',
-            'FORTUM.HE': 'Fortum Oyj (Finland)',
-            'KNEBV.HE': 'Kone Oyj (Finland)',
-            'ORNBV.HE': 'Orion Oyj (Finland)',
-            'SAMPO.HE': 'Sampo Oyj (Finland)',
-            'TIETO.HE': 'Tietoevry Oyj (Finland)',
-            'YAR.OL': 'Yara International (Norway)',
-            'ORK.OL': 'Orkla ASA (Norway)',
-            'MOWI.OL': 'Mowi ASA (Norway)',
-            'NHY.OL': 'Norsk Hydro (Norway)',
-            'STB.OL': 'Storebrand ASA (Norway)',
-            
-            # Dutch Mid Cap
-            'BESI.AS': 'BE Semiconductor Industries (Netherlands)',
-            'SBMO.AS': 'SBM Offshore (Netherlands)',
-            'AMG.AS': 'AMG Advanced Metallurgical (Netherlands)',
-            'APAM.AS': 'Aperam SA (Netherlands)',
-            'KPN.AS': 'Koninklijke KPN (Netherlands)',
-            'AALB.AS': 'Aalberts NV (Netherlands)',
-            'FAGR.AS': 'Flow Traders (Netherlands)',
-            'GLPG.AS': 'Galapagos NV (Netherlands)',
-            'IMCD.AS': 'IMCD NV (Netherlands)',
-            'JDE.AS': 'JDE Peet''s NV (Netherlands)',
-            'NN.AS': 'NN Group NV (Netherlands)',
-            'PRX.AS': 'Prosus NV (Netherlands)',
-            'RAND.AS': 'Randstad NV (Netherlands)',
-            'TKWY.AS': 'Just Eat Takeaway (Netherlands)',
-            'VPK.AS': 'Vopak NV (Netherlands)',
-            'WKL.AS': 'Wolters Kluwer (Netherlands)',
-            
-            # Italian Mid Cap
-            'RACE.MI': 'Ferrari NV (Italy)',
-            'CNHI.MI': 'CNH Industrial (Italy)',
-            'TIT.MI': 'Telecom Italia (Italy)',
-            'MB.MI': 'Mediobanca (Italy)',
-            'UBI.MI': 'Unione di Banche Italiane (Italy)',
-            'ATL.MI': 'Atlantia SpA (Italy)',
-            'SPM.MI': 'Saipem SpA (Italy)',
-            'TEN.MI': 'Tenaris SA (Italy)',
-            'ENEL.MI': 'Enel SpA (Italy)',
-            'A2A.MI': 'A2A SpA (Italy)',
-            'TERNA.MI': 'Terna SpA (Italy)',
-            'SRG.MI': 'Snam SpA (Italy)',
-            'PRY.MI': 'Prysmian SpA (Italy)',
-            'LUX.MI': 'Luxottica Group (Italy)',
-            'MONC.MI': 'Moncler SpA (Italy)',
-            'FCA.MI': 'Fiat Chrysler (Italy)',
-            
-            # Spanish Mid Cap
-            'AMS.MC': 'Amadeus IT Group (Spain)',
-            'ACX.MC': 'Acerinox SA (Spain)',
-            'ANA.MC': 'Acciona SA (Spain)',
-            'CABK.MC': 'CaixaBank SA (Spain)',
-            'COL.MC': 'Inmobiliaria Colonial (Spain)',
-            'ELE.MC': 'Endesa SA (Spain)',
-            'ENG.MC': 'Enagás SA (Spain)',
-            'FER.MC': 'Ferrovial SA (Spain)',
-            'GAS.MC': 'Naturgy Energy (Spain)',
-            'IAG.MC': 'International Airlines Group (Spain)',
-            'IDR.MC': 'Indra Sistemas (Spain)',
-            'LOG.MC': 'Logista SA (Spain)',
-            'MAP.MC': 'Mapfre SA (Spain)',
-            'MRL.MC': 'Merlin Properties (Spain)',
-            'MTS.MC': 'ArcelorMittal SA (Spain)',
-            'PHM.MC': 'Pharma Mar SA (Spain)',
-            'RED.MC': 'Red Eléctrica (Spain)',
-            'SAB.MC': 'Banco Sabadell (Spain)',
-            'SGRE.MC': 'Siemens Gamesa (Spain)',
-            'VIS.MC': 'Viscofan SA (Spain)'
-        }
+        # Large and mid cap US/European stocks from the universe registry
+        stock_universe = get_universe_registry().universe('broad')
         
         value_scores = []
         
@@ -2488,145 +2224,639 @@ class ValueInvestmentAnalyzer:
         
         return value_scores[:30]  # Return top 30 value stocks
     
-    def fetch_stock_data_cached(self, symbol, max_age_minutes=60):
-        """Fetch stock data with aggressive caching to avoid repeated API calls"""
-        with self._cache_lock:
-            current_time = time.time()
-            
-            # Check if we have cached data that's still fresh (increased cache time)
-            if symbol in self._stock_cache:
-                cached_data, timestamp = self._stock_cache[symbol]
-                cache_age_minutes = (current_time - timestamp) / 60
-                
-                if cache_age_minutes < max_age_minutes:
-                    # Use cached data
-                    self.stock_data = cached_data.get('stock_data')
-                    self.stock_info = cached_data.get('stock_info')
-                    self.financials = cached_data.get('financials')
-                    self.balance_sheet = cached_data.get('balance_sheet')
-                    self.cashflow = cached_data.get('cashflow')
+    # Everything fetch_stock_data loads, cached together per symbol (quote/info and statements)
+    STOCK_CACHE_FIELDS = (
+        'stock_data', 'stock_info', 'financials', 'balance_sheet', 'cashflow',
+        'quarterly_financials', 'quarterly_balance_sheet', 'quarterly_cashflow'
+    )
+    
+    def _stock_cache_entry(self):
+        return {field: getattr(self, field, None) for field in self.STOCK_CACHE_FIELDS}
+    
+    def _load_stock_cache_entry(self, symbol, cached_data):
+        for field in self.STOCK_CACHE_FIELDS:
+            setattr(self, field, cached_data.get(field))
+        # Ticker objects are lazy (no request until used), so a cache hit gets
+        # one too for the news and fund-holdings lookups that need it
+        self.ticker = yf.Ticker(symbol)
+    
+    def fetch_stock_data_cached(self, symbol, max_age_minutes=60, notify=True):
+        """Fetch stock data through the process-wide stock cache shared by all sessions and threads
+        
+        A fresh entry is loaded with no network call. An entry up to twice
+        max_age old is served immediately while a background refresh replaces
+        it (stale-while-revalidate), so the next rerun shows fresh data. The
+        cache locks are never held during a fetch, so screening workers run in parallel.
+        """
+        cache = get_stock_cache()
+        max_age = max_age_minutes * 60
+        entry = cache.get(symbol, max_age=max_age, require=('stock_data',))
+        
+        if entry is not None:
+            cache_age_minutes = entry.age() / 60
+            if entry.is_fresh(max_age):
+                # Use cached data
+                self._load_stock_cache_entry(symbol, entry.data)
+                if notify:
                     st.info(f"📦 Using cached data for {symbol} (cached {cache_age_minutes:.1f} minutes ago)")
-                    return True
-                elif cache_age_minutes < max_age_minutes * 2:
-                    # Use stale cached data if fresh fetch fails
-                    try:
-                        # Add throttling between requests to avoid rate limits
-                        import time
-                        import random
-                        time.sleep(random.uniform(0.3, 1.0))
-                        
-                        # Try to fetch fresh data
-                        if self.fetch_stock_data(symbol):
-                            # Cache the fresh results
-                            self._stock_cache[symbol] = ({
-                                'stock_data': self.stock_data,
-                                'stock_info': self.stock_info,
-                                'financials': self.financials,
-                                'balance_sheet': self.balance_sheet,
-                                'cashflow': self.cashflow
-                            }, current_time)
-                            return True
-                        else:
-                            # Fall back to stale data if fresh fetch fails
-                            st.warning(f"⚠️ Fresh data unavailable for {symbol}, using cached data from {cache_age_minutes:.1f} minutes ago")
-                            self.stock_data = cached_data.get('stock_data')
-                            self.stock_info = cached_data.get('stock_info')
-                            self.financials = cached_data.get('financials')
-                            self.balance_sheet = cached_data.get('balance_sheet')
-                            self.cashflow = cached_data.get('cashflow')
-                            return True
-                    except:
-                        # Fall back to stale data on any error
-                        st.warning(f"⚠️ Using cached data for {symbol} (cached {cache_age_minutes:.1f} minutes ago)")
-                        self.stock_data = cached_data.get('stock_data')
-                        self.stock_info = cached_data.get('stock_info')
-                        self.financials = cached_data.get('financials')
-                        self.balance_sheet = cached_data.get('balance_sheet')
-                        self.cashflow = cached_data.get('cashflow')
-                        return True
-            
-            # No cached data available - fetch fresh
-            # Add throttling between requests to avoid rate limits
-            import time
-            import random
-            time.sleep(random.uniform(0.3, 1.0))
-            
-            # Fetch fresh data
-            if self.fetch_stock_data(symbol):
-                # Cache the results
-                self._stock_cache[symbol] = ({
-                    'stock_data': self.stock_data,
-                    'stock_info': self.stock_info,
-                    'financials': self.financials,
-                    'balance_sheet': self.balance_sheet,
-                    'cashflow': self.cashflow
-                }, current_time)
                 return True
-            
-            return False
+            elif entry.is_fresh(max_age * 2):
+                # Serve the stale snapshot now; the refreshed entry is picked up on the next rerun
+                self._load_stock_cache_entry(symbol, entry.data)
+                cache.revalidate(symbol, lambda: ValueInvestmentAnalyzer._fetch_stock_cache_entry(symbol))
+                if notify:
+                    st.info(f"📦 Showing data for {symbol} from {cache_age_minutes:.1f} minutes ago - refreshing in the background")
+                return True
+        
+        # No cached data available - fetch fresh
+        # (throttling is handled by the shared per-endpoint rate limiters)
+        if self.fetch_stock_data(symbol):
+            # Cache the results
+            cache.put(symbol, self._stock_cache_entry())
+            return True
+        
+        return False
+    
+    @staticmethod
+    def _fetch_stock_cache_entry(symbol):
+        """Fetch a symbol on a separate analyzer (background refresh); None if the fetch fails"""
+        analyzer = ValueInvestmentAnalyzer()
+        if analyzer.fetch_stock_data(symbol):
+            return analyzer._stock_cache_entry()
+        return None
     
-    def process_single_stock_for_screening(self, symbol_data, screening_params):
-        """Process a single stock for screening - thread-safe"""
-        symbol, company_name = symbol_data
+    def score_stock_for_screening(self, symbol, company_name, screening_params):
+        """Apply the configured scorer to the already-loaded stock_info"""
         screening_type = screening_params['type']
         
+        if screening_type == 'value':
+            return self.calculate_value_score_configurable(
+                symbol, company_name, **screening_params['params']
+            )
+        elif screening_type == 'growth':
+            return self.calculate_growth_score_configurable(
+                symbol, company_name, **screening_params['params']
+            )
+        elif screening_type == 'valuegrowth':
+            return self.calculate_valuegrowth_score_configurable(
+                symbol, company_name, **screening_params['params']
+            )
+        return None
+    
+    def build_screening_snapshot(self, stock_universe, max_age=None):
+        """Columnar UniverseSnapshot of the universe from fresh stock_info in the shared stock cache"""
+        cache = get_stock_cache()
+        infos = {}
+        for symbol in stock_universe:
+            entry = cache.get(symbol, max_age=max_age, require=('stock_info',))
+            if entry is not None and entry.is_fresh(max_age):
+                infos[symbol] = entry.data['stock_info']
+        return UniverseSnapshot.from_infos(stock_universe, infos)
+    
+    def screen_snapshot(self, snapshot, screening_params, admitted=None):
+        """Rank a snapshot with the vectorized scorers in one NumPy pass
+        
+        Scores match score_stock_for_screening row for row; only the
+        SCREEN_RESULT_LIMIT ranked rows are then built by the scalar scorer,
+        for their criteria and display fields. With admitted, only those
+        symbols (the quote prefilter's survivors) are ranked.
+        """
+        temp_analyzer = ValueInvestmentAnalyzer()
+        results = []
+        for symbol in rank_snapshot(snapshot, screening_params, self.SCREEN_RESULT_LIMIT, admitted):
+            temp_analyzer.stock_info = snapshot.info(symbol)
+            result = temp_analyzer.score_stock_for_screening(
+                symbol, snapshot.frame.at[symbol, 'company'], screening_params
+            )
+            if result:
+                results.append(result)
+        return results
+    
+    @staticmethod
+    def _passes_quote_prefilter(quote, screening_params):
+        """Phase one for one symbol: a live price, a market cap in range, and P/E and P/B under the screen's maximums
+        
+        quote is a batch quote or an info dict, which carry the same fields.
+        A missing or non-numeric ratio passes and is left to the scorers.
+        """
+        if not quote or not quote.get('currentPrice'):
+            return False
+        params = (screening_params or {}).get('params', {})
+        min_market_cap = params.get('min_market_cap_millions', 0) * 1e6
+        max_market_cap_billions = params.get('max_market_cap_billions', 5000)
+        max_market_cap = max_market_cap_billions * 1e9 if max_market_cap_billions < 5000 else float('inf')
+        market_cap = quote.get('marketCap')
+        if isinstance(market_cap, (int, float)) and (market_cap < min_market_cap or market_cap > max_market_cap):
+            return False
+        for field, limit in (('trailingPE', params.get('max_pe_ratio')), ('priceToBook', params.get('max_pb_ratio'))):
+            ratio = quote.get(field)
+            if limit and isinstance(ratio, (int, float)) and ratio >= limit:
+                return False
+        return True
+    
+    def _apply_quote_prefilter(self, stock_universe, quotes, screening_params):
+        """Keep the symbols whose batch quote passes phase one (all of them when there are no quotes)"""
+        if not quotes:
+            return stock_universe
+        return {symbol: company_name for symbol, company_name in stock_universe.items()
+                if self._passes_quote_prefilter(quotes.get(symbol.upper()), screening_params)}
+    
+    def prefilter_universe_with_quotes(self, stock_universe, screening_params):
+        """Drop symbols that cannot pass screening using batched quote data
+        
+        One multi-symbol quote request covers ~50 symbols, so unknown/delisted
+        tickers and companies outside the market cap, P/E or P/B limits are
+        removed before the expensive per-symbol fetch. Falls back to the full
+        universe when batch quotes are unavailable.
+        """
+        if not self.direct_api or not stock_universe:
+            return stock_universe
+        
         try:
-            # Create a temporary analyzer instance for thread safety
-            temp_analyzer = ValueInvestmentAnalyzer()
-            
-            if temp_analyzer.fetch_stock_data_cached(symbol):
-                if screening_type == 'value':
-                    score_data = temp_analyzer.calculate_value_score_configurable(
-                        symbol, company_name, **screening_params['params']
-                    )
-                elif screening_type == 'growth':
-                    score_data = temp_analyzer.calculate_growth_score_configurable(
-                        symbol, company_name, **screening_params['params']
-                    )
-                elif screening_type == 'valuegrowth':
-                    score_data = temp_analyzer.calculate_valuegrowth_score_configurable(
-                        symbol, company_name, **screening_params['params']
-                    )
-                else:
-                    return None
-                
-                return score_data
+            quotes = self.direct_api.get_quotes(list(stock_universe.keys()))
         except Exception:
-            pass
+            return stock_universe
+        return self._apply_quote_prefilter(stock_universe, quotes, screening_params)
+    
+    def _quote_phase(self, symbols, quotes, screening_params, on_info=None):
+        """Phase one of a fetch: the symbols whose batch quote passes, reporting the rest as skipped
+        
+        Without any quotes (batch quotes unavailable) every symbol goes on to phase two.
+        """
+        if not quotes:
+            return list(symbols)
+        survivors = []
+        for symbol in symbols:
+            if self._passes_quote_prefilter(quotes.get(symbol.upper()), screening_params):
+                survivors.append(symbol)
+            elif on_info is not None:
+                on_info(symbol, None, skipped=True)
+        return survivors
+    
+    @staticmethod
+    def format_screen_report(report):
+        return (f"{report['universe']} symbols, {report['cached']} with data on hand | "
+                f"phase 1 (batch quotes): {report['phase1_survivors']} passed in {report['phase1_seconds']:.1f}s | "
+                f"phase 2 (deep fetch): {report['phase2_fetched']} fetched in {report['phase2_seconds']:.1f}s | "
+                f"data snapshot {report['snapshot_age'] / 60:.1f} minutes old, scored and ranked in "
+                f"{report['score_ms']:.0f} ms | {report['results']} ranked")
+    
+    @staticmethod
+    def _can_run_async():
+        """aiohttp is installed and no event loop is running in this thread (the normal Streamlit case)"""
+        try:
+            from yahoo_api_direct import AIOHTTP_AVAILABLE
+        except ImportError:
+            return False
+        if not AIOHTTP_AVAILABLE:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+    
+    def _screen_progress(self, stock_universe, on_progress):
+        """ScreenProgress feeding on_progress, or None when nobody is listening"""
+        if on_progress is None:
+            return None
+        return ScreenProgress(stock_universe, self.SCREEN_RESULT_LIMIT, on_progress, self.SCREEN_PROGRESS_INTERVAL)
+    
+    def _screen_listener(self, stock_universe, screening_params, on_progress):
+        """(ScreenProgress, on_info scoring each symbol as its data settles), or (None, None) with no on_progress"""
+        progress = self._screen_progress(stock_universe, on_progress)
+        if progress is None:
+            return None, None
+        temp_analyzer = ValueInvestmentAnalyzer()
+        
+        def on_info(symbol, info, cached=False, skipped=False):
+            if skipped:
+                progress.skip(1, cached=cached)
+                return
+            row = None
+            if info and self._passes_quote_prefilter(info, screening_params):
+                temp_analyzer.stock_info = info
+                try:
+                    row = temp_analyzer.score_stock_for_screening(symbol, stock_universe[symbol], screening_params)
+                except Exception:
+                    row = None
+            progress.record(symbol, row, failed=not info, cached=cached)
+        
+        return progress, on_info
+    
+    @staticmethod
+    def _screen_phases(snapshot, acquired):
+        """Per-phase counters of a screen, starting from the snapshot's own fetch when this screen made it"""
+        phases = {'cached': snapshot.covered(), 'phase1_seconds': 0.0, 'phase2_seconds': 0.0, 'phase2_fetched': 0}
+        if acquired and snapshot.acquisition:
+            phases.update(snapshot.acquisition)
+        return phases
+    
+    def _plan_admission(self, snapshot, screening_params, phases):
+        """Phase one on a snapshot: (admitted symbols, the admitted ones whose info was never fetched)
+        
+        Symbols with info are judged on it, the rest on their batch quote.
+        """
+        phase1_start = time.time()
+        admitted = [
+            symbol for symbol in snapshot.frame.index
+            if self._passes_quote_prefilter(snapshot.infos.get(symbol) or snapshot.quotes.get(symbol.upper()),
+                                            screening_params)
+        ]
+        newly_admitted = [symbol for symbol in admitted if symbol not in snapshot.fetched]
+        phases['phase1_seconds'] += time.time() - phase1_start
+        return admitted, newly_admitted
+    
+    def _finish_screen(self, snapshot, screening_params, admitted, progress, phases):
+        """Rank the admitted rows, finish the progress and record last_screen_report"""
+        score_start = time.time()
+        results = self.screen_snapshot(snapshot, screening_params, admitted)
+        if progress is not None:
+            progress.finish(results)
+        
+        self.last_screen_report = dict(
+            phases,
+            universe=len(snapshot),
+            phase1_survivors=len(admitted),
+            snapshot_covered=snapshot.covered(),
+            snapshot_age=snapshot.age(),
+            snapshot_built_at=snapshot.built_at,
+            score_ms=(time.time() - score_start) * 1000,
+            results=len(results)
+        )
+        print(f"Screen: {self.format_screen_report(self.last_screen_report)}")
+        return results
+    
+    def screen_universe(self, stock_universe, screening_params, refresh=False, on_progress=None):
+        """Two-phase screen over the universe's data snapshot; the network is used only for data it lacks
+        
+        Phase one keeps the symbols whose batch quote (or info, once fetched)
+        passes the market cap, price, P/E and P/B filters, and phase two
+        fetches info for those survivors only. The snapshot doesn't depend on
+        the thresholds: re-screening re-scores it, and looser thresholds fetch
+        just the symbols they newly admit. While data is fetched, each symbol
+        is scored as it arrives and on_progress(ScreenProgress) sees the
+        running top-N; the final call carries the batch ranking, which the
+        running top-N equals.
+        """
+        return self._run_screen(
+            stock_universe, screening_params, refresh, on_progress,
+            lambda on_info: self.get_screening_snapshot(stock_universe, refresh, on_info, screening_params),
+            lambda symbols, quotes, on_info: self._fetch_infos(symbols, quotes, refresh, on_info)
+        )
+    
+    def screen_stocks_parallel(self, stock_universe, screening_params, max_workers=8, on_progress=None,
+                               refresh=False):
+        """screen_universe with any missing data fetched on a thread pool of max_workers, not as a job"""
+        def acquire(on_info):
+            snapshot = self.acquire_screening_snapshot_parallel(
+                stock_universe, refresh, on_info, screening_params=screening_params, max_workers=max_workers
+            )
+            put_universe_snapshot(stock_universe, snapshot)
+            return snapshot
         
-        return None
+        return self._run_screen(
+            stock_universe, screening_params, refresh, on_progress, acquire,
+            lambda symbols, quotes, on_info: self._fetch_infos_parallel(symbols, quotes, refresh, max_workers, on_info)
+        )
     
-    def screen_stocks_parallel(self, stock_universe, screening_params, max_workers=8):
-        """Screen stocks in parallel for better performance"""
-        results = []
+    def screen_stocks(self, stock_universe, screening_params, on_progress=None):
+        """Run a one-off two-phase screen on the asyncio path when aiohttp is installed, else on the thread pool"""
+        if self._can_run_async():
+            return asyncio.run(self.screen_stocks_async(stock_universe, screening_params, on_progress=on_progress))
+        return self.screen_stocks_parallel(stock_universe, screening_params, on_progress=on_progress)
+    
+    def _run_screen(self, stock_universe, screening_params, refresh, on_progress, acquire, fetch):
+        """Body of the synchronous screens
+        
+        acquire(on_info) returns a new snapshot when there is no fresh one, and
+        fetch(symbols, quotes, on_info) returns {symbol: info} for phase two.
+        """
+        progress, on_info = self._screen_listener(stock_universe, screening_params, on_progress)
+        snapshot = None if refresh else get_universe_snapshot(stock_universe)
+        acquired = snapshot is None
+        if acquired:
+            snapshot = acquire(on_info)
+        
+        phases = self._screen_phases(snapshot, acquired)
+        admitted, newly_admitted = self._plan_admission(snapshot, screening_params, phases)
+        if newly_admitted:
+            phase2_start = time.time()
+            fetched = fetch(newly_admitted, snapshot.quotes, on_info)
+            snapshot = self._extended_snapshot(stock_universe, snapshot, newly_admitted, fetched)
+            phases['phase2_seconds'] += time.time() - phase2_start
+            phases['phase2_fetched'] += len(newly_admitted)
+        return self._finish_screen(snapshot, screening_params, admitted, progress, phases)
+    
+    async def screen_stocks_async(self, stock_universe, screening_params, refresh=False, max_concurrency=64,
+                                  on_progress=None):
+        """screen_universe on the running event loop, for callers that already have one (needs aiohttp)
+        
+        The same two-phase screen over the universe's shared snapshot, with
+        at most max_concurrency info requests in flight on one aiohttp session
+        instead of a thread per request. Missing data is fetched right here
+        rather than by a checkpointed screening job.
+        """
+        progress, on_info = self._screen_listener(stock_universe, screening_params, on_progress)
+        snapshot = None if refresh else get_universe_snapshot(stock_universe)
+        acquired = snapshot is None
+        if acquired:
+            snapshot = await self.acquire_screening_snapshot_async(
+                stock_universe, refresh, on_info, screening_params=screening_params, max_concurrency=max_concurrency
+            )
+            put_universe_snapshot(stock_universe, snapshot)
+        
+        phases = self._screen_phases(snapshot, acquired)
+        admitted, newly_admitted = self._plan_admission(snapshot, screening_params, phases)
+        if newly_admitted:
+            phase2_start = time.time()
+            fetched = await self._fetch_infos_async(newly_admitted, snapshot.quotes, refresh, max_concurrency, on_info)
+            snapshot = await asyncio.to_thread(self._extended_snapshot, stock_universe, snapshot, newly_admitted, fetched)
+            phases['phase2_seconds'] += time.time() - phase2_start
+            phases['phase2_fetched'] += len(newly_admitted)
+        return self._finish_screen(snapshot, screening_params, admitted, progress, phases)
+    
+    def get_screening_snapshot(self, stock_universe, refresh=False, on_info=None, screening_params=None):
+        """The universe's shared UniverseSnapshot while fresh; otherwise (or with refresh=True) fetched now
+        
+        Fetching runs as a checkpointed screening job when the job store is
+        available: this call attaches to the universe's running job (or
+        resumes an interrupted one) and waits for it, and the job carries on
+        if this session goes away. A universe larger than SCREEN_SHARD_SIZE
+        is fetched as registry shards, each with its own snapshot and job.
+        A job started here deep-fetches the survivors of screening_params;
+        one it attaches to keeps the thresholds it was started with.
+        """
+        snapshot = None if refresh else get_universe_snapshot(stock_universe)
+        if snapshot is not None:
+            return snapshot
+        
+        shards = get_universe_registry().split(stock_universe, self.SCREEN_SHARD_SIZE)
+        if len(shards) > 1:
+            snapshot = UniverseSnapshot.combine(
+                stock_universe,
+                [self.get_screening_snapshot(shard, refresh, on_info, screening_params) for shard in shards]
+            )
+            put_universe_snapshot(stock_universe, snapshot)
+        else:
+            active = start_screening_job(
+                stock_universe, lambda active, job: self._run_screening_job(active, job, screening_params), refresh
+            )
+            if active is None:
+                snapshot = self.acquire_screening_snapshot(stock_universe, refresh, on_info,
+                                                           screening_params=screening_params)
+                put_universe_snapshot(stock_universe, snapshot)
+            else:
+                self.screening_job_id = active.job_id
+                snapshot = self.wait_for_screening_job(active, on_info)
+        return snapshot
+    
+    def _run_screening_job(self, active, job, screening_params=None):
+        """Job thread: acquire the job's snapshot, checkpointing each fetched symbol and publishing it to active.events"""
+        store = get_job_store()
+        job_id = job['job_id']
+        # A refresh job only trusts its own checkpoints; any job's will do otherwise
+        preloaded = store.fresh_infos(list(job['universe']), SCREEN_JOB_TTL, job_id if job['refresh'] else None)
         
-        # Convert to list of tuples for parallel processing
-        stock_items = list(stock_universe.items())
+        # on_info may run on the fetch's event loop, so checkpoints are written on the writer's thread
+        writer = CheckpointWriter(store, job_id)
         
-        # Use ThreadPoolExecutor for parallel processing
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_stock = {
-                executor.submit(self.process_single_stock_for_screening, stock_data, screening_params): stock_data
-                for stock_data in stock_items
-            }
-            
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_stock):
+        def on_info(symbol, info, cached=False, skipped=False):
+            if not cached and not skipped:
+                writer.add(symbol, info)
+            active.events.append((symbol, info, cached, skipped))
+        
+        try:
+            snapshot = ValueInvestmentAnalyzer().acquire_screening_snapshot(
+                job['universe'], job['refresh'], on_info, preloaded=preloaded, screening_params=screening_params
+            )
+        finally:
+            writer.close()
+        put_universe_snapshot(job['universe'], snapshot)
+        return snapshot
+    
+    def wait_for_screening_job(self, active, on_info=None):
+        """Follow a job until it finishes, replaying its settled symbols through on_info on this thread
+        
+        Symbols that settled before this call are reported as cached, so an
+        attaching session's ETA counts only what is still being fetched.
+        """
+        cursor = 0
+        replayed = len(active.events)
+        while True:
+            finished = active.wait(None if on_info is None else self.SCREEN_PROGRESS_INTERVAL)
+            if on_info is not None:
+                events = active.events[cursor:]
+                for symbol, info, cached, skipped in events:
+                    on_info(symbol, info, cached=cached or cursor < replayed, skipped=skipped)
+                    cursor += 1
+            if finished:
+                break
+        if active.error is not None:
+            raise active.error
+        return active.snapshot
+    
+    @staticmethod
+    def _acquisition_report(cached):
+        return {'cached': cached, 'phase1_seconds': 0.0, 'phase2_seconds': 0.0, 'phase2_fetched': 0}
+    
+    def acquire_screening_snapshot(self, stock_universe, refresh=False, on_info=None, preloaded=None,
+                                   screening_params=None):
+        """Build the universe's UniverseSnapshot in two phases: batch quotes, then info for the survivors
+        
+        Fresh shared stock cache entries are reused unless refresh=True, which
+        also bypasses the response cache and stored info snapshots. The other
+        symbols are batch quoted (~50 a request), and only those passing the
+        quote prefilter for screening_params (with none, those with a live
+        price) have their info fetched: on the asyncio path when aiohttp is
+        installed, else on a thread pool. The snapshot keeps the other quotes.
+        on_info(symbol, info, cached=False, skipped=False) is called on this
+        thread for every symbol as it settles, with info None when there is
+        no data for it and skipped=True when phase one dropped it.
+        preloaded is {symbol: (info, fetched_at)} already in hand (e.g. job
+        checkpoints); those symbols count as cached and are not fetched.
+        """
+        if self._can_run_async():
+            return asyncio.run(self.acquire_screening_snapshot_async(
+                stock_universe, refresh, on_info, preloaded, screening_params
+            ))
+        return self.acquire_screening_snapshot_parallel(stock_universe, refresh, on_info, preloaded, screening_params)
+    
+    def acquire_screening_snapshot_parallel(self, stock_universe, refresh=False, on_info=None, preloaded=None,
+                                            screening_params=None, max_workers=8):
+        """acquire_screening_snapshot with the info requests on a thread pool of max_workers"""
+        start = time.time()
+        infos, fetched_at = self._cached_infos(stock_universe, refresh, on_info, preloaded)
+        missing = [symbol for symbol in stock_universe if symbol not in infos]
+        report = self._acquisition_report(len(infos))
+        quotes, survivors, fetched = {}, [], {}
+        if missing:
+            phase1_start = time.time()
+            if self.direct_api:
+                from yahoo_api_direct import DirectYahooFinance
                 try:
-                    result = future.result(timeout=30)  # 30 second timeout per stock
-                    if result:
-                        results.append(result)
-                except concurrent.futures.TimeoutError:
-                    continue
+                    quotes = DirectYahooFinance(refresh=refresh).get_quotes(missing)
                 except Exception:
+                    quotes = {}
+            survivors = self._quote_phase(missing, quotes, screening_params, on_info)
+            report['phase1_seconds'] = time.time() - phase1_start
+            
+            phase2_start = time.time()
+            fetched = self._fetch_infos_parallel(survivors, quotes, refresh, max_workers, on_info)
+            report['phase2_seconds'] = time.time() - phase2_start
+            report['phase2_fetched'] = len(survivors)
+        return self._acquired_snapshot(stock_universe, start, infos, fetched_at, quotes, survivors, fetched, report)
+    
+    async def acquire_screening_snapshot_async(self, stock_universe, refresh=False, on_info=None, preloaded=None,
+                                               screening_params=None, max_concurrency=64):
+        """acquire_screening_snapshot on the running event loop, with up to max_concurrency info requests in flight"""
+        from yahoo_api_direct import AsyncDirectYahooFinance
+        
+        start = time.time()
+        infos, fetched_at = self._cached_infos(stock_universe, refresh, on_info, preloaded)
+        missing = [symbol for symbol in stock_universe if symbol not in infos]
+        report = self._acquisition_report(len(infos))
+        quotes, survivors, fetched = {}, [], {}
+        if missing:
+            async with AsyncDirectYahooFinance(refresh=refresh) as api:
+                phase1_start = time.time()
+                try:
+                    quotes = await api.get_quotes(missing)
+                except Exception:
+                    quotes = {}
+                survivors = self._quote_phase(missing, quotes, screening_params, on_info)
+                report['phase1_seconds'] = time.time() - phase1_start
+                
+                phase2_start = time.time()
+                fetched = await self._fetch_infos_async(survivors, quotes, refresh, max_concurrency, on_info, api=api)
+                report['phase2_seconds'] = time.time() - phase2_start
+                report['phase2_fetched'] = len(survivors)
+        # Merging into the stock cache can demote evicted entries to disk
+        return await asyncio.to_thread(
+            self._acquired_snapshot, stock_universe, start, infos, fetched_at, quotes, survivors, fetched, report
+        )
+    
+    @staticmethod
+    def _cached_infos(stock_universe, refresh, on_info, preloaded):
+        """({symbol: info}, [fetched_at]) from preloaded and (unless refresh) the shared stock cache"""
+        cache = get_stock_cache()
+        infos = {}
+        fetched_at = [time.time()]
+        for symbol, (info, info_fetched_at) in (preloaded or {}).items():
+            if symbol in stock_universe:
+                infos[symbol] = info
+                fetched_at.append(info_fetched_at)
+                entry = cache.get(symbol, require=('stock_info',))
+                if entry is None or entry.fetched_at < info_fetched_at:
+                    cache.merge(symbol, {'stock_info': info}, fetched_at=info_fetched_at, source='checkpoint')
+                if on_info is not None:
+                    on_info(symbol, info, cached=True)
+        if not refresh:
+            for symbol in stock_universe:
+                if symbol in infos:
                     continue
+                entry = cache.get(symbol, require=('stock_info',))
+                if entry is not None and entry.is_fresh():
+                    infos[symbol] = entry.data['stock_info']
+                    fetched_at.append(entry.fetched_at)
+                    if on_info is not None:
+                        on_info(symbol, infos[symbol], cached=True)
+        return infos, fetched_at
+    
+    @staticmethod
+    def _acquired_snapshot(stock_universe, start, infos, fetched_at, quotes, survivors, fetched, report):
+        """Snapshot of cached and freshly fetched info, keeping the batch quotes of the symbols not fetched"""
+        cache = get_stock_cache()
+        for symbol, info in fetched.items():
+            cache.merge(symbol, {'stock_info': info})
+        cached = len(infos)
+        infos.update(fetched)
+        tried = set(infos) | set(survivors)
+        unfetched_quotes = {symbol.upper(): quotes[symbol.upper()] for symbol in stock_universe
+                            if symbol not in tried and symbol.upper() in quotes}
+        
+        # Dated by its oldest data, so the age shown is the age of what is scored
+        snapshot = UniverseSnapshot.from_infos(stock_universe, infos, built_at=min(fetched_at), quotes=unfetched_quotes,
+                                               fetched=tried, acquisition=report)
+        print(f"Screening snapshot: {len(infos)}/{len(stock_universe)} symbols with data ({cached} from cache, "
+              f"{len(survivors)} of {len(stock_universe) - cached} past the batch quotes) in {time.time() - start:.1f}s")
+        return snapshot
+    
+    def _fetch_infos(self, symbols, quotes=None, refresh=False, on_info=None):
+        """{symbol: info} for symbols, on the asyncio path when aiohttp is installed, else on a thread pool"""
+        if self._can_run_async():
+            return asyncio.run(self._fetch_infos_async(symbols, quotes, refresh, on_info=on_info))
+        return self._fetch_infos_parallel(symbols, quotes, refresh, on_info=on_info)
+    
+    @staticmethod
+    def _extended_snapshot(stock_universe, snapshot, symbols, fetched):
+        """Register a copy of snapshot with fetched, the info of symbols a screen newly admitted"""
+        cache = get_stock_cache()
+        for symbol, info in fetched.items():
+            cache.merge(symbol, {'stock_info': info})
+        snapshot = snapshot.extend(stock_universe, fetched, symbols)
+        put_universe_snapshot(stock_universe, snapshot)
+        return snapshot
+    
+    @staticmethod
+    def _settle_info(infos, symbol, info, on_info):
+        """Keep a fetched info dict if it has real data, and report the symbol either way"""
+        if info and len(info) >= 5:
+            infos[symbol] = info
+        if on_info is not None:
+            on_info(symbol, infos.get(symbol))
+    
+    async def _fetch_infos_async(self, symbols, quotes=None, refresh=False, max_concurrency=64, on_info=None, api=None):
+        """{symbol: info} for symbols, fetched on one event loop (on api's session when given)
+        
+        quotes are the symbols' batch quotes, overlaid on stored info snapshots.
+        """
+        if api is None:
+            from yahoo_api_direct import AsyncDirectYahooFinance
+            
+            async with AsyncDirectYahooFinance(refresh=refresh) as api:
+                return await self._fetch_infos_async(symbols, quotes, refresh, max_concurrency, on_info, api)
+        
+        quotes = quotes or {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        infos = {}
+        
+        async def fetch(symbol):
+            try:
+                async with semaphore:
+                    info = await api.get_info(symbol, quote=quotes.get(symbol.upper()))
+            except Exception:
+                info = None
+            self._settle_info(infos, symbol, info, on_info)
         
-        # Sort by score
-        score_key = 'total_score' if results and 'total_score' in results[0] else 'score'
-        results.sort(key=lambda x: x.get(score_key, 0), reverse=True)
+        await asyncio.gather(*(fetch(symbol) for symbol in symbols), return_exceptions=True)
+        return infos
+    
+    def _fetch_infos_parallel(self, symbols, quotes=None, refresh=False, max_workers=8, on_info=None):
+        """{symbol: info} for symbols, fetched on a thread pool (quotes as in _fetch_infos_async)"""
+        infos = {}
+        if not self.direct_api:
+            for symbol in symbols:
+                self._settle_info(infos, symbol, None, on_info)
+            return infos
+        from yahoo_api_direct import DirectYahooFinance
+        
+        api = DirectYahooFinance(refresh=refresh)
+        quotes = quotes or {}
         
-        return results[:50]  # Return top 50 results
+        def fetch(symbol):
+            try:
+                return symbol, api.get_info(symbol, quote=quotes.get(symbol.upper()))
+            except Exception:
+                return symbol, None
+        
+        # Settled on this thread as each fetch completes, so on_info can update the page
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fetch, symbol) for symbol in symbols]
+            for future in concurrent.futures.as_completed(futures):
+                symbol, info = future.result()
+                self._settle_info(infos, symbol, info, on_info)
+        return infos
     
     def calculate_growth_score_configurable(self, symbol, company_name, 
                                           min_market_cap_millions=100, max_market_cap_billions=5000,
@@ -2740,118 +2970,10 @@ class ValueInvestmentAnalyzer:
         except Exception:
             return None
     
-    def _get_comprehensive_stock_universe(self):
-        """Get comprehensive stock universe for screening"""
-        return {
-            # US Large Cap
-            'AAPL': 'Apple Inc.',
-            'MSFT': 'Microsoft Corporation', 
-            'GOOGL': 'Alphabet Inc.',
-            'AMZN': 'Amazon.com Inc.',
-            'NVDA': 'NVIDIA Corporation',
-            'TSLA': 'Tesla Inc.',
-            'META': 'Meta Platforms Inc.',
-            'BRK-B': 'Berkshire Hathaway Inc.',
-            'JNJ': 'Johnson & Johnson',
-            'WMT': 'Walmart Inc.',
-            'JPM': 'JPMorgan Chase & Co.',
-            'PG': 'Procter & Gamble',
-            'UNH': 'UnitedHealth Group',
-            'HD': 'Home Depot',
-            'MA': 'Mastercard Inc.',
-            'BAC': 'Bank of America',
-            'ABBV': 'AbbVie Inc.',
-            'AVGO': 'Broadcom Inc.',
-            'PFE': 'Pfizer Inc.',
-            'KO': 'Coca-Cola Company',
-            'COST': 'Costco Wholesale',
-            'PEP': 'PepsiCo Inc.',
-            'TMO': 'Thermo Fisher Scientific',
-            'ABT': 'Abbott Laboratories',
-            'CSCO': 'Cisco Systems',
-            'ACN': 'Accenture plc',
-            'LLY': 'Eli Lilly and Company',
-            'INTC': 'Intel Corporation',
-            'VZ': 'Verizon Communications',
-            'ADBE': 'Adobe Inc.',
-            'NKE': 'Nike Inc.',
-            'CRM': 'Salesforce Inc.',
-            'T': 'AT&T Inc.',
-            'MRK': 'Merck & Co.',
-            'NFLX': 'Netflix Inc.',
-            'ORCL': 'Oracle Corporation',
-            'XOM': 'Exxon Mobil Corporation',
-            'WFC': 'Wells Fargo & Company',
-            'CVX': 'Chevron Corporation',
-            'LIN': 'Linde plc',
-            'AMD': 'Advanced Micro Devices',
-            'DHR': 'Danaher Corporation',
-            'IBM': 'International Business Machines',
-            'GE': 'General Electric',
-            
-            # US Mid-Cap
-            'ZM': 'Zoom Video Communications',
-            'SQ': 'Block Inc.',
-            'ROKU': 'Roku Inc.',
-            'SHOP': 'Shopify Inc.',
-            'COIN': 'Coinbase Global Inc.',
-            'SNOW': 'Snowflake Inc.',
-            'ZS': 'Zscaler Inc.',
-            'NET': 'Cloudflare Inc.',
-            'TWLO': 'Twilio Inc.',
-            'DOCU': 'DocuSign Inc.',
-            'OKTA': 'Okta Inc.',
-            'DDOG': 'Datadog Inc.',
-            'MDB': 'MongoDB Inc.',
-            'CZR': 'Caesars Entertainment',
-            'RBLX': 'Roblox Corporation',
-            'U': 'Unity Software Inc.',
-            'PLTR': 'Palantir Technologies',
-            
-            # European Large Cap
-            'ASML.AS': 'ASML Holding N.V. (Netherlands)',
-            'SAP.DE': 'SAP SE (Germany)',
-            'NESN.SW': 'Nestlé S.A. (Switzerland)',
-            'NOVN.SW': 'Novartis AG (Switzerland)',
-            'ROG.SW': 'Roche Holding AG (Switzerland)',
-            'LVMH.PA': 'LVMH Moët Hennessy Louis Vuitton (France)',
-            'MC.PA': 'LVMH Group (France)',
-            'OR.PA': 'L\'Oréal S.A. (France)',
-            'SAN.PA': 'Sanofi S.A. (France)',
-            'TTE.PA': 'TotalEnergies SE (France)',
-            'AIR.PA': 'Airbus SE (France)',
-            'BNP.PA': 'BNP Paribas (France)',
-            'AZN.L': 'AstraZeneca PLC (UK)',
-            'SHEL.L': 'Shell plc (UK)',
-            'ULVR.L': 'Unilever PLC (UK)',
-            'BP.L': 'BP plc (UK)',
-            'VOD.L': 'Vodafone Group Plc (UK)',
-            'GSK.L': 'GSK plc (UK)',
-            'BT-A.L': 'BT Group plc (UK)',
-            'LLOY.L': 'Lloyds Banking Group (UK)',
-            'BARC.L': 'Barclays PLC (UK)',
-            'ALV.DE': 'Allianz SE (Germany)',
-            'SIE.DE': 'Siemens AG (Germany)',
-            'BAS.DE': 'BASF SE (Germany)',
-            'BMW.DE': 'Bayerische Motoren Werke AG (Germany)',
-            'VOW3.DE': 'Volkswagen AG (Germany)',
-            'ENEL.MI': 'Enel S.p.A. (Italy)',
-            'ENI.MI': 'Eni S.p.A. (Italy)',
-            'ISP.MI': 'Intesa Sanpaolo (Italy)',
-            'UCG.MI': 'UniCredit S.p.A. (Italy)',
-            'SAN.MC': 'Banco Santander (Spain)',
-            'BBVA.MC': 'Banco Bilbao Vizcaya Argentaria (Spain)',
-            'ITX.MC': 'Inditex (Spain)',
-            'IBE.MC': 'Iberdrola (Spain)',
-            'TEF.MC': 'Telefónica (Spain)',
-            'REP.MC': 'Repsol (Spain)',
-            'VIS.MC': 'Viscofan SA (Spain)'
-        }
-    
     def screen_value_stocks_configurable(self, min_market_cap_millions=100, max_market_cap_billions=5000, 
                                        max_pe_ratio=20.0, max_pb_ratio=2.0, min_roe_percent=10.0,
                                        max_debt_equity_percent=100.0, min_current_ratio=1.0, 
-                                       min_fcf_yield_percent=2.0):
+                                       min_fcf_yield_percent=2.0, on_progress=None):
         """Screen value stocks with configurable parameters - OPTIMIZED with parallel processing"""
         
         # Use comprehensive stock universe
@@ -2872,8 +2994,8 @@ class ValueInvestmentAnalyzer:
             }
         }
         
-        # Use parallel processing
-        return self.screen_stocks_parallel(stock_universe, screening_params)
+        # Re-scores the shared data snapshot; fetches only when there is no fresh one
+        return self.screen_universe(stock_universe, screening_params, on_progress=on_progress)
     
     def screen_value_stocks_configurable_old(self, min_market_cap_millions=100, max_market_cap_billions=5000, 
                                        max_pe_ratio=20.0, max_pb_ratio=2.0, min_roe_percent=10.0,
@@ -2881,184 +3003,8 @@ class ValueInvestmentAnalyzer:
                                        min_fcf_yield_percent=2.0):
         """Screen value stocks with configurable parameters - ORIGINAL (SLOW) VERSION"""
         
-        # Use the same comprehensive stock universe as the original function
-        stock_universe = {
-            # US Large Cap
-            'AAPL': 'Apple Inc.',
-            'MSFT': 'Microsoft Corporation', 
-            'GOOGL': 'Alphabet Inc.',
-            'AMZN': 'Amazon.com Inc.',
-            'TSLA': 'Tesla Inc.',
-            'NVDA': 'NVIDIA Corporation',
-            'META': 'Meta Platforms Inc.',
-            'BRK-B': 'Berkshire Hathaway',
-            'JNJ': 'Johnson & Johnson',
-            'V': 'Visa Inc.',
-            'WMT': 'Walmart Inc.',
-            'PG': 'Procter & Gamble',
-            'JPM': 'JPMorgan Chase',
-            'UNH': 'UnitedHealth Group',
-            'MA': 'Mastercard Inc.',
-            'HD': 'Home Depot Inc.',
-            'NFLX': 'Netflix Inc.',
-            'BAC': 'Bank of America',
-            'ABBV': 'AbbVie Inc.',
-            'CRM': 'Salesforce Inc.',
-            'KO': 'Coca-Cola Company',
-            'PEP': 'PepsiCo Inc.',
-            'COST': 'Costco Wholesale',
-            'AVGO': 'Broadcom Inc.',
-            'TMO': 'Thermo Fisher Scientific',
-            'CVX': 'Chevron Corporation',
-            'LLY': 'Eli Lilly and Company',
-            'ACN': 'Accenture plc',
-            'MRK': 'Merck & Co.',
-            'ABT': 'Abbott Laboratories',
-            'ORCL': 'Oracle Corporation',
-            'CSCO': 'Cisco Systems',
-            'XOM': 'Exxon Mobil Corporation',
-            'ADBE': 'Adobe Inc.',
-            'DHR': 'Danaher Corporation',
-            'VZ': 'Verizon Communications',
-            'PFE': 'Pfizer Inc.',
-            'NKE': 'NIKE Inc.',
-            'INTC': 'Intel Corporation',
-            'T': 'AT&T Inc.',
-            'COP': 'ConocoPhillips',
-            'NFLX': 'Netflix Inc.',
-            'QCOM': 'QUALCOMM Inc.',
-            'PM': 'Philip Morris International',
-            'HON': 'Honeywell International',
-            'UPS': 'United Parcel Service',
-            'LOW': 'Lowe\'s Companies',
-            'MS': 'Morgan Stanley',
-            'CAT': 'Caterpillar Inc.',
-            'IBM': 'International Business Machines',
-            'GS': 'Goldman Sachs Group',
-            'AMD': 'Advanced Micro Devices',
-            'SPGI': 'S&P Global Inc.',
-            'BLK': 'BlackRock Inc.',
-            
-            # European Large/Mid Cap  
-            'ASML.AS': 'ASML Holding (Netherlands)',
-            'SAP.DE': 'SAP SE (Germany)',
-            'NESN.SW': 'Nestlé SA (Switzerland)',
-            'NOVN.SW': 'Novartis AG (Switzerland)',
-            'ROG.SW': 'Roche Holding (Switzerland)',
-            'MC.PA': 'LVMH (France)',
-            'OR.PA': 'L\'Oréal (France)',
-            'TTE.PA': 'TotalEnergies (France)',
-            'SAN.PA': 'Sanofi (France)',
-            'AIR.PA': 'Airbus SE (France)',
-            'BN.PA': 'Danone (France)',
-            'DG.PA': 'Vinci SA (France)',
-            'BNP.PA': 'BNP Paribas (France)',
-            'RMS.PA': 'Hermès (France)',
-            'AZN.L': 'AstraZeneca (UK)',
-            'SHEL.L': 'Shell plc (UK)',
-            'BP.L': 'BP plc (UK)',
-            'ULVR.L': 'Unilever (UK)',
-            'HSBA.L': 'HSBC Holdings (UK)',
-            'DGE.L': 'Diageo (UK)',
-            'BARC.L': 'Barclays (UK)',
-            'LLOY.L': 'Lloyds Banking Group (UK)',
-            'BT-A.L': 'BT Group (UK)',
-            'TSCO.L': 'Tesco (UK)',
-            'RIO.L': 'Rio Tinto (UK)',
-            'ALV.DE': 'Allianz SE (Germany)',
-            'SIE.DE': 'Siemens AG (Germany)',
-            'BAYN.DE': 'Bayer AG (Germany)',
-            'BAS.DE': 'BASF SE (Germany)',
-            'BMW.DE': 'BMW (Germany)',
-            'VOW3.DE': 'Volkswagen (Germany)',
-            'DBK.DE': 'Deutsche Bank (Germany)',
-            'DTE.DE': 'Deutsche Telekom (Germany)',
-            'IFX.DE': 'Infineon Technologies (Germany)',
-            'ADS.DE': 'Adidas AG (Germany)',
-            'MUV2.DE': 'Munich Re (Germany)',
-            'MBG.DE': 'Mercedes-Benz Group (Germany)',
-            'FRE.DE': 'Fresenius SE (Germany)',
-            'LIN.DE': 'Linde plc (Germany)',
-            'EOAN.DE': 'E.ON SE (Germany)',
-            'RWE.DE': 'RWE AG (Germany)',
-            'CON.DE': 'Continental AG (Germany)',
-            'HEI.DE': 'HeidelbergCement (Germany)',
-            'ABBN.SW': 'ABB Ltd (Switzerland)',
-            'UHR.SW': 'Swatch Group (Switzerland)',
-            'ZURN.SW': 'Zurich Insurance (Switzerland)',
-            'CS.PA': 'AXA SA (France)',
-            'KER.PA': 'Kering SA (France)',
-            'CAP.PA': 'Capgemini SE (France)',
-            'STLA.MI': 'Stellantis (Italy)',
-            'ISP.MI': 'Intesa Sanpaolo (Italy)',
-            'UCG.MI': 'UniCredit (Italy)',
-            'ENI.MI': 'Eni S.p.A. (Italy)',
-            'G.MI': 'Assicurazioni Generali (Italy)',
-            'BBVA.MC': 'Banco Bilbao Vizcaya (Spain)',
-            'IBE.MC': 'Iberdrola SA (Spain)',
-            'TEF.MC': 'Telefónica SA (Spain)',
-            'REP.MC': 'Repsol SA (Spain)',
-            'ITX.MC': 'Inditex SA (Spain)',
-            'SAN.MC': 'Banco Santander (Spain)',
-            'NOVO-B.CO': 'Novo Nordisk (Denmark)',
-            'MAERSK-B.CO': 'A.P. Møller-Mærsk (Denmark)',
-            'CARL-B.CO': 'Carlsberg (Denmark)',
-            'NOKIA.HE': 'Nokia Corporation (Finland)',
-            'NESTE.HE': 'Neste Corporation (Finland)',
-            'VOLV-B.ST': 'Volvo AB (Sweden)',
-            'ERIC-B.ST': 'Ericsson (Sweden)',
-            'HM-B.ST': 'H&M (Sweden)',
-            'SEB-A.ST': 'Skandinaviska Enskilda (Sweden)',
-            'EQNR.OL': 'Equinor ASA (Norway)',
-            'DNB.OL': 'DNB Bank (Norway)',
-            'TEL.OL': 'Telenor ASA (Norway)',
-            'INGA.AS': 'ING Groep (Netherlands)',
-            'PHIA.AS': 'Philips (Netherlands)',
-            'HEIA.AS': 'Heineken (Netherlands)',
-            'ADYEN.AS': 'Adyen (Netherlands)',
-            'DSM.AS': 'Royal DSM (Netherlands)',
-            'AKZA.AS': 'Akzo Nobel (Netherlands)',
-            'UNA.AS': 'Unilever (Netherlands)',
-            'AD.AS': 'Ahold Delhaize (Netherlands)',
-            
-            # Additional US Mid/Small Cap Stocks (abbreviated list for this function)
-            'AMD': 'Advanced Micro Devices',
-            'PYPL': 'PayPal Holdings',
-            'AMGN': 'Amgen Inc.',
-            'GILD': 'Gilead Sciences',
-            'SBUX': 'Starbucks Corporation',
-            'ISRG': 'Intuitive Surgical',
-            'AMAT': 'Applied Materials',
-            'LRCX': 'Lam Research',
-            'ADI': 'Analog Devices',
-            'KLAC': 'KLA Corporation',
-            'MRVL': 'Marvell Technology',
-            'FTNT': 'Fortinet Inc.',
-            'PANW': 'Palo Alto Networks',
-            'CRWD': 'CrowdStrike Holdings',
-            'SNOW': 'Snowflake Inc.',
-            'NET': 'Cloudflare Inc.',
-            'DDOG': 'Datadog Inc.',
-            'ZM': 'Zoom Video',
-            'DOCU': 'DocuSign Inc.',
-            'ROKU': 'Roku Inc.',
-            'SQ': 'Block Inc.',
-            'SHOP': 'Shopify Inc.',
-            'WDAY': 'Workday Inc.',
-            'VEEV': 'Veeva Systems',
-            'NOW': 'ServiceNow Inc.',
-            'TDOC': 'Teladoc Health',
-            'FICO': 'Fair Isaac Corp',
-            'PAYC': 'Paycom Software',
-            'TEAM': 'Atlassian Corp',
-            'SPOT': 'Spotify Technology',
-            'UBER': 'Uber Technologies',
-            'DASH': 'DoorDash Inc.',
-            'ABNB': 'Airbnb Inc.',
-            'COIN': 'Coinbase Global',
-            'RBLX': 'Roblox Corporation',
-            'PLTR': 'Palantir Technologies'
-        }
+        # Use the same stock universe as the original function
+        stock_universe = get_universe_registry().universe('broad')
         
         value_scores = []
         
@@ -3198,7 +3144,7 @@ class ValueInvestmentAnalyzer:
     def screen_growth_stocks_configurable(self, min_market_cap_millions=100, max_market_cap_billions=5000,
                                         min_revenue_growth_percent=10.0, min_earnings_growth_percent=15.0,
                                         min_roe_percent=15.0, min_operating_margin_percent=10.0,
-                                        max_peg_ratio=2.0, max_ps_ratio=10.0):
+                                        max_peg_ratio=2.0, max_ps_ratio=10.0, on_progress=None):
         """Screen growth stocks with configurable parameters - OPTIMIZED with parallel processing"""
         
         # Use comprehensive stock universe
@@ -3219,8 +3165,8 @@ class ValueInvestmentAnalyzer:
             }
         }
         
-        # Use parallel processing
-        return self.screen_stocks_parallel(stock_universe, screening_params)
+        # Re-scores the shared data snapshot; fetches only when there is no fresh one
+        return self.screen_universe(stock_universe, screening_params, on_progress=on_progress)
     
     def screen_growth_stocks_configurable_old(self, min_market_cap_millions=100, max_market_cap_billions=5000,
                                         min_revenue_growth_percent=10.0, min_earnings_growth_percent=15.0,
@@ -3268,7 +3214,7 @@ class ValueInvestmentAnalyzer:
                                              min_revenue_growth_percent=8.0, min_earnings_growth_percent=10.0,
                                              max_peg_ratio=1.5, min_roe_percent=12.0, min_operating_margin_percent=8.0,
                                              min_current_ratio=1.2, max_ps_ratio=6.0, min_fcf_yield_percent=3.0,
-                                             min_gross_margin_percent=30.0):
+                                             min_gross_margin_percent=30.0, on_progress=None):
         """Screen stocks using combined value-growth criteria with configurable parameters"""
         
         # Use the expanded stock universe from the original functions
@@ -3295,124 +3241,12 @@ class ValueInvestmentAnalyzer:
             }
         }
         
-        # Use parallel processing
-        return self.screen_stocks_parallel(stock_universe, screening_params)
+        # Re-scores the shared data snapshot; fetches only when there is no fresh one
+        return self.screen_universe(stock_universe, screening_params, on_progress=on_progress)
     
     def _get_comprehensive_stock_universe(self):
-        """Get the full stock universe (helper function to avoid duplication)"""
-        return {
-            # US Large Cap
-            'AAPL': 'Apple Inc.',
-            'MSFT': 'Microsoft Corporation', 
-            'GOOGL': 'Alphabet Inc.',
-            'AMZN': 'Amazon.com Inc.',
-            'TSLA': 'Tesla Inc.',
-            'NVDA': 'NVIDIA Corporation',
-            'META': 'Meta Platforms Inc.',
-            'BRK-B': 'Berkshire Hathaway',
-            'JNJ': 'Johnson & Johnson',
-            'V': 'Visa Inc.',
-            'WMT': 'Walmart Inc.',
-            'PG': 'Procter & Gamble',
-            'JPM': 'JPMorgan Chase',
-            'UNH': 'UnitedHealth Group',
-            'MA': 'Mastercard Inc.',
-            'HD': 'Home Depot Inc.',
-            'NFLX': 'Netflix Inc.',
-            'BAC': 'Bank of America',
-            'ABBV': 'AbbVie Inc.',
-            'CRM': 'Salesforce Inc.',
-            'KO': 'Coca-Cola Company',
-            'PEP': 'PepsiCo Inc.',
-            'COST': 'Costco Wholesale',
-            'AVGO': 'Broadcom Inc.',
-            'TMO': 'Thermo Fisher Scientific',
-            'CVX': 'Chevron Corporation',
-            'LLY': 'Eli Lilly and Company',
-            'ACN': 'Accenture plc',
-            'MRK': 'Merck & Co.',
-            'ABT': 'Abbott Laboratories',
-            'ORCL': 'Oracle Corporation',
-            'CSCO': 'Cisco Systems',
-            'XOM': 'Exxon Mobil Corporation',
-            'ADBE': 'Adobe Inc.',
-            'DHR': 'Danaher Corporation',
-            'VZ': 'Verizon Communications',
-            'PFE': 'Pfizer Inc.',
-            'NKE': 'NIKE Inc.',
-            'INTC': 'Intel Corporation',
-            'T': 'AT&T Inc.',
-            'COP': 'ConocoPhillips',
-            'QCOM': 'QUALCOMM Inc.',
-            'PM': 'Philip Morris International',
-            'HON': 'Honeywell International',
-            'UPS': 'United Parcel Service',
-            'LOW': 'Lowe\'s Companies',
-            'MS': 'Morgan Stanley',
-            'CAT': 'Caterpillar Inc.',
-            'IBM': 'International Business Machines',
-            'GS': 'Goldman Sachs Group',
-            'AMD': 'Advanced Micro Devices',
-            'SPGI': 'S&P Global Inc.',
-            'BLK': 'BlackRock Inc.',
-            
-            # European Large/Mid Cap  
-            'ASML.AS': 'ASML Holding (Netherlands)',
-            'SAP.DE': 'SAP SE (Germany)',
-            'NESN.SW': 'Nestlé SA (Switzerland)',
-            'NOVN.SW': 'Novartis AG (Switzerland)',
-            'ROG.SW': 'Roche Holding (Switzerland)',
-            'MC.PA': 'LVMH (France)',
-            'OR.PA': 'L\'Oréal (France)',
-            'TTE.PA': 'TotalEnergies (France)',
-            'SAN.PA': 'Sanofi (France)',
-            'AIR.PA': 'Airbus SE (France)',
-            'BN.PA': 'Danone (France)',
-            'DG.PA': 'Vinci SA (France)',
-            'BNP.PA': 'BNP Paribas (France)',
-            'RMS.PA': 'Hermès (France)',
-            'AZN.L': 'AstraZeneca (UK)',
-            'SHEL.L': 'Shell plc (UK)',
-            'BP.L': 'BP plc (UK)',
-            'ULVR.L': 'Unilever (UK)',
-            'HSBA.L': 'HSBC Holdings (UK)',
-            'DGE.L': 'Diageo (UK)',
-            'BARC.L': 'Barclays (UK)',
-            'LLOY.L': 'Lloyds Banking Group (UK)',
-            'BT-A.L': 'BT Group (UK)',
-            'TSCO.L': 'Tesco (UK)',
-            'RIO.L': 'Rio Tinto (UK)',
-            'ALV.DE': 'Allianz SE (Germany)',
-            'SIE.DE': 'Siemens AG (Germany)',
-            'BAYN.DE': 'Bayer AG (Germany)',
-            'BAS.DE': 'BASF SE (Germany)',
-            'BMW.DE': 'BMW (Germany)',
-            'VOW3.DE': 'Volkswagen (Germany)',
-            'DBK.DE': 'Deutsche Bank (Germany)',
-            'DTE.DE': 'Deutsche Telekom (Germany)',
-            'IFX.DE': 'Infineon Technologies (Germany)',
-            'ADS.DE': 'Adidas AG (Germany)',
-            'MUV2.DE': 'Munich Re (Germany)',
-            'MBG.DE': 'Mercedes-Benz Group (Germany)',
-            
-            # Additional stocks (abbreviated for brevity)
-            'PYPL': 'PayPal Holdings',
-            'AMGN': 'Amgen Inc.',
-            'SBUX': 'Starbucks Corporation',
-            'ISRG': 'Intuitive Surgical',
-            'AMAT': 'Applied Materials',
-            'LRCX': 'Lam Research',
-            'FTNT': 'Fortinet Inc.',
-            'PANW': 'Palo Alto Networks',
-            'CRWD': 'CrowdStrike Holdings',
-            'SNOW': 'Snowflake Inc.',
-            'ZM': 'Zoom Video',
-            'SHOP': 'Shopify Inc.',
-            'NOW': 'ServiceNow Inc.',
-            'UBER': 'Uber Technologies',
-            'ABNB': 'Airbnb Inc.',
-            'PLTR': 'Palantir Technologies'
-        }
+        """The configurable screens' universe: the registry's core list"""
+        return get_universe_registry().universe('core')
     
     def calculate_valuegrowth_score_configurable(self, symbol, company_name, min_market_cap_millions, max_market_cap_billions,
                                                max_pe_ratio, max_pb_ratio, max_debt_equity_percent,
@@ -3875,375 +3709,8 @@ class ValueInvestmentAnalyzer:
     def screen_growth_stocks(self):
         """Screen and rank best growth stocks from large and medium cap US/European markets"""
         
-        # Use the same comprehensive stock universe as value screening
-        stock_universe = {
-            # US Large Cap
-            'AAPL': 'Apple Inc.',
-            'MSFT': 'Microsoft Corporation', 
-            'GOOGL': 'Alphabet Inc.',
-            'AMZN': 'Amazon.com Inc.',
-            'TSLA': 'Tesla Inc.',
-            'NVDA': 'NVIDIA Corporation',
-            'META': 'Meta Platforms Inc.',
-            'BRK-B': 'Berkshire Hathaway',
-            'JNJ': 'Johnson & Johnson',
-            'V': 'Visa Inc.',
-            'WMT': 'Walmart Inc.',
-            'PG': 'Procter & Gamble',
-            'JPM': 'JPMorgan Chase',
-            'UNH': 'UnitedHealth Group',
-            'MA': 'Mastercard Inc.',
-            'HD': 'Home Depot Inc.',
-            'NFLX': 'Netflix Inc.',
-            'BAC': 'Bank of America',
-            'ABBV': 'AbbVie Inc.',
-            'CRM': 'Salesforce Inc.',
-            'KO': 'Coca-Cola Company',
-            'PEP': 'PepsiCo Inc.',
-            'COST': 'Costco Wholesale',
-            'AVGO': 'Broadcom Inc.',
-            'TMO': 'Thermo Fisher Scientific',
-            'CVX': 'Chevron Corporation',
-            'LLY': 'Eli Lilly and Company',
-            'ACN': 'Accenture plc',
-            'MRK': 'Merck & Co.',
-            'ABT': 'Abbott Laboratories',
-            'ORCL': 'Oracle Corporation',
-            'CSCO': 'Cisco Systems',
-            'XOM': 'Exxon Mobil Corporation',
-            'ADBE': 'Adobe Inc.',
-            'DHR': 'Danaher Corporation',
-            'VZ': 'Verizon Communications',
-            'PFE': 'Pfizer Inc.',
-            'NKE': 'NIKE Inc.',
-            'INTC': 'Intel Corporation',
-            'T': 'AT&T Inc.',
-            'COP': 'ConocoPhillips',
-            'QCOM': 'QUALCOMM Inc.',
-            'PM': 'Philip Morris International',
-            'HON': 'Honeywell International',
-            'UPS': 'United Parcel Service',
-            'LOW': 'Lowe\'s Companies',
-            'MS': 'Morgan Stanley',
-            'CAT': 'Caterpillar Inc.',
-            'GS': 'Goldman Sachs Group',
-            'AMD': 'Advanced Micro Devices',
-            'IBM': 'International Business Machines',
-            'SPGI': 'S&P Global Inc.',
-            'BLK': 'BlackRock Inc.',
-            
-            # European Large/Mid Cap
-            'ASML.AS': 'ASML Holding (Netherlands)',
-            'SAP.DE': 'SAP SE (Germany)',
-            'NESN.SW': 'Nestlé SA (Switzerland)',
-            'NOVN.SW': 'Novartis AG (Switzerland)',
-            'ROG.SW': 'Roche Holding (Switzerland)',
-            'MC.PA': 'LVMH (France)',
-            'OR.PA': 'L\'Oréal (France)',
-            'TTE.PA': 'TotalEnergies (France)',
-            'SAN.PA': 'Sanofi (France)',
-            'AIR.PA': 'Airbus SE (France)',
-            'BN.PA': 'Danone (France)',
-            'DG.PA': 'Vinci SA (France)',
-            'BNP.PA': 'BNP Paribas (France)',
-            'RMS.PA': 'Hermès (France)',
-            'AZN.L': 'AstraZeneca (UK)',
-            'SHEL.L': 'Shell plc (UK)',
-            'BP.L': 'BP plc (UK)',
-            'ULVR.L': 'Unilever (UK)',
-            'HSBA.L': 'HSBC Holdings (UK)',
-            'DGE.L': 'Diageo (UK)',
-            'BARC.L': 'Barclays (UK)',
-            'LLOY.L': 'Lloyds Banking Group (UK)',
-            'BT-A.L': 'BT Group (UK)',
-            'TSCO.L': 'Tesco (UK)',
-            'RIO.L': 'Rio Tinto (UK)',
-            'ALV.DE': 'Allianz SE (Germany)',
-            'SIE.DE': 'Siemens AG (Germany)',
-            'BAYN.DE': 'Bayer AG (Germany)',
-            'BAS.DE': 'BASF SE (Germany)',
-            'BMW.DE': 'BMW (Germany)',
-            'VOW3.DE': 'Volkswagen (Germany)',
-            'DBK.DE': 'Deutsche Bank (Germany)',
-            'DTE.DE': 'Deutsche Telekom (Germany)',
-            'IFX.DE': 'Infineon Technologies (Germany)',
-            'ADS.DE': 'Adidas AG (Germany)',
-            'MUV2.DE': 'Munich Re (Germany)',
-            'MBG.DE': 'Mercedes-Benz Group (Germany)',
-            'FRE.DE': 'Fresenius SE (Germany)',
-            'LIN.DE': 'Linde plc (Germany)',
-            'EOAN.DE': 'E.ON SE (Germany)',
-            'RWE.DE': 'RWE AG (Germany)',
-            'CON.DE': 'Continental AG (Germany)',
-            'HEI.DE': 'HeidelbergCement (Germany)',
-            'ABBN.SW': 'ABB Ltd (Switzerland)',
-            'UHR.SW': 'Swatch Group (Switzerland)',
-            'ZURN.SW': 'Zurich Insurance (Switzerland)',
-            'CS.PA': 'AXA SA (France)',
-            'KER.PA': 'Kering SA (France)',
-            'CAP.PA': 'Capgemini SE (France)',
-            'STLA.MI': 'Stellantis (Italy)',
-            'ISP.MI': 'Intesa Sanpaolo (Italy)',
-            'UCG.MI': 'UniCredit (Italy)',
-            'ENI.MI': 'Eni S.p.A. (Italy)',
-            'G.MI': 'Assicurazioni Generali (Italy)',
-            'BBVA.MC': 'Banco Bilbao Vizcaya (Spain)',
-            'IBE.MC': 'Iberdrola SA (Spain)',
-            'TEF.MC': 'Telefónica SA (Spain)',
-            'REP.MC': 'Repsol SA (Spain)',
-            'ITX.MC': 'Inditex SA (Spain)',
-            'SAN.MC': 'Banco Santander (Spain)',
-            'NOVO-B.CO': 'Novo Nordisk (Denmark)',
-            'MAERSK-B.CO': 'A.P. Møller-Mærsk (Denmark)',
-            'CARL-B.CO': 'Carlsberg (Denmark)',
-            'NOKIA.HE': 'Nokia Corporation (Finland)',
-            'NESTE.HE': 'Neste Corporation (Finland)',
-            'VOLV-B.ST': 'Volvo AB (Sweden)',
-            'ERIC-B.ST': 'Ericsson (Sweden)',
-            'HM-B.ST': 'H&M (Sweden)',
-            'SEB-A.ST': 'Skandinaviska Enskilda (Sweden)',
-            'EQNR.OL': 'Equinor ASA (Norway)',
-            'DNB.OL': 'DNB Bank (Norway)',
-            'TEL.OL': 'Telenor ASA (Norway)',
-            'INGA.AS': 'ING Groep (Netherlands)',
-            'PHIA.AS': 'Philips (Netherlands)',
-            'HEIA.AS': 'Heineken (Netherlands)',
-            'ADYEN.AS': 'Adyen (Netherlands)',
-            'DSM.AS': 'Royal DSM (Netherlands)',
-            'AKZA.AS': 'Akzo Nobel (Netherlands)',
-            'UNA.AS': 'Unilever (Netherlands)',
-            'AD.AS': 'Ahold Delhaize (Netherlands)',
-            
-            # Additional US Mid/Small Cap Stocks (copy from value screening)
-            'AMD': 'Advanced Micro Devices',
-            'CRM': 'Salesforce Inc.',
-            'PYPL': 'PayPal Holdings',
-            'AMGN': 'Amgen Inc.',
-            'GILD': 'Gilead Sciences',
-            'SBUX': 'Starbucks Corporation',
-            'ISRG': 'Intuitive Surgical',
-            'AMAT': 'Applied Materials',
-            'LRCX': 'Lam Research',
-            'ADI': 'Analog Devices',
-            'KLAC': 'KLA Corporation',
-            'MRVL': 'Marvell Technology',
-            'FTNT': 'Fortinet Inc.',
-            'PANW': 'Palo Alto Networks',
-            'CRWD': 'CrowdStrike Holdings',
-            'SNOW': 'Snowflake Inc.',
-            'NET': 'Cloudflare Inc.',
-            'DDOG': 'Datadog Inc.',
-            'ZM': 'Zoom Video',
-            'DOCU': 'DocuSign Inc.',
-            'PTON': 'Peloton Interactive',
-            'ROKU': 'Roku Inc.',
-            'SQ': 'Block Inc.',
-            'TWLO': 'Twilio Inc.',
-            'OKTA': 'Okta Inc.',
-            'SHOP': 'Shopify Inc.',
-            'WDAY': 'Workday Inc.',
-            'VEEV': 'Veeva Systems',
-            'SPLK': 'Splunk Inc.',
-            'NOW': 'ServiceNow Inc.',
-            'MDB': 'MongoDB Inc.',
-            'ZS': 'Zscaler Inc.',
-            'TDOC': 'Teladoc Health',
-            'FICO': 'Fair Isaac Corp',
-            'PAYC': 'Paycom Software',
-            'RNG': 'RingCentral Inc.',
-            'TEAM': 'Atlassian Corp',
-            'SPOT': 'Spotify Technology',
-            'UBER': 'Uber Technologies',
-            'LYFT': 'Lyft Inc.',
-            'DASH': 'DoorDash Inc.',
-            'ABNB': 'Airbnb Inc.',
-            'COIN': 'Coinbase Global',
-            'RBLX': 'Roblox Corporation',
-            'U': 'Unity Software',
-            'PATH': 'UiPath Inc.',
-            'PLTR': 'Palantir Technologies',
-            'RIVN': 'Rivian Automotive',
-            'LCID': 'Lucid Group Inc.',
-            
-            # Additional European Stocks (copy from value screening)
-            'ASME.L': 'ASOS plc (UK)',
-            'JET2.L': 'Jet2 plc (UK)',
-            'EXPN.L': 'Experian plc (UK)',
-            'REL.L': 'RELX plc (UK)',
-            'IMB.L': 'Imperial Brands (UK)',
-            'GLEN.L': 'Glencore plc (UK)',
-            'ANTO.L': 'Antofagasta plc (UK)',
-            'FRES.L': 'Fresnillo plc (UK)',
-            'POLY.L': 'Polymetal International (UK)',
-            'EVR.L': 'Evraz plc (UK)',
-            'PRU.L': 'Prudential plc (UK)',
-            'LGEN.L': 'Legal & General (UK)',
-            'AVVA.L': 'Aviva plc (UK)',
-            'RSA.L': 'RSA Insurance Group (UK)',
-            'SSE.L': 'SSE plc (UK)',
-            'NG.L': 'National Grid plc (UK)',
-            'UU.L': 'United Utilities (UK)',
-            'SVT.L': 'Severn Trent (UK)',
-            'BDEV.L': 'Barratt Developments (UK)',
-            'PSN.L': 'Persimmon plc (UK)',
-            'TW.L': 'Taylor Wimpey (UK)',
-            'CRDA.L': 'Croda International (UK)',
-            'CCH.L': 'Coca-Cola HBC (UK)',
-            'SBRY.L': 'J Sainsbury plc (UK)',
-            'MRW.L': 'Morrison (WM) Supermarkets (UK)',
-            'OCDO.L': 'Ocado Group (UK)',
-            'JD.L': 'JD Sports Fashion (UK)',
-            'FERG.L': 'Ferguson plc (UK)',
-            'CRH.L': 'CRH plc (UK)',
-            'SMDS.L': 'DS Smith plc (UK)',
-            'MNDI.L': 'Mondi plc (UK)',
-            'WPP.L': 'WPP plc (UK)',
-            'ITV.L': 'ITV plc (UK)',
-            'TALK.L': 'TalkTalk Telecom (UK)',
-            'VOD.L': 'Vodafone Group (UK)',
-            
-            # German Mid Cap
-            'ZAL.DE': 'Zalando SE (Germany)',
-            'DHER.DE': 'Delivery Hero (Germany)',
-            'PUM.DE': 'Puma SE (Germany)',
-            'LHA.DE': 'Lufthansa (Germany)',
-            'TKA.DE': 'ThyssenKrupp (Germany)',
-            'MTX.DE': 'MTU Aero Engines (Germany)',
-            'SOW.DE': 'Software AG (Germany)',
-            'RHM.DE': 'Rheinmetall (Germany)',
-            'SRT3.DE': 'Sartorius (Germany)',
-            'QIA.DE': 'Qiagen (Germany)',
-            'SAZ.DE': 'SAF-HOLLAND (Germany)',
-            'WAF.DE': 'Wirecard AG (Germany)',
-            'FNTN.DE': 'freenet AG (Germany)',
-            'O2D.DE': '1&1 AG (Germany)',
-            'TEG.DE': 'TAG Immobilien (Germany)',
-            'VNA.DE': 'Vonovia SE (Germany)',
-            'LEG.DE': 'LEG Immobilien (Germany)',
-            'DWS.DE': 'DWS Group (Germany)',
-            'BOSS.DE': 'Hugo Boss (Germany)',
-            'HNR1.DE': 'Hannover Re (Germany)',
-            
-            # French Mid Cap
-            'UG.PA': 'Peugeot SA (France)',
-            'RNO.PA': 'Renault SA (France)',
-            'STM.PA': 'STMicroelectronics (France)',
-            'CAP.PA': 'Capgemini SE (France)',
-            'ATO.PA': 'Atos SE (France)',
-            'CS.PA': 'AXA SA (France)',
-            'BNP.PA': 'BNP Paribas (France)',
-            'GLE.PA': 'Société Générale (France)',
-            'CA.PA': 'Carrefour SA (France)',
-            'RF.PA': 'Eurofins Scientific (France)',
-            'DSY.PA': 'Dassault Systèmes (France)',
-            'UBI.PA': 'Ubisoft Entertainment (France)',
-            'ML.PA': 'Michelin (France)',
-            'RI.PA': 'Pernod Ricard (France)',
-            'VIE.PA': 'Veolia Environment (France)',
-            'SGO.PA': 'Saint-Gobain (France)',
-            'PUB.PA': 'Publicis Groupe (France)',
-            'VIV.PA': 'Vivendi SE (France)',
-            'ORA.PA': 'Orange SA (France)',
-            'EN.PA': 'Bouygues SA (France)',
-            
-            # Swiss Mid Cap
-            'CFR.SW': 'Compagnie Financière Richemont (Switzerland)',
-            'GIVN.SW': 'Givaudan SA (Switzerland)',
-            'SLHN.SW': 'Swiss Life Holding (Switzerland)',
-            'SCMN.SW': 'Swisscom AG (Switzerland)',
-            'SGSN.SW': 'SGS SA (Switzerland)',
-            'LONN.SW': 'Lonza Group (Switzerland)',
-            'GEBN.SW': 'Geberit AG (Switzerland)',
-            'SIKA.SW': 'Sika AG (Switzerland)',
-            'STMN.SW': 'Straumann Holding (Switzerland)',
-            'CSGN.SW': 'Credit Suisse Group (Switzerland)',
-            
-            # Nordic Stocks
-            'ATCO-A.ST': 'Atlas Copco (Sweden)',
-            'SAND.ST': 'Sandvik AB (Sweden)',
-            'SKF-B.ST': 'SKF AB (Sweden)',
-            'ALFA.ST': 'Alfa Laval (Sweden)',
-            'INVE-B.ST': 'Investor AB (Sweden)',
-            'SWED-A.ST': 'Swedbank AB (Sweden)',
-            'SHB-A.ST': 'Svenska Handelsbanken (Sweden)',
-            'NDA-SE.ST': 'Nordea Bank (Sweden)',
-            'TELIA.ST': 'Telia Company (Sweden)',
-            'HEXA-B.ST': 'Hexagon AB (Sweden)',
-            'EQT.ST': 'EQT AB (Sweden)',
-            'KINV-B.ST': 'Kinnevik AB (Sweden)',
-            'ELUX-B.ST': 'Electrolux AB (Sweden)',
-            'HUSQ-B.ST': 'Husqvarna AB (Sweden)',
-            'SSAB-A.ST': 'SSAB AB (Sweden)',
-            'STORA.ST': 'Stora Enso (Finland)',
-            'FORTUM.HE': 'Fortum Oyj (Finland)',
-            'KNEBV.HE': 'Kone Oyj (Finland)',
-            'ORNBV.HE': 'Orion Oyj (Finland)',
-            'SAMPO.HE': 'Sampo Oyj (Finland)',
-            'TIETO.HE': 'Tietoevry Oyj (Finland)',
-            'YAR.OL': 'Yara International (Norway)',
-            'ORK.OL': 'Orkla ASA (Norway)',
-            'MOWI.OL': 'Mowi ASA (Norway)',
-            'NHY.OL': 'Norsk Hydro (Norway)',
-            'STB.OL': 'Storebrand ASA (Norway)',
-            
-            # Dutch Mid Cap
-            'BESI.AS': 'BE Semiconductor Industries (Netherlands)',
-            'SBMO.AS': 'SBM Offshore (Netherlands)',
-            'AMG.AS': 'AMG Advanced Metallurgical (Netherlands)',
-            'APAM.AS': 'Aperam SA (Netherlands)',
-            'KPN.AS': 'Koninklijke KPN (Netherlands)',
-            'AALB.AS': 'Aalberts NV (Netherlands)',
-            'FAGR.AS': 'Flow Traders (Netherlands)',
-            'GLPG.AS': 'Galapagos NV (Netherlands)',
-            'IMCD.AS': 'IMCD NV (Netherlands)',
-            'JDE.AS': 'JDE Peet''s NV (Netherlands)',
-            'NN.AS': 'NN Group NV (Netherlands)',
-            'PRX.AS': 'Prosus NV (Netherlands)',
-            'RAND.AS': 'Randstad NV (Netherlands)',
-            'TKWY.AS': 'Just Eat Takeaway (Netherlands)',
-            'VPK.AS': 'Vopak NV (Netherlands)',
-            'WKL.AS': 'Wolters Kluwer (Netherlands)',
-            
-            # Italian Mid Cap
-            'RACE.MI': 'Ferrari NV (Italy)',
-            'CNHI.MI': 'CNH Industrial (Italy)',
-            'TIT.MI': 'Telecom Italia (Italy)',
-            'MB.MI': 'Mediobanca (Italy)',
-            'UBI.MI': 'Unione di Banche Italiane (Italy)',
-            'ATL.MI': 'Atlantia SpA (Italy)',
-            'SPM.MI': 'Saipem SpA (Italy)',
-            'TEN.MI': 'Tenaris SA (Italy)',
-            'ENEL.MI': 'Enel SpA (Italy)',
-            'A2A.MI': 'A2A SpA (Italy)',
-            'TERNA.MI': 'Terna SpA (Italy)',
-            'SRG.MI': 'Snam SpA (Italy)',
-            'PRY.MI': 'Prysmian SpA (Italy)',
-            'LUX.MI': 'Luxottica Group (Italy)',
-            'MONC.MI': 'Moncler SpA (Italy)',
-            'FCA.MI': 'Fiat Chrysler (Italy)',
-            
-            # Spanish Mid Cap
-            'AMS.MC': 'Amadeus IT Group (Spain)',
-            'ACX.MC': 'Acerinox SA (Spain)',
-            'ANA.MC': 'Acciona SA (Spain)',
-            'CABK.MC': 'CaixaBank SA (Spain)',
-            'COL.MC': 'Inmobiliaria Colonial (Spain)',
-            'ELE.MC': 'Endesa SA (Spain)',
-            'ENG.MC': 'Enagás SA (Spain)',
-            'FER.MC': 'Ferrovial SA (Spain)',
-            'GAS.MC': 'Naturgy Energy (Spain)',
-            'IAG.MC': 'International Airlines Group (Spain)',
-            'IDR.MC': 'Indra Sistemas (Spain)',
-            'LOG.MC': 'Logista SA (Spain)',
-            'MAP.MC': 'Mapfre SA (Spain)',
-            'MRL.MC': 'Merlin Properties (Spain)',
-            'MTS.MC': 'ArcelorMittal SA (Spain)',
-            'PHM.MC': 'Pharma Mar SA (Spain)',
-            'RED.MC': 'Red Eléctrica (Spain)',
-            'SAB.MC': 'Banco Sabadell (Spain)',
-            'SGRE.MC': 'Siemens Gamesa (Spain)',
-            'VIS.MC': 'Viscofan SA (Spain)'
-        }
+        # Use the same stock universe as value screening
+        stock_universe = get_universe_registry().universe('broad')
         
         growth_scores = []
         
@@ -4266,82 +3733,8 @@ class ValueInvestmentAnalyzer:
     def screen_valuegrowth_stocks(self):
         """Screen and rank stocks using combined value-growth criteria (GARP strategy)"""
         
-        # Use the same comprehensive stock universe as value screening
-        stock_universe = {
-            # US Large Cap
-            'AAPL': 'Apple Inc.',
-            'MSFT': 'Microsoft Corporation', 
-            'GOOGL': 'Alphabet Inc.',
-            'AMZN': 'Amazon.com Inc.',
-            'TSLA': 'Tesla Inc.',
-            'NVDA': 'NVIDIA Corporation',
-            'META': 'Meta Platforms Inc.',
-            'BRK-B': 'Berkshire Hathaway',
-            'JNJ': 'Johnson & Johnson',
-            'V': 'Visa Inc.',
-            'WMT': 'Walmart Inc.',
-            'PG': 'Procter & Gamble',
-            'JPM': 'JPMorgan Chase',
-            'UNH': 'UnitedHealth Group',
-            'MA': 'Mastercard Inc.',
-            'HD': 'The Home Depot',
-            'CVX': 'Chevron Corporation',
-            'LLY': 'Eli Lilly and Company',
-            'ABBV': 'AbbVie Inc.',
-            'AVGO': 'Broadcom Inc.',
-            'PFE': 'Pfizer Inc.',
-            'KO': 'The Coca-Cola Company',
-            'COST': 'Costco Wholesale',
-            'ORCL': 'Oracle Corporation',
-            'ACN': 'Accenture plc',
-            'ADBE': 'Adobe Inc.',
-            'NKE': 'NIKE Inc.',
-            'TMO': 'Thermo Fisher Scientific',
-            'PEP': 'PepsiCo Inc.',
-            'CRM': 'Salesforce Inc.',
-            
-            # German DAX
-            'SAP.DE': 'SAP SE',
-            'ASML.AS': 'ASML Holding',
-            'ALV.DE': 'Allianz SE',
-            'SIE.DE': 'Siemens AG',
-            'BAYN.DE': 'Bayer AG',
-            'BAS.DE': 'BASF SE',
-            'IFX.DE': 'Infineon Technologies',
-            'DTE.DE': 'Deutsche Telekom',
-            'BMW.DE': 'BMW AG',
-            'MBG.DE': 'Mercedes-Benz Group',
-            'ADS.DE': 'Adidas AG',
-            'MUV2.DE': 'Munich Re',
-            'DBK.DE': 'Deutsche Bank',
-            'CON.DE': 'Continental AG',
-            'VOW3.DE': 'Volkswagen AG',
-            'LIN.DE': 'Linde plc',
-            
-            # French CAC 40
-            'MC.PA': 'LVMH',
-            'OR.PA': 'LOreal',
-            'SAN.PA': 'Sanofi',
-            'ASML.PA': 'ASML Holding (Paris)',
-            'TTE.PA': 'TotalEnergies',
-            'BNP.PA': 'BNP Paribas',
-            'SAF.PA': 'Safran',
-            'EL.PA': 'EssilorLuxottica',
-            'AIR.PA': 'Airbus',
-            'DG.PA': 'Vinci',
-            
-            # UK FTSE 100
-            'SHEL.L': 'Shell plc',
-            'AZN.L': 'AstraZeneca',
-            'ULVR.L': 'Unilever',
-            'HSBA.L': 'HSBC Holdings',
-            'BP.L': 'BP plc',
-            'GSK.L': 'GSK plc',
-            'VOD.L': 'Vodafone Group',
-            'DGE.L': 'Diageo',
-            'RIO.L': 'Rio Tinto',
-            'LLOY.L': 'Lloyds Banking Group',
-        }
+        # Value-growth (GARP) candidates from the universe registry
+        stock_universe = get_universe_registry().universe('garp')
         
         valuegrowth_scores = []
         
@@ -4788,12 +4181,15 @@ class ValueInvestmentAnalyzer:
         return display_currency, currency_symbol, conversion_rate
     
     def get_currency_conversion_rate(self, from_currency, to_currency):
-        """Get currency conversion rate (simplified implementation)"""
+        """Get currency conversion rate (live Yahoo FX quote, shared across sessions)"""
         if from_currency == to_currency:
             return 1.0
         
-        # Simplified conversion rates (in real app, would fetch from API)
-        # These are approximate rates - in production, use live exchange rates
+        rate = fetch_fx_rate_shared(from_currency, to_currency)
+        if rate:
+            return rate
+        
+        # Approximate fallback rates when no FX quote is available
         conversion_rates = {
             ('USD', 'EUR'): 0.85,
             ('EUR', 'USD'): 1.18,
@@ -5890,7 +5286,7 @@ def individual_stock_analysis():
     
     if symbol:
         with st.spinner(f"Fetching data for {symbol}..."):
-            if analyzer.fetch_stock_data(symbol):
+            if analyzer.fetch_stock_data_cached(symbol, notify=False):
                 
                 if analyzer.stock_info:
                     # Get currency info for the stock
@@ -7718,50 +7114,132 @@ def stock_screening():
     if 'screening_filters_used' not in st.session_state:
         st.session_state.screening_filters_used = None
 
-    # Run screening button
+    # Current filters, compared with the ones behind the saved results
+    current_filters = {
+        'screening_type': screening_type,
+        'min_market_cap': min_market_cap,
+        'max_market_cap': max_market_cap
+    }
+    if screening_type == "Value Stocks":
+        current_filters.update({
+            'max_pe_ratio': max_pe_ratio,
+            'max_pb_ratio': max_pb_ratio,
+            'min_roe': min_roe,
+            'max_debt_equity': max_debt_equity,
+            'min_current_ratio': min_current_ratio,
+            'min_fcf_yield': min_fcf_yield
+        })
+    elif screening_type == "Growth Stocks":
+        current_filters.update({
+            'min_revenue_growth': min_revenue_growth,
+            'min_earnings_growth': min_earnings_growth,
+            'min_roe': min_roe,
+            'min_operating_margin': min_operating_margin,
+            'max_peg_ratio': max_peg_ratio,
+            'max_ps_ratio': max_ps_ratio
+        })
+    else:  # ValueGrowth Stocks
+        current_filters.update({
+            'max_pe_ratio': max_pe_ratio,
+            'max_pb_ratio': max_pb_ratio,
+            'max_debt_equity': max_debt_equity,
+            'min_revenue_growth': min_revenue_growth,
+            'min_earnings_growth': min_earnings_growth,
+            'max_peg_ratio': max_peg_ratio,
+            'min_roe': min_roe,
+            'min_operating_margin': min_operating_margin,
+            'min_current_ratio': min_current_ratio,
+            'max_ps_ratio': max_ps_ratio,
+            'min_fcf_yield': min_fcf_yield,
+            'min_gross_margin': min_gross_margin
+        })
+    
+    # Data snapshot: fetched once per universe and shared by all sessions, so
+    # changing thresholds only re-scores it
+    screening_universe = analyzer._get_comprehensive_stock_universe()
+    snapshot = get_universe_snapshot(screening_universe, max_age=float('inf'))
+    snapshot_fresh = snapshot is not None and snapshot.is_fresh()
+    
+    # An unfinished screening job for this universe (running in any session,
+    # or cut off by a restart) is attached to or resumed by the next screen
+    job_store = get_job_store()
+    pending_job = None
+    if not snapshot_fresh and job_store is not None:
+        pending_job = job_store.unfinished_job(universe_key(screening_universe))
+    
     st.markdown("---")
-    if st.button("🔍 Run Configurable Stock Screening", type="primary"):
-        with st.spinner(f"Analyzing {screening_type.lower()} with your custom parameters..."):
+    col_snapshot, col_refresh = st.columns([3, 1])
+    with col_snapshot:
+        if snapshot_fresh:
+            st.caption(f"📦 Data snapshot: {len(snapshot)} symbols, {snapshot.covered()} with full data, "
+                       f"{snapshot.age() / 60:.1f} minutes old - changing parameters re-scores it and fetches "
+                       f"only symbols that newly pass the market cap, P/E and P/B filters")
+        elif snapshot is not None:
+            st.caption(f"📦 Data snapshot is {snapshot.age() / 60:.0f} minutes old - the next screen fetches fresh data")
+        else:
+            st.caption("📦 No data snapshot yet - the first screen batch quotes the whole universe and fetches "
+                       "full data for the symbols that pass")
+        if pending_job is not None:
+            job_status = job_state(pending_job)
+            st.caption(f"🧾 Screening job {pending_job['job_id']} is {job_status}: "
+                       f"{pending_job['checkpointed']}/{pending_job['total']} symbols checkpointed - "
+                       f"running a screen {'attaches to' if job_status == 'running' else 'resumes'} it")
+    with col_refresh:
+        refresh_data = st.button("🔄 Refresh Data", help="Fetch fresh data for the whole screening universe")
+    
+    if refresh_data:
+        with st.spinner(f"Fetching fresh data for {len(screening_universe)} symbols..."):
+            snapshot = analyzer.get_screening_snapshot(screening_universe, refresh=True)
+            snapshot_fresh = True
+    
+    # Saved results are re-scored without any fetching when only the
+    # thresholds (or the snapshot) changed since they were computed
+    rescore = (
+        snapshot_fresh
+        and st.session_state.screening_results is not None
+        and (current_filters != st.session_state.screening_filters_used
+             or st.session_state.get('screening_snapshot_built_at') != snapshot.built_at)
+    )
+    
+    # A reconnecting browser keeps its job in the URL and re-attaches to it
+    attach_job = pending_job is not None and st.query_params.get('screen_job') == pending_job['job_id']
+    
+    # Run screening button
+    if st.button("🔍 Run Configurable Stock Screening", type="primary") or rescore or attach_job:
+        spinner_text = ("Re-scoring the data snapshot..." if snapshot_fresh
+                        else f"Analyzing {screening_type.lower()} with your custom parameters...")
+        
+        # Live view while data is fetched: symbols are scored as they arrive
+        # and the leaders so far are shown until the final ranking replaces them
+        live_progress = st.empty()
+        live_table = st.empty()
+        
+        def show_progress(progress):
+            if progress.done:
+                live_progress.empty()
+                live_table.empty()
+                if 'screen_job' in st.query_params:
+                    del st.query_params['screen_job']
+                return
+            if analyzer.screening_job_id and st.query_params.get('screen_job') != analyzer.screening_job_id:
+                st.query_params['screen_job'] = analyzer.screening_job_id
+            eta = progress.eta()
+            eta_text = "estimating time left" if eta is None else f"~{eta:.0f}s left"
+            live_progress.progress(
+                progress.fraction(),
+                text=(f"{progress.processed}/{progress.total} symbols processed · {progress.failed} failed · "
+                      f"{progress.scored} scored · {eta_text}")
+            )
+            leaders = progress.ranking()
+            if leaders:
+                live_table.dataframe(pd.DataFrame([
+                    {"Rank": i, "Symbol": row['symbol'], "Company": row['company'],
+                     "Score": round(row.get('total_score', row.get('score', 0)), 1)}
+                    for i, row in enumerate(leaders, 1)
+                ]), use_container_width=True, hide_index=True, height=280)
+        
+        with st.spinner(spinner_text):
             try:
-                # Store current filters
-                current_filters = {
-                    'screening_type': screening_type,
-                    'min_market_cap': min_market_cap,
-                    'max_market_cap': max_market_cap
-                }
-                if screening_type == "Value Stocks":
-                    current_filters.update({
-                        'max_pe_ratio': max_pe_ratio,
-                        'max_pb_ratio': max_pb_ratio,
-                        'min_roe': min_roe,
-                        'max_debt_equity': max_debt_equity,
-                        'min_current_ratio': min_current_ratio,
-                        'min_fcf_yield': min_fcf_yield
-                    })
-                elif screening_type == "Growth Stocks":
-                    current_filters.update({
-                        'min_revenue_growth': min_revenue_growth,
-                        'min_earnings_growth': min_earnings_growth,
-                        'min_roe': min_roe,
-                        'min_operating_margin': min_operating_margin,
-                        'max_peg_ratio': max_peg_ratio,
-                        'max_ps_ratio': max_ps_ratio
-                    })
-                else:  # ValueGrowth Stocks
-                    current_filters.update({
-                        'max_pe_ratio': max_pe_ratio,
-                        'max_pb_ratio': max_pb_ratio,
-                        'max_debt_equity': max_debt_equity,
-                        'min_revenue_growth': min_revenue_growth,
-                        'min_earnings_growth': min_earnings_growth,
-                        'max_peg_ratio': max_peg_ratio,
-                        'min_roe': min_roe,
-                        'min_operating_margin': min_operating_margin,
-                        'min_current_ratio': min_current_ratio,
-                        'max_ps_ratio': max_ps_ratio,
-                        'min_fcf_yield': min_fcf_yield,
-                        'min_gross_margin': min_gross_margin
-                    })
                 if screening_type == "Value Stocks":
                     results = analyzer.screen_value_stocks_configurable(
                         min_market_cap_millions=min_market_cap,
@@ -7771,13 +7249,15 @@ def stock_screening():
                         min_roe_percent=min_roe,
                         max_debt_equity_percent=max_debt_equity,
                         min_current_ratio=min_current_ratio,
-                        min_fcf_yield_percent=min_fcf_yield
+                        min_fcf_yield_percent=min_fcf_yield,
+                        on_progress=show_progress
                     )
                     
                     # Store results in session state
                     st.session_state.screening_results = results
                     st.session_state.screening_type_used = screening_type
                     st.session_state.screening_filters_used = current_filters
+                    st.session_state.screening_snapshot_built_at = analyzer.last_screen_report['snapshot_built_at']
                     
                     # Display active criteria
                     st.success(f"✅ Found {len(results)} value stock candidates")
@@ -7801,13 +7281,15 @@ def stock_screening():
                         min_roe_percent=min_roe,
                         min_operating_margin_percent=min_operating_margin,
                         max_peg_ratio=max_peg_ratio,
-                        max_ps_ratio=max_ps_ratio
+                        max_ps_ratio=max_ps_ratio,
+                        on_progress=show_progress
                     )
                     
                     # Store results in session state
                     st.session_state.screening_results = results
                     st.session_state.screening_type_used = screening_type
                     st.session_state.screening_filters_used = current_filters
+                    st.session_state.screening_snapshot_built_at = analyzer.last_screen_report['snapshot_built_at']
                     
                     # Display active criteria
                     st.success(f"✅ Found {len(results)} growth stock candidates")
@@ -7837,13 +7319,15 @@ def stock_screening():
                         min_current_ratio=min_current_ratio,
                         max_ps_ratio=max_ps_ratio,
                         min_fcf_yield_percent=min_fcf_yield,
-                        min_gross_margin_percent=min_gross_margin
+                        min_gross_margin_percent=min_gross_margin,
+                        on_progress=show_progress
                     )
                     
                     # Store results in session state
                     st.session_state.screening_results = results
                     st.session_state.screening_type_used = screening_type
                     st.session_state.screening_filters_used = current_filters
+                    st.session_state.screening_snapshot_built_at = analyzer.last_screen_report['snapshot_built_at']
                     
                     # Display active criteria
                     st.success(f"✅ Found {len(results)} value-growth stock candidates")
@@ -7857,6 +7341,9 @@ def stock_screening():
                     - Debt/Equity < {max_debt_equity}, Current Ratio > {min_current_ratio}
                     """)
                 
+                if analyzer.last_screen_report:
+                    st.caption(f"⏱️ {analyzer.format_screen_report(analyzer.last_screen_report)}")
+                
                 # Display results (same pagination logic as before)
                 if results and len(results) > 0:
                     # Display top results with pagination
@@ -8450,7 +7937,7 @@ def etf_dashboard():
         st.markdown(f"### 📈 Analysis for {selected_etf}")
         
         with st.spinner(f"Fetching data for {selected_etf}..."):
-            if analyzer.fetch_stock_data(selected_etf):
+            if analyzer.fetch_stock_data_cached(selected_etf, notify=False):
                 # Basic ETF info
                 col1, col2, col3, col4 = st.columns(4)
                 
@@ -8934,8 +8421,7 @@ def market_indexes_dashboard():
                 for index_name in selected_indexes:
                     symbol = major_indexes[index_name]
                     try:
-                        ticker = yf.Ticker(symbol)
-                        hist_data = ticker.history(period=selected_period)
+                        hist_data = fetch_benchmark_history_shared(symbol, selected_period)
                         
                         if not hist_data.empty:
                             # Calculate key metrics
@@ -9101,8 +8587,7 @@ def market_indexes_dashboard():
                 for rate_name in selected_rates:
                     symbol = forex_commodities[rate_name]
                     try:
-                        ticker = yf.Ticker(symbol)
-                        hist_data = ticker.history(period=selected_rates_period)
+                        hist_data = fetch_benchmark_history_shared(symbol, selected_rates_period)
                         
                         if not hist_data.empty:
                             current_rate = hist_data['Close'].iloc[-1]
@@ -9343,8 +8828,7 @@ def market_indexes_dashboard():
                         progress_bar.progress((i + 1) / (len(correlation_instruments) + 1), 
                                             text=f"Loading {instrument_name}...")
                         try:
-                            ticker = yf.Ticker(symbol)
-                            hist_data = ticker.history(period=selected_corr_period)
+                            hist_data = fetch_benchmark_history_shared(symbol, selected_corr_period)
                             
                             if not hist_data.empty and len(hist_data) > 1:
                                 # Calculate daily returns
@@ -9847,6 +9331,15 @@ def market_indexes_dashboard():
                 st.warning("No correlation data to export. Please calculate BTC correlations first.")
 
 
+def get_batch_quotes(symbols):
+    """Fetch quotes for many symbols in batched requests (empty dict if unavailable)"""
+    try:
+        from yahoo_api_direct import get_default_client
+        return get_default_client().get_quotes(symbols)
+    except Exception:
+        return {}
+
+
 def favorites_dashboard():
     """Favorites management dashboard"""
     st.markdown("---")
@@ -9932,6 +9425,9 @@ def favorites_dashboard():
             if filtered_favorites:
                 st.markdown(f"**{len(filtered_favorites)} favorites found**")
                 
+                # Current prices for every favorite in one batch request
+                favorite_quotes = get_batch_quotes([fav.get('symbol', '') for fav in filtered_favorites])
+                
                 # Group by category for better organization
                 favorites_by_category = {}
                 for fav in filtered_favorites:
@@ -9956,6 +9452,14 @@ def favorites_dashboard():
                                 symbol_type = fav.get('symbol_type', 'stock')
                                 badge_color = "🔷" if symbol_type == 'stock' else "🟦"
                                 st.write(f"{badge_color} {symbol_type.upper()}")
+                                
+                                quote = favorite_quotes.get(fav.get('symbol', '').upper())
+                                if quote and quote.get('currentPrice') is not None:
+                                    change_pct = quote.get('regularMarketChangePercent')
+                                    if change_pct is None and quote.get('previousClose'):
+                                        change_pct = (quote['currentPrice'] / quote['previousClose'] - 1) * 100
+                                    change_str = f" ({change_pct:+.2f}%)" if change_pct is not None else ""
+                                    st.write(f"{quote['currentPrice']:,.2f} {quote.get('currency') or ''}{change_str}")
                             
                             with col3:
                                 # Category editor
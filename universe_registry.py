@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Stock universe registry loaded from data files
+Symbols live in CSV shards under data/universe (one file per market:
+symbol, name, cap bucket, sector and the named lists the symbol belongs
+to) instead of inline dicts. The registry is read once per process,
+de-duplicated, and indexed by region, exchange suffix, cap bucket, sector,
+list and shard. retired.csv names delisted or renamed tickers with their
+replacement; they are dropped on load wherever they appear.
+
+Point YAHOO_UNIVERSE_DIR at another directory of shards (any number of
+<shard>.csv files) to screen a larger universe.
+
+Usage: python universe_registry.py [--list core] [--region Europe] [--sector Technology] [--dir DIR]
+"""
+
+import argparse
+import csv
+import glob
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+UNIVERSE_DIR = os.environ.get(
+    'YAHOO_UNIVERSE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'universe')
+)
+RETIRED_FILE = 'retired.csv'
+CAP_BUCKETS = ('large', 'mid', 'small')
+
+# Yahoo exchange suffix -> (country, region)
+EXCHANGE_SUFFIXES = {
+    '': ('United States', 'US'),
+    '.L': ('United Kingdom', 'Europe'),
+    '.DE': ('Germany', 'Europe'),
+    '.PA': ('France', 'Europe'),
+    '.SW': ('Switzerland', 'Europe'),
+    '.AS': ('Netherlands', 'Europe'),
+    '.MI': ('Italy', 'Europe'),
+    '.MC': ('Spain', 'Europe'),
+    '.ST': ('Sweden', 'Europe'),
+    '.HE': ('Finland', 'Europe'),
+    '.OL': ('Norway', 'Europe'),
+    '.CO': ('Denmark', 'Europe'),
+}
+
+def exchange_suffix(symbol):
+    """'.PA' for 'MC.PA', '' for US symbols (share classes use '-', as in 'BRK-B')"""
+    return symbol[symbol.rindex('.'):].upper() if '.' in symbol else ''
+
+class UniverseEntry:
+    """One registry symbol and the attributes it is indexed by"""
+    
+    __slots__ = ('symbol', 'name', 'suffix', 'country', 'region', 'cap', 'sector', 'lists', 'shard')
+    
+    def __init__(self, symbol, name, cap='', sector='', lists=(), shard=''):
+        self.symbol = symbol
+        self.name = name
+        self.suffix = exchange_suffix(symbol)
+        self.country, self.region = EXCHANGE_SUFFIXES.get(self.suffix, ('', 'Other'))
+        self.cap = cap
+        self.sector = sector
+        self.lists = tuple(lists)
+        self.shard = shard
+
+class UniverseRegistry:
+    """De-duplicated symbols from the shard files, with an index per attribute
+    
+    Registry order is shard file order (sorted by name), then row order;
+    every selection keeps it. A symbol listed twice keeps its first row.
+    """
+    
+    INDEXED = ('region', 'suffix', 'cap', 'sector', 'lists', 'shard')
+    
+    def __init__(self, entries=(), retired=None):
+        self.entries = OrderedDict()
+        self.retired = dict(retired or {})
+        self.duplicates = []
+        self.indexes = {attribute: {} for attribute in self.INDEXED}
+        for entry in entries:
+            self._add(entry)
+    
+    def _add(self, entry):
+        key = entry.symbol.upper()
+        if key in self.retired:
+            return
+        if key in self.entries:
+            self.duplicates.append(entry.symbol)
+            return
+        self.entries[key] = entry
+        for attribute in self.INDEXED:
+            values = getattr(entry, attribute)
+            for value in (values if attribute == 'lists' else (values,)):
+                self.indexes[attribute].setdefault(value.lower(), []).append(key)
+    
+    @classmethod
+    def from_directory(cls, directory=UNIVERSE_DIR):
+        """Load every <shard>.csv in directory; retired.csv lists symbols to drop"""
+        retired = {}
+        retired_path = os.path.join(directory, RETIRED_FILE)
+        if os.path.exists(retired_path):
+            with open(retired_path, newline='', encoding='utf-8') as f:
+                retired = {row['symbol'].upper(): row.get('replacement') or '' for row in csv.DictReader(f)}
+        
+        registry = cls(retired=retired)
+        for path in sorted(glob.glob(os.path.join(directory, '*.csv'))):
+            if os.path.basename(path) == RETIRED_FILE:
+                continue
+            shard = os.path.splitext(os.path.basename(path))[0]
+            with open(path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    symbol = (row.get('symbol') or '').strip()
+                    if symbol:
+                        registry._add(UniverseEntry(
+                            symbol, (row.get('name') or symbol).strip(), (row.get('cap') or '').strip().lower(),
+                            (row.get('sector') or '').strip(), (row.get('lists') or '').split(), shard
+                        ))
+        if registry.duplicates:
+            more = f" and {len(registry.duplicates) - 10} more" if len(registry.duplicates) > 10 else ''
+            print(f"Universe registry: ignored duplicate rows for {', '.join(registry.duplicates[:10])}{more}")
+        return registry
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __contains__(self, symbol):
+        return symbol.upper() in self.entries
+    
+    def get(self, symbol):
+        return self.entries.get(symbol.upper())
+    
+    def resolve(self, symbol):
+        """The registry symbol for a ticker: itself, its replacement if retired, or None"""
+        key = symbol.upper()
+        while key in self.retired:
+            key = self.retired[key].upper()
+        return self.entries[key].symbol if key in self.entries else None
+    
+    def values(self, attribute):
+        """Distinct values of an indexed attribute, e.g. values('sector')"""
+        return sorted(self.indexes[attribute])
+    
+    def select(self, region=None, suffix=None, cap=None, sector=None, list_name=None, shard=None):
+        """{symbol: name} matching every given filter; each takes one value or a collection of them"""
+        keys = None
+        for attribute, wanted in (('region', region), ('suffix', suffix), ('cap', cap), ('sector', sector),
+                                  ('lists', list_name), ('shard', shard)):
+            if wanted is None:
+                continue
+            if isinstance(wanted, str):
+                wanted = (wanted,)
+            matched = set()
+            for value in wanted:
+                matched.update(self.indexes[attribute].get(value.lower(), ()))
+            keys = matched if keys is None else keys & matched
+        
+        return OrderedDict(
+            (entry.symbol, entry.name) for key, entry in self.entries.items() if keys is None or key in keys
+        )
+    
+    def universe(self, list_name):
+        """{symbol: name} for a named list, e.g. 'core'"""
+        return self.select(list_name=list_name)
+    
+    def split(self, stock_universe, size):
+        """Split a universe into shards of at most size symbols that can be fetched independently
+        
+        Symbols are grouped by their shard file, in registry order, before
+        being cut into pieces, so a shard never mixes markets and a market's
+        shards stay the same whatever else is in the universe. Symbols the
+        registry doesn't know are grouped by a hash of the symbol. A universe
+        of at most size symbols is one shard.
+        """
+        if len(stock_universe) <= size:
+            return [stock_universe]
+        
+        groups = OrderedDict()
+        for symbol, name in stock_universe.items():
+            entry = self.get(symbol)
+            group = entry.shard if entry is not None else f"other-{zlib.crc32(symbol.encode('utf-8')) % 16}"
+            groups.setdefault(group, OrderedDict())[symbol] = name
+        
+        shards = []
+        for group in groups.values():
+            items = list(group.items())
+            for start in range(0, len(items), max(1, size)):
+                shards.append(OrderedDict(items[start:start + size]))
+        return shards
+    
+    def stats(self):
+        return {
+            'symbols': len(self.entries),
+            'retired': len(self.retired),
+            'duplicates_ignored': len(self.duplicates),
+            **{attribute: {value: len(keys) for value, keys in sorted(index.items())}
+               for attribute, index in self.indexes.items()}
+        }
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_universe_registry():
+    """Process-wide UniverseRegistry, loaded from UNIVERSE_DIR on first use"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = UniverseRegistry.from_directory(UNIVERSE_DIR)
+    return _registry
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect the stock universe registry')
+    parser.add_argument('--dir', default=UNIVERSE_DIR)
+    parser.add_argument('--list', dest='list_name')
+    parser.add_argument('--region')
+    parser.add_argument('--suffix')
+    parser.add_argument('--cap', choices=CAP_BUCKETS)
+    parser.add_argument('--sector')
+    args = parser.parse_args()
+    
+    registry = UniverseRegistry.from_directory(args.dir)
+    if not any((args.list_name, args.region, args.suffix, args.cap, args.sector)):
+        for attribute, counts in registry.stats().items():
+            print(f"{attribute}: {counts}")
+        return
+    selection = registry.select(args.region, args.suffix, args.cap, args.sector, args.list_name)
+    for symbol, name in selection.items():
+        entry = registry.get(symbol)
+        print(f"{symbol:<12} {entry.cap:<6} {entry.sector:<24} {name}")
+    print(f"{len(selection)} symbols")
+
+if __name__ == '__main__':
+    main()
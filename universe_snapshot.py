@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Columnar snapshot of a screening universe and vectorized screening scorers
+One row per symbol and one float64 column per info field the configurable
+scorers read, so a whole universe is scored in a single NumPy pass instead
+of one Python if/elif ladder per symbol. The scorers reproduce
+calculate_value/growth/valuegrowth_score_configurable exactly, quirks
+included: ratios under 1 are read as fractions, zero counts as missing
+where the scalar scorer tests truthiness, and a row the scalar scorer would
+drop with an exception (a non-numeric field it compares) scores NaN here.
+
+Snapshots don't depend on screening thresholds, so one is kept per universe
+for every session in the process; re-screening with new thresholds only
+re-scores it until it is SNAPSHOT_TTL old. A snapshot keeps the batch quote
+of every symbol whose info was never fetched, so a screen with looser
+thresholds can fetch just the symbols they newly admit.
+"""
+
+import hashlib
+import heapq
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_TTL = float(os.environ.get('YAHOO_SNAPSHOT_TTL_SECONDS', 60 * 60))
+SNAPSHOT_REGISTRY_SIZE = 32  # Universes (and universe shards) whose latest snapshot is kept
+
+# Every info field the configurable scorers read
+SNAPSHOT_FIELDS = (
+    'currentPrice', 'marketCap', 'trailingPE', 'priceToBook', 'pegRatio', 'debtToEquity',
+    'returnOnEquity', 'revenueGrowth', 'earningsGrowth', 'operatingMargins', 'grossMargins',
+    'currentRatio', 'freeCashflowYield', 'dividendYield', 'priceToSalesTrailing12Months'
+)
+
+# What each cell held, kept next to the float column
+CODE_NUMBER = 0        # int/float (NaN only for a real float NaN)
+CODE_OTHER = 1         # Truthy non-number, e.g. 'N/A' - comparing it raises
+CODE_EMPTY_OTHER = 2   # Falsy non-number, e.g. ''
+CODE_MISSING = 3       # None or absent
+
+def _column(values):
+    numbers = np.full(len(values), np.nan)
+    codes = np.full(len(values), CODE_MISSING, dtype=np.int8)
+    for i, value in enumerate(values):
+        if value is None:
+            continue
+        if isinstance(value, (int, float, np.number)):
+            numbers[i] = value
+            codes[i] = CODE_NUMBER
+        else:
+            codes[i] = CODE_OTHER if value else CODE_EMPTY_OTHER
+    return numbers, codes
+
+class UniverseSnapshot:
+    """Screening metrics for a universe, one row per symbol
+    
+    frame is a symbol-indexed DataFrame with a company column and one float64
+    column per SNAPSHOT_FIELDS entry; codes holds an int8 array per field
+    saying whether each cell was a number, missing or something else. The
+    info dicts the rows were built from are kept (by reference) so ranked
+    rows can be rendered by the scalar scorers.
+    
+    fetched is the set of symbols whose info was fetched (or tried), and
+    quotes the phase-one batch quote of the others. acquisition holds the
+    per-phase timings and counts of the fetch that built the snapshot.
+    """
+    
+    def __init__(self, frame, codes, infos, built_at=None, quotes=None, fetched=None, acquisition=None):
+        self.frame = frame
+        self.codes = codes
+        self.infos = infos
+        self.built_at = built_at or time.time()
+        self.quotes = quotes or {}
+        self.fetched = set(fetched or ())
+        self.acquisition = acquisition
+    
+    @classmethod
+    def from_infos(cls, stock_universe, infos, built_at=None, quotes=None, fetched=None, acquisition=None):
+        """Snapshot of {symbol: company} from {symbol: info}; symbols without info get empty rows
+        
+        built_at should be when the oldest info was fetched, so age() is the data's age.
+        fetched defaults to the symbols with info.
+        """
+        symbols = list(stock_universe)
+        rows = [infos.get(symbol) or {} for symbol in symbols]
+        columns = {'company': list(stock_universe.values())}
+        codes = {}
+        for field in SNAPSHOT_FIELDS:
+            columns[field], codes[field] = _column([row.get(field) for row in rows])
+        
+        frame = pd.DataFrame(columns, index=pd.Index(symbols, name='symbol'))
+        if fetched is None:
+            fetched = [symbol for symbol, row in zip(symbols, rows) if row]
+        return cls(frame, codes, {symbol: row for symbol, row in zip(symbols, rows)}, built_at,
+                   quotes, fetched, acquisition)
+    
+    @classmethod
+    def combine(cls, stock_universe, snapshots):
+        """One snapshot of stock_universe from snapshots of its shards, dated by the oldest"""
+        infos = {}
+        quotes = {}
+        fetched = set()
+        acquisition = {}
+        for snapshot in snapshots:
+            infos.update((symbol, info) for symbol, info in snapshot.infos.items() if info)
+            quotes.update(snapshot.quotes)
+            fetched |= snapshot.fetched
+            for name, value in (snapshot.acquisition or {}).items():
+                acquisition[name] = acquisition.get(name, 0) + value
+        return cls.from_infos(stock_universe, infos, built_at=min(snapshot.built_at for snapshot in snapshots),
+                              quotes=quotes, fetched=fetched, acquisition=acquisition or None)
+    
+    def extend(self, stock_universe, infos, fetched):
+        """Copy with more symbols' info; fetched are the symbols just tried, whether or not they got any"""
+        merged = {symbol: info for symbol, info in self.infos.items() if info}
+        merged.update(infos)
+        fetched = set(fetched)
+        quotes = {symbol: quote for symbol, quote in self.quotes.items() if symbol not in fetched}
+        return UniverseSnapshot.from_infos(stock_universe, merged, self.built_at, quotes,
+                                           self.fetched | fetched, self.acquisition)
+    
+    def __len__(self):
+        return len(self.frame)
+    
+    def age(self, now=None):
+        return (now or time.time()) - self.built_at
+    
+    def is_fresh(self, max_age=None, now=None):
+        return self.age(now) < (SNAPSHOT_TTL if max_age is None else max_age)
+    
+    def covered(self):
+        """Rows built from an actual info dict"""
+        return sum(1 for info in self.infos.values() if info)
+    
+    def info(self, symbol):
+        return self.infos.get(symbol) or {}
+    
+    def field(self, name):
+        """(values, codes) arrays for one field"""
+        return self.frame[name].to_numpy(dtype=np.float64), self.codes[name]
+
+# Guards as the scalar scorers write them
+
+def _truthy(snapshot, name):
+    """`if value:` -> (values, rows that enter the ladder, rows where the ladder raises)"""
+    values, codes = snapshot.field(name)
+    return values, (codes == CODE_NUMBER) & (values != 0), codes == CODE_OTHER
+
+def _not_none(snapshot, name):
+    """`if value is not None:` -> (values, rows that enter the ladder, rows where the ladder raises)"""
+    values, codes = snapshot.field(name)
+    return values, codes == CODE_NUMBER, (codes == CODE_OTHER) | (codes == CODE_EMPTY_OTHER)
+
+def _percent(values):
+    # `value * 100 if value < 1 else value`
+    return np.where(values < 1, values * 100, values)
+
+def _ladder(entered, tests, points, otherwise=0):
+    """Points of the first passing test (an if/elif/else chain) on rows that entered it"""
+    return np.where(entered, np.select(tests, points, otherwise), 0)
+
+def _passes_cap_filter(snapshot, min_market_cap_millions, max_market_cap_billions):
+    """Rows that get past the price and market cap checks, and rows where those checks raise"""
+    price, price_codes = snapshot.field('currentPrice')
+    market_cap, cap_codes = snapshot.field('marketCap')
+    min_market_cap = min_market_cap_millions * 1e6
+    max_market_cap = max_market_cap_billions * 1e9 if max_market_cap_billions < 5000 else float('inf')
+    
+    has_price = ((price_codes == CODE_NUMBER) & (price != 0)) | (price_codes == CODE_OTHER)
+    # A NaN market cap fails neither comparison, so it passes as in the scalar code
+    passes = (has_price & (cap_codes == CODE_NUMBER) & (market_cap != 0)
+              & ~(market_cap < min_market_cap) & ~(market_cap > max_market_cap))
+    return passes, has_price & (cap_codes == CODE_OTHER)
+
+def _finish(score, passes, raises):
+    scores = score.astype(np.float64)
+    scores[~passes | raises] = np.nan
+    return scores
+
+def value_scores(snapshot, min_market_cap_millions, max_market_cap_billions, max_pe_ratio, max_pb_ratio,
+                 min_roe_percent, max_debt_equity_percent, min_current_ratio, min_fcf_yield_percent):
+    """total_score of calculate_value_score_configurable for every row (NaN where it returns None)"""
+    with np.errstate(invalid='ignore'):
+        passes, raises = _passes_cap_filter(snapshot, min_market_cap_millions, max_market_cap_billions)
+        
+        pe, pe_entered, pe_raises = _truthy(snapshot, 'trailingPE')
+        pb, pb_entered, pb_raises = _truthy(snapshot, 'priceToBook')
+        roe, roe_entered, roe_raises = _truthy(snapshot, 'returnOnEquity')
+        roe = _percent(roe)
+        
+        score = (
+            _ladder(pe_entered & (pe > 0), [pe < max_pe_ratio * 0.6, pe < max_pe_ratio * 0.8, pe < max_pe_ratio],
+                    [15, 12, 8])
+            + _ladder(pb_entered & (pb > 0), [pb < max_pb_ratio * 0.5, pb < max_pb_ratio * 0.75, pb < max_pb_ratio],
+                      [15, 12, 8])
+            + _ladder(roe_entered, [roe > min_roe_percent * 1.5, roe > min_roe_percent * 1.2, roe > min_roe_percent],
+                      [10, 8, 5])
+        )
+        return _finish(score, passes, raises | pe_raises | pb_raises | roe_raises)
+
+def growth_scores(snapshot, min_market_cap_millions=100, max_market_cap_billions=5000,
+                  min_revenue_growth_percent=10.0, min_earnings_growth_percent=15.0,
+                  min_roe_percent=15.0, min_operating_margin_percent=10.0,
+                  max_peg_ratio=2.0, max_ps_ratio=10.0):
+    """total_score of calculate_growth_score_configurable for every row (NaN where it returns None)"""
+    with np.errstate(invalid='ignore'):
+        passes, raises = _passes_cap_filter(snapshot, min_market_cap_millions, max_market_cap_billions)
+        
+        revenue, revenue_entered, revenue_raises = _truthy(snapshot, 'revenueGrowth')
+        earnings, earnings_entered, earnings_raises = _truthy(snapshot, 'earningsGrowth')
+        roe, roe_entered, roe_raises = _truthy(snapshot, 'returnOnEquity')
+        margin, margin_entered, margin_raises = _truthy(snapshot, 'operatingMargins')
+        peg, peg_entered, peg_raises = _truthy(snapshot, 'pegRatio')
+        revenue, earnings, roe, margin = _percent(revenue), _percent(earnings), _percent(roe), _percent(margin)
+        
+        score = (
+            _ladder(revenue_entered, [revenue > min_revenue_growth_percent * 2,
+                                      revenue > min_revenue_growth_percent * 1.5,
+                                      revenue > min_revenue_growth_percent], [30, 20, 10])
+            + _ladder(earnings_entered, [earnings > min_earnings_growth_percent * 2,
+                                         earnings > min_earnings_growth_percent * 1.5,
+                                         earnings > min_earnings_growth_percent], [25, 18, 10])
+            + _ladder(roe_entered, [roe > min_roe_percent * 2, roe > min_roe_percent * 1.5, roe > min_roe_percent],
+                      [20, 15, 8])
+            + _ladder(margin_entered, [margin > min_operating_margin_percent * 2,
+                                       margin > min_operating_margin_percent], [15, 8])
+            + _ladder(peg_entered & (peg > 0) & (peg < max_peg_ratio), [peg < 1.0, peg < 1.5], [10, 6], 3)
+        )
+        raises = raises | revenue_raises | earnings_raises | roe_raises | margin_raises | peg_raises
+        return _finish(score, passes, raises)
+
+def valuegrowth_scores(snapshot, min_market_cap_millions, max_market_cap_billions, max_pe_ratio, max_pb_ratio,
+                       max_debt_equity_percent, min_revenue_growth_percent, min_earnings_growth_percent,
+                       max_peg_ratio, min_roe_percent, min_operating_margin_percent, min_current_ratio,
+                       max_ps_ratio, min_fcf_yield_percent, min_gross_margin_percent):
+    """total_score of calculate_valuegrowth_score_configurable for every row (NaN where it returns None)"""
+    with np.errstate(invalid='ignore'):
+        passes, raises = _passes_cap_filter(snapshot, min_market_cap_millions, max_market_cap_billions)
+        
+        pe, pe_entered, pe_raises = _truthy(snapshot, 'trailingPE')
+        pb, pb_entered, pb_raises = _truthy(snapshot, 'priceToBook')
+        peg, peg_entered, peg_raises = _truthy(snapshot, 'pegRatio')
+        debt_equity, debt_entered, debt_raises = _not_none(snapshot, 'debtToEquity')
+        revenue, revenue_entered, revenue_raises = _not_none(snapshot, 'revenueGrowth')
+        earnings, earnings_entered, earnings_raises = _not_none(snapshot, 'earningsGrowth')
+        margin, margin_entered, margin_raises = _truthy(snapshot, 'operatingMargins')
+        roe, roe_entered, roe_raises = _truthy(snapshot, 'returnOnEquity')
+        gross, gross_entered, gross_raises = _truthy(snapshot, 'grossMargins')
+        current, current_entered, current_raises = _truthy(snapshot, 'currentRatio')
+        fcf, fcf_entered, fcf_raises = _truthy(snapshot, 'freeCashflowYield')
+        revenue, earnings, margin = _percent(revenue), _percent(earnings), _percent(margin)
+        roe, gross, fcf = _percent(roe), _percent(gross), _percent(fcf)
+        
+        score = (
+            # Value fundamentals
+            _ladder(pe_entered & (pe > 0), [pe < max_pe_ratio * 0.6, pe < max_pe_ratio * 0.8, pe < max_pe_ratio],
+                    [12, 9, 6])
+            + _ladder(pb_entered & (pb > 0), [pb < max_pb_ratio * 0.5, pb < max_pb_ratio * 0.75, pb < max_pb_ratio],
+                      [8, 6, 4])
+            + _ladder(peg_entered & (peg > 0),
+                      [peg < max_peg_ratio * 0.5, peg < max_peg_ratio * 0.75, peg < max_peg_ratio], [10, 7, 4])
+            + _ladder(debt_entered, [debt_equity < max_debt_equity_percent * 0.5,
+                                     debt_equity < max_debt_equity_percent], [5, 3])
+            # Growth metrics
+            + _ladder(revenue_entered, [revenue > min_revenue_growth_percent * 2,
+                                        revenue > min_revenue_growth_percent * 1.5,
+                                        revenue > min_revenue_growth_percent], [15, 12, 8])
+            + _ladder(earnings_entered, [earnings > min_earnings_growth_percent * 2,
+                                         earnings > min_earnings_growth_percent * 1.5,
+                                         earnings > min_earnings_growth_percent], [15, 12, 8])
+            + _ladder(margin_entered, [margin > min_operating_margin_percent * 1.5,
+                                       margin > min_operating_margin_percent], [5, 3])
+            # Quality and profitability
+            + _ladder(roe_entered, [roe > min_roe_percent * 1.5, roe > min_roe_percent * 1.2, roe > min_roe_percent],
+                      [10, 7, 4])
+            + _ladder(margin_entered, [margin > min_operating_margin_percent * 2,
+                                       margin > min_operating_margin_percent * 1.5,
+                                       margin > min_operating_margin_percent], [8, 6, 4])
+            + _ladder(gross_entered, [gross > min_gross_margin_percent * 1.5, gross > min_gross_margin_percent * 1.2,
+                                      gross > min_gross_margin_percent], [7, 5, 3])
+            # Financial strength
+            + _ladder(current_entered, [current > min_current_ratio * 1.5, current > min_current_ratio], [3, 2])
+            + _ladder(fcf_entered, [fcf > min_fcf_yield_percent * 2, fcf > min_fcf_yield_percent], [2, 1])
+        )
+        raises = (raises | pe_raises | pb_raises | peg_raises | debt_raises | revenue_raises | earnings_raises
+                  | margin_raises | roe_raises | gross_raises | current_raises | fcf_raises)
+        return _finish(score, passes, raises)
+
+SNAPSHOT_SCORERS = {
+    'value': value_scores,
+    'growth': growth_scores,
+    'valuegrowth': valuegrowth_scores
+}
+
+def score_snapshot(snapshot, screening_params):
+    """Scores for every row under {'type': ..., 'params': {...}} (NaN where the scalar scorer returns None)"""
+    return SNAPSHOT_SCORERS[screening_params['type']](snapshot, **screening_params['params'])
+
+def rank_snapshot(snapshot, screening_params, limit=50, admitted=None):
+    """Symbols of the best `limit` scored rows, best first; ties keep universe order
+    
+    With admitted (symbols passing the screen's quote prefilter), other rows are not ranked.
+    """
+    scores = score_snapshot(snapshot, screening_params)
+    if admitted is not None:
+        scores[~snapshot.frame.index.isin(list(admitted))] = np.nan
+    rows = np.flatnonzero(~np.isnan(scores))
+    order = rows[np.argsort(-scores[rows], kind='stable')][:limit]
+    return snapshot.frame.index[order].tolist()
+
+# Latest snapshot per universe, shared by all sessions
+
+_snapshots = OrderedDict()
+_snapshots_lock = threading.Lock()
+
+def universe_key(stock_universe):
+    """Stable key for a set of symbols (order and company names don't matter)"""
+    return hashlib.sha1('\n'.join(sorted(stock_universe)).encode('utf-8')).hexdigest()[:16]
+
+def get_universe_snapshot(stock_universe, max_age=None):
+    """The universe's latest snapshot if younger than max_age (SNAPSHOT_TTL by default), else None"""
+    with _snapshots_lock:
+        snapshot = _snapshots.get(universe_key(stock_universe))
+    if snapshot is None or not snapshot.is_fresh(max_age):
+        return None
+    return snapshot
+
+def put_universe_snapshot(stock_universe, snapshot):
+    key = universe_key(stock_universe)
+    with _snapshots_lock:
+        _snapshots.pop(key, None)
+        _snapshots[key] = snapshot
+        while len(_snapshots) > SNAPSHOT_REGISTRY_SIZE:
+            _snapshots.popitem(last=False)
+
+# Streaming screens: running top-N and progress for on_progress callbacks
+
+class RunningTopN:
+    """Best `limit` scored rows seen so far, ranked as rank_snapshot ranks a finished universe
+    
+    Rows are ordered by score, then by position in the universe, so once
+    every symbol has been offered the rows equal the batch ranking exactly,
+    whatever order they arrived in.
+    """
+    
+    def __init__(self, stock_universe, limit=50, score_key='total_score'):
+        self.positions = {symbol: i for i, symbol in enumerate(stock_universe)}
+        self.limit = limit
+        self.score_key = score_key
+        self.heap = []  # Worst kept row on top
+    
+    def _key(self, row):
+        return (row.get(self.score_key, 0), -self.positions.get(row['symbol'], len(self.positions)))
+    
+    def offer(self, row):
+        """Keep the row if it ranks in the top `limit`; True when it did"""
+        entry = (self._key(row), row['symbol'], row)
+        if len(self.heap) < self.limit:
+            heapq.heappush(self.heap, entry)
+            return True
+        if entry[0] > self.heap[0][0]:
+            heapq.heapreplace(self.heap, entry)
+            return True
+        return False
+    
+    def rows(self):
+        return [row for _, _, row in sorted(self.heap, key=lambda entry: entry[0], reverse=True)]
+    
+    def __len__(self):
+        return len(self.heap)
+
+class ScreenProgress:
+    """Live state of one screen, handed to its on_progress callback
+    
+    The screen calls record() as each symbol finishes (scored, rejected or
+    failed) and finish() with the final ranking. on_progress(progress) runs
+    on the screening thread at most every `interval` seconds, plus once when
+    the screen finishes.
+    """
+    
+    def __init__(self, stock_universe, limit=50, on_progress=None, interval=0.25):
+        self.total = len(stock_universe)
+        self.top = RunningTopN(stock_universe, limit)
+        self.on_progress = on_progress
+        self.interval = interval
+        self.processed = 0
+        self.failed = 0
+        self.cached = 0
+        self.scored = 0
+        self.last_row = None
+        self.started = time.time()
+        self.notified = 0.0
+        self.done = False
+        self.results = None
+    
+    def record(self, symbol, row=None, failed=False, cached=False):
+        self.processed += 1
+        self.failed += failed
+        self.cached += cached
+        if row:
+            self.scored += 1
+            self.last_row = row
+            self.top.offer(row)
+        self._notify()
+    
+    def skip(self, count, cached=False):
+        """Symbols settled without a row of their own (e.g. dropped by a prefilter)"""
+        self.processed += count
+        if cached:
+            self.cached += count
+        self._notify()
+    
+    def finish(self, results):
+        self.results = results
+        self.processed = self.total
+        self.done = True
+        self._notify(force=True)
+    
+    def fraction(self):
+        return min(self.processed / self.total, 1.0) if self.total else 1.0
+    
+    def elapsed(self):
+        return time.time() - self.started
+    
+    def eta(self):
+        """Seconds left at the rate fetched symbols have been finishing, or None before there is a rate"""
+        if self.done or self.processed >= self.total:
+            return 0.0
+        fetched = self.processed - self.cached
+        if fetched <= 0:
+            return None
+        return self.elapsed() / fetched * (self.total - self.processed)
+    
+    def ranking(self):
+        """Final results once finished, else the running top-N"""
+        return self.results if self.done else self.top.rows()
+    
+    def _notify(self, force=False):
+        if self.on_progress is None:
+            return
+        now = time.time()
+        if force or now - self.notified >= self.interval:
+            self.notified = now
+            self.on_progress(self)
@@ -5,36 +5,1613 @@ Bypasses yfinance library issues by calling Yahoo APIs directly
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
 import time
-import random
+import os
+import threading
 from datetime import datetime, timedelta
 import json
+import re
+import asyncio
+import concurrent.futures
+from collections import OrderedDict
+from urllib.parse import urlsplit
+from functools import lru_cache
 
-class DirectYahooFinance:
-    """Direct Yahoo Finance API wrapper to replace yfinance"""
+from response_cache import get_response_cache, response_cache_stats
+from market_store import configure_store_namespace, get_market_store, market_store_stats
+from stock_cache import estimate_size
+
+# Optional asyncio HTTP client for the async screening path (install with: pip install aiohttp)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Shared HTTP connection pool settings (override through environment variables)
+HTTP_POOL_CONNECTIONS = int(os.environ.get('YAHOO_HTTP_POOL_CONNECTIONS', 8))  # Per-host pools kept alive
+HTTP_POOL_MAXSIZE = int(os.environ.get('YAHOO_HTTP_POOL_MAXSIZE', 16))  # Keep-alive connections per host
+HTTP_POOL_BLOCK = os.environ.get('YAHOO_HTTP_POOL_BLOCK', '1') == '1'  # Wait for a free connection instead of opening extras
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-site'
+}
+
+QUOTE_BATCH_SIZE = 50  # Symbols packed into one multi-symbol quote request
+HISTORY_FLOAT32 = os.environ.get('YAHOO_HISTORY_FLOAT32', '0') == '1'  # Store OHLC prices as float32 to halve memory
+ASYNC_CONNECTION_LIMIT = int(os.environ.get('YAHOO_ASYNC_CONNECTION_LIMIT', 100))  # Open sockets per event loop
+ASYNC_LIMIT_PER_HOST = int(os.environ.get('YAHOO_ASYNC_LIMIT_PER_HOST', 50))  # Open sockets per Yahoo host
+INFO_HEDGED = os.environ.get('YAHOO_INFO_HEDGED', '1') == '1'  # Race info endpoints instead of trying them in turn
+INFO_HEDGE_DELAY = float(os.environ.get('YAHOO_INFO_HEDGE_DELAY', 1.0))  # Seconds before the next fallback endpoint is fired
+INFO_DEADLINE = float(os.environ.get('YAHOO_INFO_DEADLINE', 6.0))  # Overall budget for one hedged get_info
+INFO_HEDGE_WORKERS = int(os.environ.get('YAHOO_INFO_HEDGE_WORKERS', 32))
+INFO_SNAPSHOT_TTL = float(os.environ.get('YAHOO_INFO_SNAPSHOT_TTL_SECONDS', 6 * 60 * 60))  # Stored info served without asking Yahoo
+API_BASE = os.environ.get('YAHOO_API_BASE', '').rstrip('/')  # e.g. http://127.0.0.1:8765 to use yahoo_standin_server
+RECORD_DIR = os.environ.get('YAHOO_RECORD_DIR', '')  # Save every live API response here as a replayable fixture
+
+# Adaptive rate limiting (token bucket per Yahoo host and endpoint family, AIMD on 429)
+RATE_LIMIT_INITIAL = float(os.environ.get('YAHOO_RATE_LIMIT_INITIAL', 4.0))  # Requests/second per bucket at start
+RATE_LIMIT_MIN = float(os.environ.get('YAHOO_RATE_LIMIT_MIN', 0.25))
+RATE_LIMIT_MAX = float(os.environ.get('YAHOO_RATE_LIMIT_MAX', 20.0))
+RATE_LIMIT_BURST = float(os.environ.get('YAHOO_RATE_LIMIT_BURST', 4.0))  # Tokens a quiet bucket can accumulate
+RATE_LIMIT_INCREASE = 0.05  # Additive increase (req/s) per successful response
+RATE_LIMIT_DECREASE = 0.5   # Multiplicative decrease on a throttling response
+# Only 429 means "slow down"; a 401 (expired crumb/cookie) is an auth failure and
+# leaves the rate alone, though it still counts against the circuit breaker
+THROTTLE_STATUS_CODES = (429,)
+
+class AdaptiveRateLimiter:
+    """Token bucket for one host's endpoint family whose refill rate adapts to Yahoo's responses
+    
+    Callers reserve a token before each request and sleep only if the bucket is
+    empty, so a healthy endpoint costs no delay at all. Every throttling response
+    (429) halves the rate and drains the burst; every success adds a small
+    constant back (additive-increase/multiplicative-decrease). Buckets are kept
+    per endpoint family so throttled chart requests don't slow quoteSummary.
+    """
+    
+    def __init__(self, name, rate=None, burst=None):
+        self.name = name
+        self.rate = rate or RATE_LIMIT_INITIAL
+        self.burst = burst or RATE_LIMIT_BURST
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+    
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def reserve(self):
+        """Take one token and return how many seconds to wait before sending"""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            self.requests += 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.total_wait += wait
+            return wait
+    
+    def acquire(self, cancel=None):
+        """Wait for a token; with cancel (an Event) set while waiting, hand the token back and return False"""
+        wait = self.reserve()
+        if wait <= 0:
+            return True
+        if cancel is None:
+            time.sleep(wait)
+            return True
+        if cancel.wait(wait):
+            self.release()
+            return False
+        return True
+    
+    def release(self):
+        """Give back a reserved token that was never used"""
+        with self.lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+            self.requests -= 1
+    
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def record_response(self, status_code):
+        """Feed a response status back into the rate (AIMD)"""
+        with self.lock:
+            if status_code in THROTTLE_STATUS_CODES:
+                self.throttled += 1
+                self.rate = max(RATE_LIMIT_MIN, self.rate * RATE_LIMIT_DECREASE)
+                self.tokens = min(self.tokens, 0.0)
+            elif 200 <= status_code < 400:
+                self.rate = min(RATE_LIMIT_MAX, self.rate + RATE_LIMIT_INCREASE)
+    
+    def stats(self):
+        with self.lock:
+            return {
+                'rate': round(self.rate, 3),
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'total_wait_seconds': round(self.total_wait, 2)
+            }
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(url):
+    """Process-wide limiter for the host and endpoint family of url"""
+    key = f"{urlsplit(url).hostname or ''}/{endpoint_family(url)}"
+    limiter = _rate_limiters.get(key)
+    if limiter is None:
+        with _rate_limiters_lock:
+            limiter = _rate_limiters.setdefault(key, AdaptiveRateLimiter(key))
+    return limiter
+
+def rate_limiter_stats():
+    """Current request rate and throttle counts per Yahoo host and endpoint family"""
+    with _rate_limiters_lock:
+        limiters = list(_rate_limiters.values())
+    return {limiter.name: limiter.stats() for limiter in limiters}
+
+# Circuit breakers per Yahoo endpoint family
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get('YAHOO_BREAKER_FAILURES', 5))  # Consecutive failures that open a breaker
+BREAKER_RESET_TIMEOUT = float(os.environ.get('YAHOO_BREAKER_RESET_SECONDS', 60))  # Seconds open before a half-open probe
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of sending a request while its endpoint family's breaker is open"""
+
+class RequestCancelled(requests.exceptions.RequestException):
+    """Raised instead of sending a request whose caller has given up on it"""
+
+_request_scopes = threading.local()
+
+class CancelScope:
+    """Lets the requests a thread sends on a caller's behalf be abandoned
+    
+    While run() is active, the shared pool's adapter raises RequestCancelled
+    instead of sending once cancel() has been called, stops waiting for a
+    rate limiter token (handing it back), and caps every timeout at the
+    scope's monotonic deadline so a response already on its way can't hold
+    the connection past it.
+    """
+    
+    def __init__(self, deadline=None):
+        self.event = threading.Event()
+        self.deadline = deadline
+    
+    def cancel(self):
+        self.event.set()
+    
+    def expired(self):
+        """Cancelled, or past the deadline (so a timeout may be the scope's own doing)"""
+        return self.event.is_set() or (self.deadline is not None and time.monotonic() >= self.deadline)
+    
+    def check(self, request=None):
+        if self.event.is_set():
+            raise RequestCancelled("Request abandoned by its caller", request=request)
+    
+    def timeout(self, timeout):
+        """timeout (seconds or a (connect, read) pair) capped at the time left before the deadline"""
+        if self.deadline is None:
+            return timeout
+        left = max(self.deadline - time.monotonic(), 0.01)
+        if isinstance(timeout, tuple):
+            return tuple(min(part, left) if part else left for part in timeout)
+        return min(timeout, left) if timeout else left
+    
+    def run(self, fn, *args):
+        """fn(*args) with this scope applying to the requests it sends from this thread"""
+        previous = getattr(_request_scopes, 'scope', None)
+        _request_scopes.scope = self
+        try:
+            return fn(*args)
+        finally:
+            _request_scopes.scope = previous
+
+def endpoint_family(url):
+    """Group a Yahoo URL into the endpoint family its circuit breaker tracks"""
+    parts = urlsplit(url)
+    path = parts.path
+    if '/finance/chart/' in path:
+        return 'chart'
+    if '/finance/quoteSummary/' in path:
+        return 'quoteSummary'
+    if '/v7/finance/' in path:
+        return 'quote'
+    if '/finance/search' in path:
+        return 'search'
+    if parts.hostname == 'finance.yahoo.com':
+        return 'html'
+    return 'other'
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one endpoint family
+    
+    After BREAKER_FAILURE_THRESHOLD consecutive failures (401/429/5xx or a
+    transport error) the breaker opens and requests fail immediately, so
+    callers fall back to cached data instead of walking every retry. After
+    BREAKER_RESET_TIMEOUT seconds a single probe request is let through; its
+    outcome closes the breaker again or re-opens it.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, family, failure_threshold=None, reset_timeout=None):
+        self.family = family
+        self.failure_threshold = failure_threshold or BREAKER_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or BREAKER_RESET_TIMEOUT
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.rejected = 0
+        self.times_opened = 0
+        self.lock = threading.Lock()
+    
+    def allow_request(self):
+        with self.lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self.probe_in_flight = False
+            
+            if self.state == self.HALF_OPEN:
+                if self.probe_in_flight:
+                    self.rejected += 1
+                    return False
+                self.probe_in_flight = True
+            
+            return True
+    
+    def record_success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.probe_in_flight = False
+    
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.probe_in_flight = False
+    
+    def abandon(self):
+        """A request allow_request() let through was never sent (another may probe instead)"""
+        with self.lock:
+            self.probe_in_flight = False
+    
+    def record_status(self, status_code):
+        if status_code in THROTTLE_STATUS_CODES or status_code == 401 or status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+    
+    def is_open(self):
+        with self.lock:
+            return self.state == self.OPEN and time.monotonic() - self.opened_at < self.reset_timeout
+    
+    def stats(self):
+        with self.lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'times_opened': self.times_opened,
+                'rejected': self.rejected
+            }
+
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(url):
+    """Process-wide breaker for the endpoint family of url"""
+    family = endpoint_family(url)
+    breaker = _circuit_breakers.get(family)
+    if breaker is None:
+        with _circuit_breakers_lock:
+            breaker = _circuit_breakers.setdefault(family, CircuitBreaker(family))
+    return breaker
+
+def circuit_breaker_open(*families):
+    """True if any of the given endpoint families (default: chart) is failing fast"""
+    for family in families or ('chart',):
+        breaker = _circuit_breakers.get(family)
+        if breaker is not None and breaker.is_open():
+            return True
+    return False
+
+def circuit_breaker_stats():
+    """State of every endpoint family's breaker"""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    return {breaker.family: breaker.stats() for breaker in breakers}
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter for the shared pool: checks the endpoint's circuit breaker,
+    paces every request through the host's rate limiter, applies the
+    calling thread's CancelScope and keeps request/connection counters"""
+    
+    def __init__(self, *args, **kwargs):
+        self._stats_lock = threading.Lock()
+        self._requests_sent = 0
+        self._retired_connections = 0  # Connections opened by pools that were since evicted
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        pools = self.poolmanager.pools
+        dispose = pools.dispose_func
+        
+        def dispose_and_count(pool):
+            with self._stats_lock:
+                self._retired_connections += getattr(pool, 'num_connections', 0)
+            if dispose:
+                dispose(pool)
+        
+        pools.dispose_func = dispose_and_count
+    
+    def send(self, request, **kwargs):
+        breaker = get_circuit_breaker(request.url)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for {breaker.family} endpoints", request=request)
+        
+        scope = getattr(_request_scopes, 'scope', None)
+        limiter = get_rate_limiter(request.url)
+        if scope is not None:
+            if scope.event.is_set() or not limiter.acquire(scope.event):
+                breaker.abandon()
+                scope.check(request)
+            kwargs['timeout'] = scope.timeout(kwargs.get('timeout'))
+        else:
+            limiter.acquire()
+        with self._stats_lock:
+            self._requests_sent += 1
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            if scope is not None and scope.expired():
+                breaker.abandon()
+            else:
+                breaker.record_failure()
+            raise
+        limiter.record_response(response.status_code)
+        breaker.record_status(response.status_code)
+        return response
+    
+    def stats(self):
+        """Return request/connection counters across every host pool"""
+        pools = self.poolmanager.pools
+        opened = 0
+        hosts = {}
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            hosts[pool.host] = {
+                'requests': pool.num_requests,
+                'connections_opened': pool.num_connections
+            }
+        with self._stats_lock:
+            requests_sent = self._requests_sent
+            opened += self._retired_connections
+        return {
+            'requests': requests_sent,
+            'connections_opened': opened,
+            'connections_reused': max(requests_sent - opened, 0),
+            'reuse_ratio': (requests_sent - opened) / requests_sent if requests_sent > opened else 0.0,
+            'hosts': hosts
+        }
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+def _build_shared_session(pool_connections, pool_maxsize, pool_block):
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = _CountingHTTPAdapter(pool_connections=pool_connections,
+                                   pool_maxsize=pool_maxsize,
+                                   pool_block=pool_block)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def get_shared_session():
+    """Process-wide requests session backed by one keep-alive connection pool.
+    
+    Every Yahoo call in the app goes through this session so repeated requests
+    reuse open TCP/TLS connections instead of handshaking again.
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = _build_shared_session(HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_POOL_BLOCK)
+    return _shared_session
+
+def configure_http_pool(pool_connections=None, pool_maxsize=None, pool_block=None):
+    """Rebuild the shared session with a different pool size"""
+    global _shared_session, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_POOL_BLOCK
+    with _shared_session_lock:
+        if pool_connections is not None:
+            HTTP_POOL_CONNECTIONS = pool_connections
+        if pool_maxsize is not None:
+            HTTP_POOL_MAXSIZE = pool_maxsize
+        if pool_block is not None:
+            HTTP_POOL_BLOCK = pool_block
+        old_session = _shared_session
+        _shared_session = _build_shared_session(HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_POOL_BLOCK)
+    if old_session is not None:
+        old_session.close()
+    return _shared_session
+
+def http_pool_stats():
+    """Connection reuse counters for the shared pool (requests vs. new connections)"""
+    adapter = get_shared_session().get_adapter('https://')
+    return adapter.stats()
+
+# Single-flight coalescing of identical in-flight requests
+
+def _request_key(url, params):
+    """Normalized (url, params) key identifying one logical Yahoo request"""
+    items = tuple(sorted((str(key), str(value)) for key, value in (params or {}).items()))
+    return url, items
+
+class _FlightCall:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """Run one call per key at a time; concurrent callers share its result
+    
+    When several Streamlit sessions or a screen and an analysis ask for the
+    same URL+params at the same moment, only the first caller (the leader)
+    goes to the network and the rest wait for its parsed response. The shared
+    result object is returned to every caller, so treat it as read-only.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.leaders = 0
+        self.coalesced = 0
+    
+    def do(self, key, fn):
+        with self.lock:
+            call = self.calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                is_leader = False
+            else:
+                call = _FlightCall()
+                self.calls[key] = call
+                self.leaders += 1
+                is_leader = True
+        
+        if not is_leader:
+            call.event.wait()
+            if isinstance(call.error, RequestCancelled):
+                # The leader's caller gave up on it; this caller still wants the response
+                return self.do(key, fn)
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.event.set()
+    
+    def record_coalesced(self):
+        with self.lock:
+            self.coalesced += 1
+    
+    def record_leader(self):
+        with self.lock:
+            self.leaders += 1
+    
+    def stats(self):
+        with self.lock:
+            return {
+                'requests_sent': self.leaders,
+                'coalesced': self.coalesced,
+                'in_flight': len(self.calls)
+            }
+
+_request_flight = SingleFlight()
+
+def single_flight_stats():
+    """How many Yahoo calls went out vs. were served by an identical in-flight call"""
+    return _request_flight.stats()
+
+def _through_response_cache(cache, url, params, data):
+    """Store a fresh response, or fall back to a stale cached one when the fetch failed"""
+    if cache is None:
+        return data
+    if data is not None:
+        cache.put(url, params, data)
+        return data
+    return cache.get(url, params, allow_stale=True)
+
+# Routing to a stand-in server and recording fixtures for offline benchmarks
+
+# Web pages are routed too so scraping fallbacks stay offline (the stand-in answers them 404)
+_YAHOO_API_HOSTS = ('https://query1.finance.yahoo.com', 'https://query2.finance.yahoo.com', 'https://finance.yahoo.com')
+
+def configure_api_base(base):
+    """Send API calls to another host (e.g. a yahoo_standin_server) instead of Yahoo; None restores Yahoo"""
+    global API_BASE
+    API_BASE = (base or '').rstrip('/')
+    configure_store_namespace(API_BASE)
+
+def configure_recording(directory):
+    """Start (or with None, stop) saving live API responses as fixture files"""
+    global RECORD_DIR
+    RECORD_DIR = directory or ''
+
+def _route(url):
+    if API_BASE:
+        for host in _YAHOO_API_HOSTS:
+            if url.startswith(host):
+                return API_BASE + url[len(host):]
+    return url
+
+def _finish_fetch(cache, url, params, data):
+    """Leader-side bookkeeping for a fetched response: record it, then cache or fall back"""
+    if RECORD_DIR and data is not None:
+        from yahoo_standin_server import record_fixture
+        try:
+            record_fixture(RECORD_DIR, url, params, data)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not record fixture for {url}: {e}")
+    return _through_response_cache(cache, url, params, data)
+
+# Request building and response parsing shared by the sync and async clients
+
+HISTORY_PERIOD_DAYS = {
+    '1d': 1,
+    '5d': 5,
+    '1mo': 30,
+    '3mo': 90,
+    '6mo': 180,
+    '1y': 365,
+    '2y': 730,
+    '5y': 1825,
+    '10y': 3650,
+    'max': 7300
+}
+
+def _history_window(period):
+    """(start, end) epoch seconds for a history period"""
+    # End rounded up to the minute so concurrent requests for the same window
+    # share one key for request coalescing
+    end_time = (int(time.time()) // 60 + 1) * 60
+    days = HISTORY_PERIOD_DAYS.get(period, 730)
+    return end_time - (days * 24 * 60 * 60), end_time
+
+def _history_request(symbol, period, start_time=None):
+    """Chart URL and params for a daily history window (optionally from start_time onward)"""
+    window_start, end_time = _history_window(period)
+    if start_time is None:
+        start_time = window_start
+    
+    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+    params = {
+        'period1': start_time,
+        'period2': end_time,
+        'interval': '1d',
+        'includePrePost': 'true',
+        'events': 'div,split'
+    }
+    return url, params
+
+def _search_params(query):
+    return {
+        'q': query,
+        'quotesCount': 10,
+        'newsCount': 0
+    }
+
+def _info_api_attempts(symbol):
+    """Endpoint combinations tried (in order) for detailed company info"""
+    return [
+        # Comprehensive endpoint
+        {
+            'url': f"https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}",
+            'params': {'modules': 'summaryDetail,defaultKeyStatistics,financialData,price,upgradeDowngradeHistory'}
+        },
+        # Alternative endpoint  
+        {
+            'url': f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}",
+            'params': {'interval': '1d', 'range': '1d', 'includePrePost': 'true'}
+        },
+        # Simple info endpoint
+        {
+            'url': f"https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}",
+            'params': {'modules': 'price,summaryDetail'}
+        }
+    ]
+
+def _alternative_info_endpoints(symbol):
+    """Yahoo Finance mobile API (sometimes works when main API doesn't)"""
+    return [
+        f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={symbol}",
+        f"https://query2.finance.yahoo.com/v7/finance/options/{symbol}",
+        f"https://query1.finance.yahoo.com/v11/finance/quoteSummary/{symbol}?modules=price"
+    ]
+
+def _parse_chart_quote(symbol, data):
+    """Build a quote dict from a /v8/finance/chart response"""
+    if not data:
+        return None
+    
+    try:
+        result = data['chart']['result'][0]
+        meta = result['meta']
+        
+        quote_data = {
+            'symbol': symbol,
+            'currentPrice': meta.get('regularMarketPrice'),
+            'previousClose': meta.get('previousClose'),
+            'regularMarketOpen': meta.get('regularMarketOpen'),
+            'regularMarketDayHigh': meta.get('regularMarketDayHigh'),
+            'regularMarketDayLow': meta.get('regularMarketDayLow'),
+            'regularMarketVolume': meta.get('regularMarketVolume'),
+            'currency': meta.get('currency'),
+            'exchangeName': meta.get('exchangeName'),
+            'longName': meta.get('longName', symbol),
+            'shortName': meta.get('shortName', symbol)
+        }
+        
+        return quote_data
+    
+    except (KeyError, IndexError, TypeError) as e:
+        print(f"Error parsing quote data for {symbol}: {e}")
+        return None
+
+def _parse_batch_quote(result):
+    """Map a /v7/finance/quote result onto the get_quote/get_info field names"""
+    symbol = result.get('symbol')
+    if not symbol:
+        return None
+    
+    quote = {
+        'symbol': symbol.upper(),
+        'currentPrice': result.get('regularMarketPrice'),
+        'regularMarketPrice': result.get('regularMarketPrice'),
+        'previousClose': result.get('regularMarketPreviousClose'),
+        'regularMarketOpen': result.get('regularMarketOpen'),
+        'regularMarketDayHigh': result.get('regularMarketDayHigh'),
+        'regularMarketDayLow': result.get('regularMarketDayLow'),
+        'regularMarketVolume': result.get('regularMarketVolume'),
+        'regularMarketChangePercent': result.get('regularMarketChangePercent'),
+        'currency': result.get('currency'),
+        'exchangeName': result.get('fullExchangeName', result.get('exchange')),
+        'quoteType': result.get('quoteType'),
+        'longName': result.get('longName', symbol),
+        'shortName': result.get('shortName', symbol)
+    }
+    
+    # Valuation fields the screening prefilters need
+    field_mapping = {
+        'marketCap': 'marketCap',
+        'trailingPE': 'trailingPE',
+        'forwardPE': 'forwardPE',
+        'priceToBook': 'priceToBook',
+        'sharesOutstanding': 'sharesOutstanding',
+        'dividendYield': 'dividendYield',
+        'trailingEps': 'epsTrailingTwelveMonths',
+        'bookValue': 'bookValue'
+    }
+    for key, source_key in field_mapping.items():
+        value = result.get(source_key)
+        if value is not None:
+            quote[key] = value
+    
+    return quote
+
+def _parse_batch_quotes(data, symbols):
+    """Parse a multi-symbol quote response into {symbol: quote}; None if malformed"""
+    if not data:
+        return None
+    try:
+        quotes = {}
+        for result in data['quoteResponse']['result'] or []:
+            quote = _parse_batch_quote(result)
+            if quote and quote['symbol'] in symbols:
+                quotes[quote['symbol']] = quote
+        return quotes
+    except (KeyError, TypeError) as e:
+        print(f"Error parsing batch quote data: {e}")
+        return None
+
+def _parse_chart_history(symbol, data, float32=None):
+    """Build an OHLCV DataFrame from a /v8/finance/chart history response
+    
+    Timestamps go straight to a datetime64 index through NumPy and each OHLCV
+    column is built from a NumPy array (JSON nulls become NaN), so a 20-year
+    payload parses without a Python-level loop per bar. Prices are stored as
+    float32 when float32=True (or HISTORY_FLOAT32 is set); Volume stays float64.
+    The index is naive UTC.
+    """
+    if not data:
+        return pd.DataFrame()
+    
+    if float32 is None:
+        float32 = HISTORY_FLOAT32
+    price_dtype = np.float32 if float32 else np.float64
+    
+    try:
+        result = data['chart']['result'][0]
+        timestamps = np.asarray(result['timestamp'], dtype=np.int64)
+        quotes = result['indicators']['quote'][0]
+        
+        # Create DataFrame from NumPy columns
+        df = pd.DataFrame({
+            'Open': np.asarray(quotes['open'], dtype=price_dtype),
+            'High': np.asarray(quotes['high'], dtype=price_dtype),
+            'Low': np.asarray(quotes['low'], dtype=price_dtype),
+            'Close': np.asarray(quotes['close'], dtype=price_dtype),
+            'Volume': np.asarray(quotes['volume'], dtype=np.float64)
+        }, index=pd.DatetimeIndex(timestamps.astype('datetime64[s]'), name='Date'), copy=False)
+        
+        # Remove rows with all NaN values
+        df = df.dropna(how='all')
+        
+        return df
+    
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        print(f"Error parsing historical data for {symbol}: {e}")
+        return pd.DataFrame()
+
+def _merge_api_response(info, data):
+    """Merge a quoteSummary or chart response into an info dict"""
+    # Parse different response structures
+    if 'quoteSummary' in data:
+        result = data['quoteSummary']['result']
+        if result and len(result) > 0:
+            # Process all modules
+            for module_name, module_data in result[0].items():
+                if module_data:
+                    for key, value in module_data.items():
+                        if isinstance(value, dict) and 'raw' in value:
+                            info[key] = value['raw']
+                        elif isinstance(value, dict) and 'fmt' in value:
+                            info[key] = value.get('raw', value['fmt'])
+                        else:
+                            info[key] = value
+    
+    elif 'chart' in data:
+        # Parse chart response for basic data
+        chart_result = data['chart']['result'][0]
+        meta = chart_result['meta']
+        for key, value in meta.items():
+            if key not in info:  # Don't override existing data
+                info[key] = value
+    
+    return info
+
+def _merge_alternative_response(info, data):
+    """Merge a v7 quote/options response into info; returns (info, substantial)"""
+    # Parse quote response
+    if 'quoteResponse' in data and 'result' in data['quoteResponse']:
+        results = data['quoteResponse']['result']
+        if results and len(results) > 0:
+            result = results[0]
+            
+            # Map financial metrics
+            field_mapping = {
+                'trailingPE': result.get('trailingPE'),
+                'forwardPE': result.get('forwardPE'), 
+                'priceToBook': result.get('priceToBook'),
+                'marketCap': result.get('marketCap'),
+                'sharesOutstanding': result.get('sharesOutstanding'),
+                'dividendYield': result.get('dividendYield'),
+                'trailingEps': result.get('epsTrailingTwelveMonths'),
+                'bookValue': result.get('bookValue')
+            }
+            
+            # Add valid data
+            for key, value in field_mapping.items():
+                if value is not None and value != 0:
+                    info[key] = value
+            
+            # If we got substantial data, return it
+            if len([v for v in field_mapping.values() if v is not None]) >= 3:
+                return info, True
+    
+    # Parse options response for basic data
+    if 'optionChain' in data and 'result' in data['optionChain']:
+        results = data['optionChain']['result']
+        if results and len(results) > 0:
+            quote_data = results[0].get('quote', {})
+            for key in ['trailingPE', 'forwardPE', 'priceToBook', 'marketCap']:
+                if key in quote_data and quote_data[key] is not None:
+                    info[key] = quote_data[key]
+    
+    return info, False
+
+def _parse_search_results(data):
+    """Equity/ETF matches from a /v1/finance/search response"""
+    if not data:
+        return []
+    
+    try:
+        quotes = data.get('quotes', [])
+        results = []
+        
+        for quote in quotes:
+            if quote.get('typeDisp') in ['Equity', 'ETF']:
+                results.append({
+                    'symbol': quote.get('symbol'),
+                    'name': quote.get('longname', quote.get('shortname', '')),
+                    'type': quote.get('typeDisp'),
+                    'exchange': quote.get('exchDisp', ''),
+                    'score': quote.get('score', 0)
+                })
+        
+        return results
+    
+    except (KeyError, TypeError) as e:
+        print(f"Error parsing search results: {e}")
+        return []
+
+# Financial statements from the fundamentals time-series endpoint
+
+STATEMENT_TYPES = {
+    'financials': (
+        'TotalRevenue', 'OperatingRevenue', 'CostOfRevenue', 'GrossProfit', 'OperatingExpense',
+        'SellingGeneralAndAdministration', 'ResearchAndDevelopment', 'OperatingIncome', 'EBIT',
+        'EBITDA', 'InterestExpense', 'PretaxIncome', 'TaxProvision', 'NetIncome',
+        'NetIncomeCommonStockholders', 'BasicEPS', 'DilutedEPS', 'BasicAverageShares',
+        'DilutedAverageShares', 'ReconciledDepreciation', 'TotalExpenses'
+    ),
+    'balance_sheet': (
+        'TotalAssets', 'CurrentAssets', 'CashAndCashEquivalents',
+        'CashCashEquivalentsAndShortTermInvestments', 'Receivables', 'AccountsReceivable',
+        'Inventory', 'NetPPE', 'GrossPPE', 'GoodwillAndOtherIntangibleAssets',
+        'TotalNonCurrentAssets', 'TotalLiabilitiesNetMinorityInterest', 'CurrentLiabilities',
+        'AccountsPayable', 'CurrentDebt', 'LongTermDebt', 'TotalDebt', 'NetDebt',
+        'StockholdersEquity', 'CommonStockEquity', 'RetainedEarnings', 'WorkingCapital',
+        'TangibleBookValue', 'InvestedCapital', 'OrdinarySharesNumber', 'ShareIssued'
+    ),
+    'cashflow': (
+        'OperatingCashFlow', 'CapitalExpenditure', 'FreeCashFlow', 'InvestingCashFlow',
+        'FinancingCashFlow', 'DepreciationAndAmortization', 'StockBasedCompensation',
+        'ChangeInWorkingCapital', 'CashDividendsPaid', 'RepurchaseOfCapitalStock',
+        'IssuanceOfDebt', 'RepaymentOfDebt', 'NetIncomeFromContinuingOperations',
+        'ChangesInCash', 'EndCashPosition'
+    ),
+}
+STATEMENT_FREQUENCIES = {'annual': '', 'quarterly': 'quarterly_'}  # Type prefix -> statement name prefix
+STATEMENT_HISTORY_YEARS = 6
+STATEMENTS_TTL = float(os.environ.get('YAHOO_STATEMENTS_TTL_SECONDS', 24 * 60 * 60))  # Statements change quarterly
+STATEMENTS_CACHE_MAX_BYTES = int(float(os.environ.get('YAHOO_STATEMENTS_CACHE_MAX_MB', 64)) * 1024 * 1024)
+
+_STATEMENT_OF_TYPE = {
+    frequency + key: (prefix + statement, key)
+    for statement, keys in STATEMENT_TYPES.items()
+    for key in keys
+    for frequency, prefix in STATEMENT_FREQUENCIES.items()
+}
+
+def _statements_request(symbol):
+    """One time-series request covering annual and quarterly series of all three statements"""
+    # End rounded to the hour so the params (and the coalescing key) are stable
+    end_time = (int(time.time()) // 3600 + 1) * 3600
+    url = f"https://query2.finance.yahoo.com/ws/fundamentals-timeseries/v1/finance/timeseries/{symbol}"
+    params = {
+        'symbol': symbol,
+        'type': ','.join(_STATEMENT_OF_TYPE),
+        'period1': end_time - STATEMENT_HISTORY_YEARS * 366 * 24 * 60 * 60,
+        'period2': end_time,
+        'merge': 'false',
+        'padTimeSeries': 'true',
+        'lang': 'en-US',
+        'region': 'US'
+    }
+    return url, params
+
+def _statement_label(key):
+    """'TotalLiabilitiesNetMinorityInterest' -> 'Total Liabilities Net Minority Interest', 'NetPPE' -> 'Net PPE'"""
+    return re.sub(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', ' ', key)
+
+def _empty_statements():
+    return {prefix + statement: pd.DataFrame() for statement in STATEMENT_TYPES for prefix in STATEMENT_FREQUENCIES.values()}
+
+def _parse_statements(symbol, data):
+    """Split a time-series response into yfinance-shaped statements
+    
+    Returns {'financials', 'balance_sheet', 'cashflow', 'quarterly_*'} where
+    each frame has line items as rows ('Total Revenue', 'Operating Cash Flow',
+    ...) and period-end dates as columns, most recent first. Statements Yahoo
+    has nothing for come back as empty frames.
+    """
+    statements = _empty_statements()
+    if not data:
+        return statements
+    
+    try:
+        results = data['timeseries']['result'] or []
+    except (KeyError, TypeError) as e:
+        print(f"Error parsing statements for {symbol}: {e}")
+        return statements
+    
+    rows = {name: {} for name in statements}
+    for series in results:
+        try:
+            type_name = series['meta']['type'][0]
+        except (KeyError, IndexError, TypeError):
+            continue
+        if type_name not in _STATEMENT_OF_TYPE:
+            continue
+        
+        statement, key = _STATEMENT_OF_TYPE[type_name]
+        values = {}
+        for point in series.get(type_name) or []:
+            if not point or not point.get('asOfDate'):
+                continue
+            reported = point.get('reportedValue') or {}
+            if reported.get('raw') is not None:
+                values[pd.Timestamp(point['asOfDate'])] = reported['raw']
+        if values:
+            rows[statement][_statement_label(key)] = values
+    
+    for name, statement_rows in rows.items():
+        if not statement_rows:
+            continue
+        frame = pd.DataFrame.from_dict(statement_rows, orient='index')
+        # Line items in the usual statement order, newest period first
+        order = [_statement_label(key) for key in STATEMENT_TYPES[name.replace('quarterly_', '')]]
+        frame = frame.reindex([label for label in order if label in frame.index])
+        statements[name] = frame[sorted(frame.columns, reverse=True)]
+    
+    return statements
+
+class _ByteBudgetLRU:
+    """Map that evicts its least recently used values past max_bytes; callers hold their own lock
+    
+    Only the newest value is kept when it alone is over budget. on_evict(key)
+    is called for each evicted key.
+    """
+    
+    def __init__(self, max_bytes, on_evict=None):
+        self.values = OrderedDict()  # key -> (value, size), least recently used first
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self.bytes = 0
+        self.evictions = 0
+    
+    def __contains__(self, key):
+        return key in self.values
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def get(self, key):
+        item = self.values.get(key)
+        if item is None:
+            return None
+        self.values.move_to_end(key)
+        return item[0]
+    
+    def set(self, key, value, size):
+        self.pop(key)
+        self.values[key] = (value, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self.values) > 1:
+            evicted, (_, evicted_size) = self.values.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(evicted)
+    
+    def pop(self, key):
+        item = self.values.pop(key, None)
+        if item is None:
+            return None
+        self.bytes -= item[1]
+        return item[0]
+    
+    def items(self):
+        return [(key, value) for key, (value, _) in self.values.items()]
+    
+    def clear(self):
+        self.values.clear()
+        self.bytes = 0
+
+# Parsed statements in memory, byte-bounded; the market store keeps the raw responses
+_statements_cache = _ByteBudgetLRU(STATEMENTS_CACHE_MAX_BYTES)
+_statements_cache_lock = threading.Lock()
+
+def _cached_statements(symbol):
+    with _statements_cache_lock:
+        entry = _statements_cache.get(symbol)
+    if entry and time.time() - entry[1] < STATEMENTS_TTL:
+        return entry[0]
+    return None
+
+def _store_statements(symbol, statements):
+    # Only remember real data; an empty response is retried on the next call
+    if any(not frame.empty for frame in statements.values()):
+        size = estimate_size(statements)
+        with _statements_cache_lock:
+            _statements_cache.set(symbol, (statements, time.time()), size)
+    return statements
+
+def statements_cache_stats():
+    with _statements_cache_lock:
+        return {
+            'symbols': len(_statements_cache),
+            'bytes': _statements_cache.bytes,
+            'max_bytes': _statements_cache.max_bytes,
+            'evictions': _statements_cache.evictions
+        }
+
+def _stored_statements(symbol):
+    """Statements parsed from the persistent store's response, if it is within STATEMENTS_TTL"""
+    store = get_market_store()
+    data = store.get_statements(symbol, max_age=STATEMENTS_TTL) if store is not None else None
+    return _store_statements(symbol, _parse_statements(symbol, data)) if data else None
+
+def _statements_from_response(symbol, data):
+    """Parse a fetched statements response, persisting it when it holds any data"""
+    statements = _parse_statements(symbol, data)
+    if any(not frame.empty for frame in statements.values()):
+        _persist('put_statements', symbol, data)
+    return _store_statements(symbol, statements)
+
+# Persistent market-data store (market_store.py): info snapshots survive restarts
+
+def _persist(method, symbol, *args):
+    """Call a MarketStore write method; a failing store never fails the request"""
+    store = get_market_store()
+    if store is None:
+        return
+    try:
+        getattr(store, method)(symbol, *args)
+    except Exception as e:
+        print(f"Market data store write failed for {symbol}: {e}")
+
+def _stored_info(symbol, allow_stale=False):
+    """Info snapshot from the persistent store (fresh within INFO_SNAPSHOT_TTL unless allow_stale)"""
+    store = get_market_store()
+    if store is None:
+        return None
+    return store.get_info(symbol, max_age=None if allow_stale else INFO_SNAPSHOT_TTL)
+
+def _overlay_quote(info, quote):
+    """A stored info snapshot with a live quote's price and valuation fields on top; None without a quote
+    
+    Fundamentals in a snapshot stay good for INFO_SNAPSHOT_TTL, but its
+    price, market cap and price ratios are only as fresh as the quote.
+    """
+    if not quote or quote.get('currentPrice') is None:
+        return None
+    info = dict(info)
+    info.update({key: value for key, value in quote.items() if value is not None})
+    return info
+
+def _snapshot_info(symbol, info):
+    """Persist a fetched info dict; when the fetch came back empty, fall back to the last snapshot"""
+    if info and info.get('currentPrice') is not None:
+        _persist('put_info', symbol, dict(info))
+    elif not info:
+        info = _stored_info(symbol, allow_stale=True) or info
+    return info
+
+# HTML fundamentals scanning: precompiled, each blob located and decoded once
+
+# Where Yahoo embeds JSON in its pages. Every marker starts with a literal so
+# the regex engine can skip ahead at C speed; the JSON decoder takes it from there
+_JSON_BLOB_MARKERS = tuple(re.compile(pattern) for pattern in (
+    r'root\.App\.main\s*=\s*',
+    r'"QuoteSummaryStore"\s*:\s*',
+    r'"quoteSummary"\s*:\s*',
+    r'"summaryDetail"\s*:\s*',
+    r'"defaultKeyStatistics"\s*:\s*',
+    r'"financialData"\s*:\s*',
+    r'data-sveltekit-fetched[^>]{0,2000}>',
+))
+
+# Statistics-table labels as Yahoo prints them, and the info key their value maps to
+HTML_STAT_LABELS = {
+    'Market Cap': 'marketCap',
+    'Trailing P/E': 'trailingPE',
+    'PE Ratio': 'trailingPE',
+    'P/E Ratio': 'trailingPE',
+    'Forward P/E': 'forwardPE',
+    'Price/Book': 'priceToBook',
+    'Price to Book': 'priceToBook',
+    'Diluted EPS': 'trailingEps',
+    'EPS': 'trailingEps',
+    'Book Value Per Share': 'bookValue',
+    'Shares Outstanding': 'sharesOutstanding',
+    'Forward Annual Dividend Yield': 'dividendYield',
+}
+
+# A label as the text right after a tag, then only markup up to the value;
+# every repeat is bounded so a large page can't trigger runaway backtracking
+_STAT_TEXT_PATTERN = re.compile(
+    r'>\s*(?P<label>' + '|'.join(re.escape(label) for label in sorted(HTML_STAT_LABELS, key=len, reverse=True)) + r')'
+    r'\s*(?:\([^)<]{1,20}\)\s*)?(?:<sup[^>]{0,200}>[^<]{0,10}</sup>\s*)?'
+    r'(?:<[^>]{0,300}>\s*){1,8}'
+    r'(?P<value>-?[0-9][0-9,]{0,20}(?:\.[0-9]{1,6})?[KMBT%]?)(?=\s*[<(])'
+)
+
+_JSON_DECODER = json.JSONDecoder()
+
+_VALUE_SUFFIXES = {'K': 1e3, 'M': 1e6, 'B': 1e9, 'T': 1e12}
+
+def _parse_stat_value(text):
+    """'3.2T' -> 3.2e12, '0.45%' -> 0.0045, '28.53' -> 28.53 (None if unparseable)"""
+    text = text.replace(',', '')
+    try:
+        if text.endswith('%'):
+            return float(text[:-1]) / 100
+        multiplier = _VALUE_SUFFIXES.get(text[-1:])
+        if multiplier:
+            return float(text[:-1]) * multiplier
+        return float(text)
+    except ValueError:
+        return None
+
+def _decode_json_blob(html, start):
+    """Decode the JSON object starting at (or just after whitespace at) start; (value or None, end)"""
+    while start < len(html) and html[start] in ' \t\r\n':
+        start += 1
+    if not html.startswith('{', start):
+        return None, start
+    
+    try:
+        value, end = _JSON_DECODER.raw_decode(html, start)
+    except ValueError:
+        return None, start
+    
+    # SvelteKit pages wrap the API response as an escaped JSON string in "body"
+    if isinstance(value, dict) and isinstance(value.get('body'), str):
+        try:
+            value = json.loads(value['body'])
+        except ValueError:
+            pass
+    return value, end
+
+@lru_cache(maxsize=8)
+def _scan_html_json(html):
+    """Embedded JSON values of a Yahoo page, in page order
+    
+    Blob markers are located up front and each blob is decoded once with
+    raw_decode; markers nested inside an already decoded blob are skipped.
+    Cached per page so the several extractors run on one response share the
+    work; treat the values as read-only.
+    """
+    markers = sorted(
+        (match.start(), match.end())
+        for marker in _JSON_BLOB_MARKERS
+        for match in marker.finditer(html)
+    )
+    
+    blobs = []
+    decoded_until = 0
+    for marker_start, marker_end in markers:
+        if marker_start < decoded_until:
+            continue
+        value, end = _decode_json_blob(html, marker_end)
+        if value is not None:
+            blobs.append(value)
+            decoded_until = end
+    
+    return tuple(blobs)
+
+@lru_cache(maxsize=8)
+def _scan_html_table(html):
+    """{info key: first value} from the statistics-table text of a Yahoo page
+    
+    The fallback for pages without usable JSON, so callers only run it for
+    metrics the blobs didn't have. Treat the result as read-only.
+    """
+    stats = {}
+    for match in _STAT_TEXT_PATTERN.finditer(html):
+        metric = HTML_STAT_LABELS[match.group('label')]
+        value = _parse_stat_value(match.group('value'))
+        if value is not None and metric not in stats:
+            stats[metric] = value
+    return stats
+
+# Incrementally refreshed daily history
+
+HISTORY_REFRESH_INTERVAL = float(os.environ.get('YAHOO_HISTORY_REFRESH_SECONDS', 300))  # Serve stored bars without asking Yahoo
+HISTORY_ADJUSTMENT_RTOL = 1e-4  # Relative Close change on an overlapping bar that signals a split/dividend restatement
+HISTORY_CACHE_MAX_BYTES = int(float(os.environ.get('YAHOO_HISTORY_CACHE_MAX_MB', 128)) * 1024 * 1024)  # Bars kept in memory
+
+def _chart_last_event(data):
+    """Latest split or dividend date (epoch seconds) in a chart response, 0 if none"""
+    try:
+        events = data['chart']['result'][0].get('events') or {}
+    except (KeyError, IndexError, TypeError):
+        return 0
+    
+    dates = [
+        event.get('date', 0)
+        for kind in ('dividends', 'splits')
+        for event in (events.get(kind) or {}).values()
+    ]
+    return max(dates, default=0)
+
+def _dedupe_daily_bars(bars):
+    """One row per calendar day (the latest bar wins, e.g. a settled bar over a live one), sorted"""
+    bars = bars[~bars.index.normalize().duplicated(keep='last')]
+    return bars.sort_index()
+
+class HistoryStore:
+    """Per-symbol daily bars, kept in memory and in the persistent market store
+    
+    The first get_history for a symbol downloads the whole window, unless the
+    persistent store has its bars from an earlier run. Later calls
+    within HISTORY_REFRESH_INTERVAL are served from memory; after that only the
+    bars from the second-to-last stored bar onward are requested and merged in.
+    The overlap is checked against what we stored: a changed Close there, or a
+    new split/dividend event, means Yahoo has restated the series and the
+    symbol is refetched in full. Bars in memory are held to max_bytes,
+    least recently used first out; an evicted symbol is read back from the
+    persistent store when it is next asked for.
+    """
+    
+    def __init__(self, max_bytes=HISTORY_CACHE_MAX_BYTES):
+        self.lock = threading.Lock()
+        self.restored = set()  # Symbols already looked up in the persistent store
+        self.entries = _ByteBudgetLRU(max_bytes, on_evict=self.restored.discard)
+        self.hits = 0
+        self.restores = 0
+        self.incremental_fetches = 0
+        self.full_fetches = 0
+        self.adjustments = 0
+    
+    def plan(self, symbol, period):
+        """('hit', bars) when stored bars are fresh, else (mode, url, params) to request"""
+        start_time = _history_window(period)[0]
+        self._restore(symbol)
+        
+        with self.lock:
+            entry = self.entries.get(symbol)
+            if entry is None or entry['start'] > start_time or len(entry['bars']) < 2:
+                return ('full',) + _history_request(symbol, period)
+            
+            if time.time() - entry['checked_at'] < HISTORY_REFRESH_INTERVAL:
+                self.hits += 1
+                return 'hit', self._window(entry['bars'], start_time)
+            
+            # Overlap one settled bar; the last stored bar may have been a live one
+            since = int(entry['bars'].index[-2].timestamp())
+        
+        return ('incremental',) + _history_request(symbol, period, start_time=since)
+    
+    def _restore(self, symbol):
+        """Load a symbol's bars from the persistent store the first time it is asked for"""
+        with self.lock:
+            if symbol in self.entries or symbol in self.restored:
+                return
+            self.restored.add(symbol)
+        
+        store = get_market_store()
+        try:
+            stored = store.get_history(symbol) if store is not None else None
+        except Exception as e:
+            print(f"Market data store read failed for {symbol}: {e}")
+            stored = None
+        if stored is None:
+            return
+        
+        bars, meta = stored
+        with self.lock:
+            if symbol not in self.entries:
+                self._set(symbol, dict(meta, bars=bars))
+                self.restores += 1
+    
+    def apply(self, symbol, period, mode, params, data):
+        """Merge a planned response; returns None when a full refetch is needed"""
+        start_time = _history_window(period)[0]
+        bars = _parse_chart_history(symbol, data, float32=False)
+        
+        with self.lock:
+            entry = self.entries.get(symbol)
+            
+            if mode == 'incremental' and entry is not None:
+                if bars.empty:
+                    # Keep serving what we have; try again on the next call
+                    return self._window(entry['bars'], start_time)
+                
+                if self._restated(entry, bars, _chart_last_event(data), params['period1']):
+                    self.adjustments += 1
+                    self.entries.pop(symbol)
+                    persist = ('delete_history', symbol)
+                    result = None
+                else:
+                    entry['bars'] = _dedupe_daily_bars(pd.concat([entry['bars'], bars]))
+                    entry['checked_at'] = time.time()
+                    self._set(symbol, entry)
+                    self.incremental_fetches += 1
+                    # Only the new bars are written; they replace stored ones day by day
+                    persist = ('put_history', symbol, _dedupe_daily_bars(bars), entry['start'],
+                               entry['last_event'], entry['checked_at'], False)
+                    result = self._window(entry['bars'], start_time)
+            elif bars.empty:
+                return bars
+            else:
+                entry = {
+                    'bars': _dedupe_daily_bars(bars),
+                    'start': params['period1'],
+                    'last_event': _chart_last_event(data),
+                    'checked_at': time.time()
+                }
+                self._set(symbol, entry)
+                self.full_fetches += 1
+                persist = ('put_history', symbol, entry['bars'], entry['start'],
+                           entry['last_event'], entry['checked_at'])
+                result = self._window(entry['bars'], start_time)
+        
+        # Disk writes happen outside the lock so other symbols aren't held up
+        _persist(*persist)
+        return result
+    
+    def _set(self, symbol, entry):
+        # Caller holds self.lock; OHLCV columns are numeric, so a shallow memory_usage is exact
+        self.entries.set(symbol, entry, int(entry['bars'].memory_usage(index=True).sum()))
+    
+    def _restated(self, entry, bars, last_event, since):
+        if last_event > max(entry['last_event'], since):
+            return True
+        
+        stored = entry['bars'].iloc[:-1]
+        stored_close = pd.Series(stored['Close'].to_numpy(), index=stored.index.normalize())
+        fresh = _dedupe_daily_bars(bars)
+        fresh_close = pd.Series(fresh['Close'].to_numpy(), index=fresh.index.normalize())
+        
+        common = stored_close.index.intersection(fresh_close.index)
+        if len(common) == 0:
+            # Nothing to compare against, so the stored series can't be trusted
+            return True
+        
+        return not np.allclose(
+            stored_close.loc[common].to_numpy(), fresh_close.loc[common].to_numpy(),
+            rtol=HISTORY_ADJUSTMENT_RTOL, equal_nan=True
+        )
+    
+    @staticmethod
+    def _window(bars, start_time):
+        return bars.loc[bars.index >= pd.Timestamp(start_time, unit='s')]
+    
+    def clear(self, symbol=None):
+        """Forget bars in memory (the persistent store is left alone)"""
+        with self.lock:
+            if symbol is None:
+                self.entries.clear()
+                self.restored.clear()
+            else:
+                self.entries.pop(symbol)
+                self.restored.discard(symbol)
+    
+    def stats(self):
+        with self.lock:
+            return {
+                'symbols': len(self.entries),
+                'bars': sum(len(entry['bars']) for _, entry in self.entries.items()),
+                'bytes': self.entries.bytes,
+                'evictions': self.entries.evictions,
+                'hits': self.hits,
+                'restored_from_disk': self.restores,
+                'incremental_fetches': self.incremental_fetches,
+                'full_fetches': self.full_fetches,
+                'adjustments': self.adjustments
+            }
+
+_history_store = HistoryStore()
+
+def history_store_stats():
+    """Stored symbols/bars and how get_history calls were satisfied"""
+    return _history_store.stats()
+
+def _history_output(bars, float32):
+    """Copy of stored bars for the caller, in float32 if asked"""
+    if float32 is None:
+        float32 = HISTORY_FLOAT32
+    if float32 and not bars.empty:
+        return bars.astype({column: np.float32 for column in ('Open', 'High', 'Low', 'Close')})
+    return bars.copy()
+
+# Hedged get_info: race the info endpoints under one deadline
+
+INFO_CORE_FIELDS = (
+    'marketCap', 'trailingPE', 'forwardPE', 'priceToBook', 'trailingEps',
+    'bookValue', 'dividendYield', 'sharesOutstanding'
+)
+INFO_MIN_FIELDS = 3  # Core fields a response needs to count as complete enough
+
+def _info_hedge_plan(symbol):
+    """(name, url, params) racers for a hedged get_info, most complete source first"""
+    return [
+        ('quoteSummary', f"https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}",
+         {'modules': 'summaryDetail,defaultKeyStatistics,financialData,price,upgradeDowngradeHistory'}),
+        ('quote', "https://query1.finance.yahoo.com/v7/finance/quote", {'symbols': symbol}),
+        ('quoteSummaryBasic', f"https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}",
+         {'modules': 'price,summaryDetail'}),
+        ('options', f"https://query2.finance.yahoo.com/v7/finance/options/{symbol}", None),
+    ]
+
+def _merge_info_response(info, data):
+    """Merge any info endpoint's response (quoteSummary, chart, v7 quote/options) into info"""
+    info = _merge_api_response(info, data)
+    info, _ = _merge_alternative_response(info, data)
+    return info
+
+def _info_complete(info):
+    return sum(1 for key in INFO_CORE_FIELDS if info.get(key) is not None) >= INFO_MIN_FIELDS
+
+class _InfoRace:
+    """Bookkeeping for one hedged get_info
+    
+    Racers are launched in plan order, one more every INFO_HEDGE_DELAY seconds
+    (or at once when the previous ones have all come back incomplete). A complete response
+    wins as soon as every higher-priority racer has finished without one, so
+    a fast v7 quote never beats a quoteSummary that is still on its way. At the
+    deadline the best response received so far is used.
+    """
+    
+    def __init__(self, symbol):
+        self.plan = _info_hedge_plan(symbol)
+        self.launched = 0
+        self.fragments = {}
+    
+    def record(self, index, data):
+        try:
+            self.fragments[index] = _merge_info_response({}, data) if data else None
+        except (KeyError, IndexError, TypeError, AttributeError):
+            self.fragments[index] = None
+    
+    def should_launch(self, next_launch):
+        if self.launched >= len(self.plan):
+            return False
+        # Nothing left in flight (and no winner) - no point waiting out the delay
+        all_finished = all(index in self.fragments for index in range(self.launched))
+        return time.monotonic() >= next_launch or all_finished
+    
+    def winner(self):
+        """Index of the winning racer, or None while undecided"""
+        for index in range(self.launched):
+            if index not in self.fragments:
+                return None
+            if self.fragments[index] and _info_complete(self.fragments[index]):
+                return index
+        return None
+    
+    def exhausted(self):
+        return self.launched == len(self.plan) and len(self.fragments) == self.launched
+    
+    def best(self):
+        """Best response so far: the highest-priority complete one, else the largest"""
+        received = [(index, fragment) for index, fragment in sorted(self.fragments.items()) if fragment]
+        for index, fragment in received:
+            if _info_complete(fragment):
+                return index
+        if received:
+            return max(received, key=lambda item: len(item[1]))[0]
+        return None
+
+class HedgeStats:
+    """Counters for hedged get_info calls"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/json',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Sec-Fetch-Dest': 'empty',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'same-site'
-        })
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.hedges_fired = 0
+        self.cancelled = 0
+        self.deadline_hits = 0
+        self.wins = {}
+    
+    def record(self, race, winner, cancelled, deadline_hit):
+        with self.lock:
+            self.calls += 1
+            self.hedges_fired += max(race.launched - 1, 0)
+            self.cancelled += cancelled
+            self.deadline_hits += int(deadline_hit)
+            name = race.plan[winner][0] if winner is not None else 'none'
+            self.wins[name] = self.wins.get(name, 0) + 1
+    
+    def stats(self):
+        with self.lock:
+            return {
+                'calls': self.calls,
+                'hedges_fired': self.hedges_fired,
+                'cancelled': self.cancelled,
+                'deadline_hits': self.deadline_hits,
+                'wins': dict(self.wins)
+            }
+
+_info_hedge_stats = HedgeStats()
+
+def info_hedge_stats():
+    """How hedged get_info calls were won, and how many racers were fired and cancelled"""
+    return _info_hedge_stats.stats()
+
+_hedge_executor = None
+_hedge_executor_lock = threading.Lock()
+
+def _get_hedge_executor():
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _hedge_executor_lock:
+            if _hedge_executor is None:
+                _hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=INFO_HEDGE_WORKERS, thread_name_prefix='yahoo-hedge'
+                )
+    return _hedge_executor
+
+class DirectYahooFinance:
+    """Direct Yahoo Finance API wrapper to replace yfinance
+    
+    refresh=True skips fresh cached responses and stored info snapshots so
+    every call asks Yahoo (what it gets back is still cached and stored).
+    """
+    
+    def __init__(self, session=None, refresh=False):
+        # All instances share the process-wide pool unless a session is injected
+        self._session = session
+        self.refresh = refresh
         
+    @property
+    def session(self):
+        """The injected session, else the current shared one (so configure_http_pool
+        reaches clients created before it)"""
+        return self._session or get_shared_session()
+    
     def _make_request(self, url, params=None, retries=3):
-        """Make request with retries and delays"""
+        """Make request with retries, coalescing identical concurrent calls and
+        answering from the on-disk response cache while its entry is fresh"""
+        url = _route(url)
+        cache = get_response_cache()
+        if cache is not None and not self.refresh:
+            cached = cache.get(url, params)
+            if cached is not None:
+                return cached
+        
+        return _request_flight.do(_request_key(url, params),
+                                  lambda: _finish_fetch(cache, url, params,
+                                                        self._fetch_json(url, params, retries)))
+    
+    def _fetch_json(self, url, params=None, retries=3):
+        """Send the request with retries and return the parsed JSON (or None)"""
+        # Pacing between attempts comes from the host's adaptive rate limiter,
+        # which the shared session's adapter applies to every request
         for attempt in range(retries):
             try:
-                if attempt > 0:
-                    delay = random.uniform(1, 3) * (2 ** attempt)
-                    time.sleep(delay)
-                
                 response = self.session.get(url, params=params, timeout=15)
                 
                 if response.status_code == 200:
@@ -46,6 +1623,11 @@ class DirectYahooFinance:
                     print(f"API returned status {response.status_code}")
                     return None
                     
+            except RequestCancelled:
+                raise
+            except CircuitOpenError:
+                # Endpoint family is failing fast - let the caller fall back right away
+                return None
             except Exception as e:
                 if attempt == retries - 1:
                     print(f"Request failed after {retries} attempts: {e}")
@@ -63,97 +1645,87 @@ class DirectYahooFinance:
             'includePrePost': 'true'
         }
         
-        data = self._make_request(url, params)
-        if not data:
-            return None
-            
-        try:
-            result = data['chart']['result'][0]
-            meta = result['meta']
-            
-            quote_data = {
-                'symbol': symbol,
-                'currentPrice': meta.get('regularMarketPrice'),
-                'previousClose': meta.get('previousClose'),
-                'regularMarketOpen': meta.get('regularMarketOpen'),
-                'regularMarketDayHigh': meta.get('regularMarketDayHigh'),
-                'regularMarketDayLow': meta.get('regularMarketDayLow'),
-                'regularMarketVolume': meta.get('regularMarketVolume'),
-                'currency': meta.get('currency'),
-                'exchangeName': meta.get('exchangeName'),
-                'longName': meta.get('longName', symbol),
-                'shortName': meta.get('shortName', symbol)
-            }
-            
-            return quote_data
+        return _parse_chart_quote(symbol, self._make_request(url, params))
+    
+    def get_quotes(self, symbols, as_frame=False, fallback=True):
+        """Get current quotes for many symbols with multi-symbol quote requests
+        
+        Symbols are packed QUOTE_BATCH_SIZE at a time into /v7/finance/quote, so a
+        300-symbol screen costs a handful of round trips instead of 300. Returns a
+        dict keyed by upper-case symbol (or a DataFrame indexed by symbol when
+        as_frame=True). Symbols Yahoo does not recognise are simply absent. If a
+        whole batch request fails, its symbols fall back to per-symbol get_quote.
+        """
+        unique_symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+        quotes = {}
+        
+        url = "https://query1.finance.yahoo.com/v7/finance/quote"
+        for start in range(0, len(unique_symbols), QUOTE_BATCH_SIZE):
+            chunk = unique_symbols[start:start + QUOTE_BATCH_SIZE]
+            chunk_quotes = _parse_batch_quotes(self._make_request(url, {'symbols': ','.join(chunk)}), chunk)
+            if chunk_quotes is not None:
+                quotes.update(chunk_quotes)
+                continue
             
-        except (KeyError, IndexError, TypeError) as e:
-            print(f"Error parsing quote data for {symbol}: {e}")
-            return None
+            # Batch endpoint unavailable - fall back to one chart request per symbol
+            if fallback:
+                for symbol in chunk:
+                    quote = self.get_quote(symbol)
+                    if quote and quote.get('currentPrice') is not None:
+                        quotes[symbol] = quote
+        
+        if as_frame:
+            return pd.DataFrame.from_dict(quotes, orient='index')
+        return quotes
     
-    def get_history(self, symbol, period='2y'):
-        """Get historical price data"""
-        # Convert period to timestamps
-        end_time = int(time.time())
-        
-        period_map = {
-            '1d': 1,
-            '5d': 5,
-            '1mo': 30,
-            '3mo': 90,
-            '6mo': 180,
-            '1y': 365,
-            '2y': 730,
-            '5y': 1825,
-            '10y': 3650,
-            'max': 7300
-        }
-        
-        days = period_map.get(period, 730)
-        start_time = end_time - (days * 24 * 60 * 60)
-        
-        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
-        params = {
-            'period1': start_time,
-            'period2': end_time,
-            'interval': '1d',
-            'includePrePost': 'true',
-            'events': 'div%2Csplit'
-        }
+    def get_history(self, symbol, period='2y', float32=None):
+        """Get historical price data, downloading only bars newer than the stored ones"""
+        plan = _history_store.plan(symbol, period)
+        if plan[0] == 'hit':
+            return _history_output(plan[1], float32)
+        
+        mode, url, params = plan
+        bars = _history_store.apply(symbol, period, mode, params, self._make_request(url, params))
+        if bars is None:
+            # Split or dividend restated the series - refetch the whole window
+            url, params = _history_request(symbol, period)
+            bars = _history_store.apply(symbol, period, 'full', params, self._make_request(url, params))
+        return _history_output(bars, float32)
+    
+    def get_statements(self, symbol):
+        """Annual and quarterly income statement, balance sheet and cash flow in one request
         
-        data = self._make_request(url, params)
-        if not data:
-            return pd.DataFrame()
-            
-        try:
-            result = data['chart']['result'][0]
-            timestamps = result['timestamp']
-            quotes = result['indicators']['quote'][0]
-            
-            # Create DataFrame
-            df = pd.DataFrame({
-                'Open': quotes['open'],
-                'High': quotes['high'], 
-                'Low': quotes['low'],
-                'Close': quotes['close'],
-                'Volume': quotes['volume']
-            })
-            
-            # Convert timestamps to datetime index
-            df.index = pd.to_datetime([datetime.fromtimestamp(ts) for ts in timestamps])
-            df.index.name = 'Date'
-            
-            # Remove rows with all NaN values
-            df = df.dropna(how='all')
-            
-            return df
-            
-        except (KeyError, IndexError, TypeError) as e:
-            print(f"Error parsing historical data for {symbol}: {e}")
-            return pd.DataFrame()
+        Parsed statements are kept for STATEMENTS_TTL, in memory and in the
+        persistent store, so every Ticker for the symbol shares them and they
+        survive restarts. Returns the frames read-only; copy before editing.
+        """
+        symbol = symbol.upper()
+        statements = _cached_statements(symbol) or _stored_statements(symbol)
+        if statements is None:
+            url, params = _statements_request(symbol)
+            statements = _statements_from_response(symbol, self._make_request(url, params))
+        return statements
     
-    def get_info(self, symbol):
+    def get_info(self, symbol, hedged=None, quote=None):
+        """Get detailed company information, from the persistent store while its snapshot is fresh
+        
+        A stored snapshot is served with a live batch quote on top (quote, when
+        the caller already has one); without a quote the info is fetched.
+        """
+        info = None if self.refresh else _stored_info(symbol)
+        if info is not None:
+            info = _overlay_quote(info, quote or self.get_quotes([symbol]).get(symbol.upper()))
+        if info is None:
+            info = _snapshot_info(symbol, self._fetch_info(symbol, hedged))
+        return info
+    
+    def _fetch_info(self, symbol, hedged=None):
         """Get detailed company information with multiple fallback approaches"""
+        if hedged is None:
+            hedged = INFO_HEDGED
+        if hedged:
+            return self._get_info_hedged(symbol)
+        
         # Get quote data first
         quote = self.get_quote(symbol)
         if not quote:
@@ -179,57 +1751,73 @@ class DirectYahooFinance:
         # Return only reliable data - no web scraping of fundamentals
         return info
     
+    def _get_info_hedged(self, symbol):
+        """get_info with the quote and info endpoints raced under INFO_DEADLINE"""
+        executor = _get_hedge_executor()
+        deadline = time.monotonic() + INFO_DEADLINE
+        race = _InfoRace(symbol)
+        scope = CancelScope(deadline)
+        
+        quote_future = executor.submit(self.get_quote, symbol)
+        futures = {}
+        next_launch = 0
+        winner = None
+        
+        while True:
+            winner = race.winner()
+            if winner is not None or race.exhausted():
+                break
+            
+            if race.should_launch(next_launch):
+                name, url, params = race.plan[race.launched]
+                futures[executor.submit(scope.run, self._make_request, url, params, 1)] = race.launched
+                race.launched += 1
+                next_launch = time.monotonic() + INFO_HEDGE_DELAY
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            
+            pending = [future for future, index in futures.items() if index not in race.fragments]
+            wake = deadline if race.launched >= len(race.plan) else min(next_launch, deadline)
+            done, _ = concurrent.futures.wait(
+                pending, timeout=max(wake - now, 0), return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                race.record(futures[future], None if future.exception() else future.result())
+        
+        deadline_hit = winner is None and not race.exhausted()
+        if winner is None:
+            winner = race.best()
+        
+        # Queued losers never start; running ones are abandoned before they send or while
+        # they wait for the rate limiter, and one already on the wire times out at the deadline
+        cancelled = sum(future.cancel() or not future.done()
+                        for future, index in futures.items() if index not in race.fragments)
+        scope.cancel()
+        _info_hedge_stats.record(race, winner, cancelled, deadline_hit)
+        
+        try:
+            quote = quote_future.result(timeout=max(deadline - time.monotonic(), 0))
+        except Exception:
+            quote = None
+        if not quote:
+            return {}
+        
+        info = quote.copy()
+        if winner is not None:
+            info.update(race.fragments[winner])
+        return info
+    
     def _try_api_approach(self, symbol, quote):
         """Try multiple API endpoints to get real data"""
         # Try different endpoint combinations
-        api_attempts = [
-            # Comprehensive endpoint
-            {
-                'url': f"https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}",
-                'params': {'modules': 'summaryDetail,defaultKeyStatistics,financialData,price,upgradeDowngradeHistory'}
-            },
-            # Alternative endpoint  
-            {
-                'url': f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}",
-                'params': {'interval': '1d', 'range': '1d', 'includePrePost': 'true'}
-            },
-            # Simple info endpoint
-            {
-                'url': f"https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}",
-                'params': {'modules': 'price,summaryDetail'}
-            }
-        ]
-        
-        for attempt in api_attempts:
+        for attempt in _info_api_attempts(symbol):
             try:
                 data = self._make_request(attempt['url'], attempt['params'])
                 if not data:
                     continue
                 
-                info = quote.copy()
-                
-                # Parse different response structures
-                if 'quoteSummary' in data:
-                    result = data['quoteSummary']['result']
-                    if result and len(result) > 0:
-                        # Process all modules
-                        for module_name, module_data in result[0].items():
-                            if module_data:
-                                for key, value in module_data.items():
-                                    if isinstance(value, dict) and 'raw' in value:
-                                        info[key] = value['raw']
-                                    elif isinstance(value, dict) and 'fmt' in value:
-                                        info[key] = value.get('raw', value['fmt'])
-                                    else:
-                                        info[key] = value
-                
-                elif 'chart' in data:
-                    # Parse chart response for basic data
-                    chart_result = data['chart']['result'][0]
-                    meta = chart_result['meta']
-                    for key, value in meta.items():
-                        if key not in info:  # Don't override existing data
-                            info[key] = value
+                info = _merge_api_response(quote.copy(), data)
                 
                 # If we got meaningful additional data, return it
                 if len(info) > len(quote) + 2:  # More than just basic quote data
@@ -242,52 +1830,13 @@ class DirectYahooFinance:
     
     def _try_alternative_apis(self, symbol, info):
         """Try alternative financial data sources"""
-        # Yahoo Finance mobile API (sometimes works when main API doesn't)
-        mobile_endpoints = [
-            f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={symbol}",
-            f"https://query2.finance.yahoo.com/v7/finance/options/{symbol}",
-            f"https://query1.finance.yahoo.com/v11/finance/quoteSummary/{symbol}?modules=price"
-        ]
-        
-        for url in mobile_endpoints:
+        for url in _alternative_info_endpoints(symbol):
             try:
                 data = self._make_request(url)
                 if data:
-                    # Parse quote response
-                    if 'quoteResponse' in data and 'result' in data['quoteResponse']:
-                        results = data['quoteResponse']['result']
-                        if results and len(results) > 0:
-                            result = results[0]
-                            
-                            # Map financial metrics
-                            field_mapping = {
-                                'trailingPE': result.get('trailingPE'),
-                                'forwardPE': result.get('forwardPE'), 
-                                'priceToBook': result.get('priceToBook'),
-                                'marketCap': result.get('marketCap'),
-                                'sharesOutstanding': result.get('sharesOutstanding'),
-                                'dividendYield': result.get('dividendYield'),
-                                'trailingEps': result.get('epsTrailingTwelveMonths'),
-                                'bookValue': result.get('bookValue')
-                            }
-                            
-                            # Add valid data
-                            for key, value in field_mapping.items():
-                                if value is not None and value != 0:
-                                    info[key] = value
-                            
-                            # If we got substantial data, return it
-                            if len([v for v in field_mapping.values() if v is not None]) >= 3:
-                                return info
-                    
-                    # Parse options response for basic data
-                    if 'optionChain' in data and 'result' in data['optionChain']:
-                        results = data['optionChain']['result']
-                        if results and len(results) > 0:
-                            quote_data = results[0].get('quote', {})
-                            for key in ['trailingPE', 'forwardPE', 'priceToBook', 'marketCap']:
-                                if key in quote_data and quote_data[key] is not None:
-                                    info[key] = quote_data[key]
+                    info, complete = _merge_alternative_response(info, data)
+                    if complete:
+                        return info
                                     
             except Exception as e:
                 continue
@@ -343,7 +1892,7 @@ class DirectYahooFinance:
             
             for url in pages_to_try:
                 try:
-                    response = self.session.get(url, timeout=10)
+                    response = self.session.get(_route(url), timeout=10)
                     if response.status_code != 200:
                         continue
                     
@@ -373,107 +1922,27 @@ class DirectYahooFinance:
     
     def _extract_fundamentals_from_html(self, html):
         """Extract fundamental metrics from HTML using various patterns"""
-        import re
-        import json
-        
+        # Method 1: JSON data embedded in the HTML
         fundamentals = {}
-        
-        # Method 1: Look for JSON data embedded in the HTML
-        json_patterns = [
-            r'root\.App\.main\s*=\s*(\{.*?\});',
-            r'"QuoteSummaryStore":\s*(\{.*?"summaryDetail"[^}]*\})',
-            r'"defaultKeyStatistics":\s*(\{.*?\})',
-            r'"summaryDetail":\s*(\{.*?\})',
-            r'"financialData":\s*(\{.*?\})'
-        ]
-        
-        for pattern in json_patterns:
-            matches = re.finditer(pattern, html, re.DOTALL)
-            for match in matches:
-                try:
-                    json_str = match.group(1)
-                    # Try to parse as JSON
-                    data = json.loads(json_str)
-                    extracted = self._extract_from_json_recursive(data)
-                    fundamentals.update(extracted)
-                except (json.JSONDecodeError, ValueError):
-                    continue
-        
-        # Method 2: Look for specific patterns in visible text
-        text_patterns = {
-            'trailingPE': [
-                r'P/E\s*(?:Ratio)?\s*(?:\(ttm\))?\s*</?\w*>\s*([0-9.,]+)',
-                r'Trailing P/E.*?([0-9.,]+)',
-                r'PE.*?([0-9.,]+)',
-                r'pe-ratio[^>]*>([0-9.,]+)'
-            ],
-            'forwardPE': [
-                r'Forward P/E.*?([0-9.,]+)',
-                r'Forward PE.*?([0-9.,]+)'
-            ],
-            'priceToBook': [
-                r'Price/Book.*?([0-9.,]+)',
-                r'P/B.*?([0-9.,]+)',
-                r'Book.*?([0-9.,]+)'
-            ],
-            'marketCap': [
-                r'Market Cap.*?\$([0-9.,KMBT]+)',
-                r'Market Capitalization.*?\$([0-9.,KMBT]+)',
-                r'Mkt Cap.*?\$([0-9.,KMBT]+)'
-            ],
-            'dividendYield': [
-                r'Dividend.*?Yield.*?([0-9.,]+)%',
-                r'Yield.*?([0-9.,]+)%',
-                r'dividend.*?([0-9.,]+)%'
-            ]
+        for blob in _scan_html_json(html):
+            self._extract_from_json_recursive(blob, fundamentals)
+        
+        # Method 2: statistics-table text, for metrics the JSON didn't have
+        sane_ranges = {
+            'trailingPE': (1, 1000),
+            'forwardPE': (1, 1000),
+            'priceToBook': (0.1, 100),
+            'marketCap': (1000000, float('inf')),  # At least $1M
+            'dividendYield': (0, 0.2)  # 0-20%
         }
+        if all(metric in fundamentals for metric in sane_ranges):
+            return fundamentals
         
-        for metric, patterns in text_patterns.items():
-            if metric in fundamentals:  # Skip if already found
-                continue
-                
-            for pattern in patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE | re.DOTALL)
-                for match in matches:
-                    try:
-                        value_str = match.replace(',', '')
-                        
-                        # Handle market cap suffixes
-                        if metric == 'marketCap':
-                            if value_str.endswith('K'):
-                                value = float(value_str[:-1]) * 1000
-                            elif value_str.endswith('M'):
-                                value = float(value_str[:-1]) * 1000000
-                            elif value_str.endswith('B'):
-                                value = float(value_str[:-1]) * 1000000000
-                            elif value_str.endswith('T'):
-                                value = float(value_str[:-1]) * 1000000000000
-                            else:
-                                value = float(value_str)
-                        elif metric == 'dividendYield':
-                            value = float(value_str) / 100  # Convert percentage to decimal
-                        else:
-                            value = float(value_str)
-                        
-                        # Sanity check the values
-                        if metric == 'trailingPE' and 1 <= value <= 1000:
-                            fundamentals[metric] = value
-                            break
-                        elif metric == 'priceToBook' and 0.1 <= value <= 100:
-                            fundamentals[metric] = value
-                            break
-                        elif metric == 'marketCap' and value > 1000000:  # At least $1M
-                            fundamentals[metric] = value
-                            break
-                        elif metric == 'dividendYield' and 0 <= value <= 0.2:  # 0-20%
-                            fundamentals[metric] = value
-                            break
-                        elif metric == 'forwardPE' and 1 <= value <= 1000:
-                            fundamentals[metric] = value
-                            break
-                            
-                    except (ValueError, AttributeError):
-                        continue
+        table_values = _scan_html_table(html)
+        for metric, (low, high) in sane_ranges.items():
+            value = table_values.get(metric)
+            if metric not in fundamentals and value is not None and low <= value <= high:
+                fundamentals[metric] = value
         
         return fundamentals
     
@@ -622,44 +2091,20 @@ class DirectYahooFinance:
             
             for url in pages_to_try:
                 try:
-                    response = self.session.get(url, timeout=10)
+                    response = self.session.get(_route(url), timeout=10)
                     if response.status_code != 200:
                         continue
                     
                     html = response.text
                     
-                    # Extract key metrics using multiple approaches
-                    import re
-                    import json
-                    
-                    # Approach 1: JSON data extraction
-                    json_patterns = [
-                        r'root\.App\.main\s*=\s*(\{.*?\});',
-                        r'"QuoteSummaryStore":\s*(\{.*?"price":\{.*?\})',
-                        r'"summaryDetail":\s*(\{.*?\})',
-                        r'"defaultKeyStatistics":\s*(\{.*?\})'
-                    ]
-                    
-                    for pattern in json_patterns:
-                        matches = re.finditer(pattern, html)
-                        for match in matches:
-                            try:
-                                json_str = match.group(1)
-                                if json_str.count('{') > json_str.count('}'):
-                                    # Try to balance braces
-                                    brace_diff = json_str.count('{') - json_str.count('}')
-                                    json_str += '}' * brace_diff
-                                
-                                json_data = json.loads(json_str)
-                                extracted_info = self._extract_from_json(json_data, {})
-                                
-                                # Merge any new data found
-                                for key, value in extracted_info.items():
-                                    if key not in info and value is not None:
-                                        info[key] = value
-                                        
-                            except (json.JSONDecodeError, ValueError):
-                                continue
+                    # Approach 1: JSON data embedded in the page
+                    for json_data in _scan_html_json(html):
+                        extracted_info = self._extract_from_json(json_data, {})
+                        
+                        # Merge any new data found
+                        for key, value in extracted_info.items():
+                            if key not in info and value is not None:
+                                info[key] = value
                     
                     # Approach 2: Enhanced HTML text extraction
                     new_info = self._extract_from_html_text(html, info)
@@ -787,130 +2232,19 @@ class DirectYahooFinance:
     
     def _extract_from_html_text(self, html, info):
         """Extract financial data from HTML text patterns"""
-        import re
-        
-        # Look for table-like patterns in the HTML
-        patterns = {
-            'marketCap': [
-                r'Market Cap[^>]*>([0-9,.KMBT]+)',
-                r'market-cap[^>]*>([0-9,.KMBT]+)',
-                r'>Market Cap</.*?>([0-9,.KMBT]+)'
-            ],
-            'trailingPE': [
-                r'P/E Ratio[^>]*>([0-9,.]+)',
-                r'pe-ratio[^>]*>([0-9,.]+)', 
-                r'>PE Ratio</.*?>([0-9,.]+)'
-            ],
-            'priceToBook': [
-                r'Price/Book[^>]*>([0-9,.]+)',
-                r'price-book[^>]*>([0-9,.]+)',
-                r'>Price to Book</.*?>([0-9,.]+)'
-            ]
-        }
-        
-        for metric, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                match = re.search(pattern, html, re.IGNORECASE | re.DOTALL)
-                if match:
-                    try:
-                        value_str = match.group(1).replace(',', '')
-                        # Handle K, M, B, T suffixes
-                        if value_str.endswith('K'):
-                            info[metric] = float(value_str[:-1]) * 1000
-                        elif value_str.endswith('M'):
-                            info[metric] = float(value_str[:-1]) * 1000000
-                        elif value_str.endswith('B'):
-                            info[metric] = float(value_str[:-1]) * 1000000000
-                        elif value_str.endswith('T'):
-                            info[metric] = float(value_str[:-1]) * 1000000000000
-                        else:
-                            info[metric] = float(value_str)
-                        break  # Found a match, move to next metric
-                    except ValueError:
-                        continue
+        table_values = _scan_html_table(html)
+        for metric in ('marketCap', 'trailingPE', 'priceToBook'):
+            if table_values.get(metric) is not None:
+                info[metric] = table_values[metric]
         
         return info
     
     def _extract_from_statistics_table(self, html):
         """Extract data from Yahoo Finance statistics tables"""
-        import re
-        
         info = {}
-        
-        # Enhanced patterns for key statistics
-        stat_patterns = {
-            'marketCap': [
-                r'Market Cap[^>]*>[^>]*>([0-9.,KMBT]+)',
-                r'Market\s+Cap.*?([0-9.,KMBT]+)',
-                r'market-cap[^>]*>([0-9.,KMBT]+)'
-            ],
-            'trailingPE': [
-                r'Trailing P/E[^>]*>[^>]*>([0-9.,\-]+)',
-                r'P/E\s+Ratio[^>]*>[^>]*>([0-9.,\-]+)',
-                r'trailing.*pe[^>]*>([0-9.,\-]+)'
-            ],
-            'forwardPE': [
-                r'Forward P/E[^>]*>[^>]*>([0-9.,\-]+)',
-                r'forward.*pe[^>]*>([0-9.,\-]+)'
-            ],
-            'priceToBook': [
-                r'Price/Book[^>]*>[^>]*>([0-9.,\-]+)',
-                r'P/B\s+Ratio[^>]*>[^>]*>([0-9.,\-]+)',
-                r'price.*book[^>]*>([0-9.,\-]+)'
-            ],
-            'epsTrailingTwelveMonths': [
-                r'Diluted EPS[^>]*>[^>]*>([0-9.,\-]+)',
-                r'EPS[^>]*>[^>]*>([0-9.,\-]+)',
-                r'earnings.*share[^>]*>([0-9.,\-]+)'
-            ],
-            'bookValue': [
-                r'Book Value[^>]*>[^>]*>([0-9.,\-]+)',
-                r'book.*value[^>]*>([0-9.,\-]+)'
-            ],
-            'sharesOutstanding': [
-                r'Shares Outstanding[^>]*>[^>]*>([0-9.,KMBT]+)',
-                r'shares.*outstanding[^>]*>([0-9.,KMBT]+)'
-            ],
-            'dividendYield': [
-                r'Forward Annual Dividend Yield[^>]*>[^>]*>([0-9.,\-]+%?)',
-                r'Dividend.*Yield[^>]*>[^>]*>([0-9.,\-]+%?)',
-                r'dividend.*yield[^>]*>([0-9.,\-]+%?)'
-            ]
-        }
-        
-        for metric, patterns in stat_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE | re.DOTALL)
-                for match in matches:
-                    try:
-                        value_str = match.strip().replace(',', '').replace('%', '')
-                        
-                        # Skip invalid values
-                        if value_str in ['N/A', '--', '-', '']:
-                            continue
-                        
-                        # Handle suffixes
-                        if value_str.endswith('K'):
-                            value = float(value_str[:-1]) * 1000
-                        elif value_str.endswith('M'):
-                            value = float(value_str[:-1]) * 1000000
-                        elif value_str.endswith('B'):
-                            value = float(value_str[:-1]) * 1000000000
-                        elif value_str.endswith('T'):
-                            value = float(value_str[:-1]) * 1000000000000
-                        else:
-                            value = float(value_str)
-                        
-                        # Special handling for percentage dividends
-                        if metric == 'dividendYield' and match.endswith('%'):
-                            value = value / 100
-                        
-                        if value > 0:  # Only use positive values
-                            info[metric] = value
-                            break  # Found valid value, move to next metric
-                            
-                    except (ValueError, AttributeError):
-                        continue
+        for metric, value in _scan_html_table(html).items():
+            if value > 0:  # Only use positive values
+                info['epsTrailingTwelveMonths' if metric == 'trailingEps' else metric] = value
         
         return info
     
@@ -1081,7 +2415,7 @@ class DirectYahooFinance:
         """Scrape analyst data from Yahoo Finance web page"""
         try:
             url = f"https://finance.yahoo.com/quote/{symbol}"
-            response = self.session.get(url, timeout=15)
+            response = self.session.get(_route(url), timeout=15)
             
             if response.status_code != 200:
                 return {}
@@ -1233,50 +2567,524 @@ class DirectYahooFinance:
     def search(self, query):
         """Search for symbols by company name"""
         url = "https://query1.finance.yahoo.com/v1/finance/search"
+        params = _search_params(query)
+        
+        return _parse_search_results(self._make_request(url, params))
+
+class AsyncDirectYahooFinance:
+    """asyncio counterpart of DirectYahooFinance built on aiohttp
+    
+    One event loop can keep hundreds of requests in flight over a bounded
+    connection pool without a thread per request. Use as an async context
+    manager so the underlying ClientSession is opened and closed on the
+    running loop:
+        
+        async with AsyncDirectYahooFinance() as api:
+            quote, history = await asyncio.gather(api.get_quote('AAPL'), api.get_history('AAPL'))
+    """
+    
+    def __init__(self, connection_limit=None, limit_per_host=None, timeout=15, refresh=False):
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("AsyncDirectYahooFinance requires aiohttp (pip install aiohttp)")
+        self.connection_limit = connection_limit or ASYNC_CONNECTION_LIMIT
+        self.limit_per_host = limit_per_host or ASYNC_LIMIT_PER_HOST
+        self.timeout = timeout
+        self.refresh = refresh  # Same meaning as DirectYahooFinance(refresh=True)
+        self.session = None
+        self._in_flight = {}  # Request key -> [task, callers awaiting it], for single-flight on this event loop
+    
+    async def __aenter__(self):
+        await self.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def open(self):
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit,
+                                             limit_per_host=self.limit_per_host,
+                                             ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 headers=DEFAULT_HEADERS,
+                                                 timeout=aiohttp.ClientTimeout(total=self.timeout))
+    
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def _make_request(self, url, params=None, retries=3):
+        """Make request with retries, coalescing identical concurrent calls on this loop
+        and answering from the on-disk response cache while its entry is fresh
+        
+        Disk I/O (response cache, market store, fixture recording) runs on
+        worker threads throughout this class, so one slow write never stalls
+        the other requests in flight on the loop.
+        """
+        url = _route(url)
+        cache = get_response_cache()
+        if cache is not None and not self.refresh:
+            cached = await asyncio.to_thread(cache.get, url, params)
+            if cached is not None:
+                return cached
+        
+        key = _request_key(url, params)
+        flight = self._in_flight.get(key)
+        if flight is None:
+            _request_flight.record_leader()
+            task = asyncio.ensure_future(self._fetch_json_cached(cache, url, params, retries))
+            flight = self._in_flight[key] = [task, 0]
+            task.add_done_callback(lambda _: self._forget_flight(key, flight))
+        else:
+            _request_flight.record_coalesced()
+        
+        # Shield so one cancelled caller does not cancel the fetch the others
+        # await; when the last caller is cancelled (e.g. a hedge loser) the
+        # fetch is cancelled too, releasing its connection
+        flight[1] += 1
+        try:
+            return await asyncio.shield(flight[0])
+        finally:
+            flight[1] -= 1
+            if flight[1] == 0 and not flight[0].done():
+                self._forget_flight(key, flight)
+                flight[0].cancel()
+    
+    def _forget_flight(self, key, flight):
+        # A cancelled fetch is forgotten at once, so a new caller never joins it
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+    
+    async def _fetch_json_cached(self, cache, url, params, retries):
+        data = await self._fetch_json(url, params, retries)
+        return await asyncio.to_thread(_finish_fetch, cache, url, params, data)
+    
+    async def _fetch_json(self, url, params=None, retries=3):
+        """Send the request with retries, paced by the shared per-endpoint rate limiters
+        and guarded by the endpoint family's circuit breaker"""
+        await self.open()
+        if params:
+            # aiohttp only accepts str/int/float query values
+            params = {key: str(value) for key, value in params.items()}
+        
+        limiter = get_rate_limiter(url)
+        breaker = get_circuit_breaker(url)
+        for attempt in range(retries):
+            if not breaker.allow_request():
+                # Endpoint family is failing fast - let the caller fall back right away
+                return None
+            try:
+                await limiter.acquire_async()
+                async with self.session.get(url, params=params) as response:
+                    limiter.record_response(response.status)
+                    breaker.record_status(response.status)
+                    if response.status == 200:
+                        return await response.json(content_type=None)
+                    elif response.status == 429:
+                        print(f"Rate limited on attempt {attempt + 1}, retrying...")
+                        continue
+                    else:
+                        print(f"API returned status {response.status}")
+                        return None
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                breaker.record_failure()
+                if attempt == retries - 1:
+                    print(f"Request failed after {retries} attempts: {e}")
+                    return None
+                continue
+        
+        return None
+    
+    async def get_quote(self, symbol):
+        """Get current quote data for a symbol"""
+        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
         params = {
-            'q': query,
-            'quotesCount': 10,
-            'newsCount': 0
+            'interval': '1d',
+            'range': '1d',
+            'includePrePost': 'true'
         }
         
-        data = self._make_request(url, params)
-        if not data:
-            return []
+        return _parse_chart_quote(symbol, await self._make_request(url, params))
+    
+    async def get_quotes(self, symbols, as_frame=False, fallback=True):
+        """Get current quotes for many symbols; all batches are requested concurrently"""
+        unique_symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+        chunks = [unique_symbols[start:start + QUOTE_BATCH_SIZE]
+                  for start in range(0, len(unique_symbols), QUOTE_BATCH_SIZE)]
+        
+        url = "https://query1.finance.yahoo.com/v7/finance/quote"
+        responses = await asyncio.gather(*(self._make_request(url, {'symbols': ','.join(chunk)})
+                                           for chunk in chunks))
+        
+        quotes = {}
+        fallback_symbols = []
+        for chunk, data in zip(chunks, responses):
+            chunk_quotes = _parse_batch_quotes(data, chunk)
+            if chunk_quotes is not None:
+                quotes.update(chunk_quotes)
+            else:
+                fallback_symbols.extend(chunk)
+        
+        # Batch endpoint unavailable - fall back to one chart request per symbol
+        if fallback and fallback_symbols:
+            fallback_quotes = await asyncio.gather(*(self.get_quote(symbol) for symbol in fallback_symbols))
+            for symbol, quote in zip(fallback_symbols, fallback_quotes):
+                if quote and quote.get('currentPrice') is not None:
+                    quotes[symbol] = quote
+        
+        if as_frame:
+            return pd.DataFrame.from_dict(quotes, orient='index')
+        return quotes
+    
+    async def get_history(self, symbol, period='2y', float32=None):
+        """Get historical price data, downloading only bars newer than the stored ones"""
+        plan = await asyncio.to_thread(_history_store.plan, symbol, period)
+        if plan[0] == 'hit':
+            return _history_output(plan[1], float32)
+        
+        mode, url, params = plan
+        data = await self._make_request(url, params)
+        bars = await asyncio.to_thread(_history_store.apply, symbol, period, mode, params, data)
+        if bars is None:
+            # Split or dividend restated the series - refetch the whole window
+            url, params = _history_request(symbol, period)
+            data = await self._make_request(url, params)
+            bars = await asyncio.to_thread(_history_store.apply, symbol, period, 'full', params, data)
+        return _history_output(bars, float32)
+    
+    async def get_statements(self, symbol):
+        """Annual and quarterly income statement, balance sheet and cash flow in one request"""
+        symbol = symbol.upper()
+        statements = _cached_statements(symbol) or await asyncio.to_thread(_stored_statements, symbol)
+        if statements is None:
+            url, params = _statements_request(symbol)
+            data = await self._make_request(url, params)
+            statements = await asyncio.to_thread(_statements_from_response, symbol, data)
+        return statements
+    
+    async def get_info(self, symbol, hedged=None, quote=None):
+        """Get detailed company information, from the persistent store while its snapshot is fresh (with a live quote)"""
+        info = None if self.refresh else await asyncio.to_thread(_stored_info, symbol)
+        if info is not None:
+            info = _overlay_quote(info, quote or (await self.get_quotes([symbol])).get(symbol.upper()))
+        if info is None:
+            info = await asyncio.to_thread(_snapshot_info, symbol, await self._fetch_info(symbol, hedged))
+        return info
+    
+    async def _fetch_info(self, symbol, hedged=None):
+        """Get detailed company information with the same fallback order as DirectYahooFinance"""
+        if hedged is None:
+            hedged = INFO_HEDGED
+        if hedged:
+            return await self._get_info_hedged(symbol)
+        
+        quote = await self.get_quote(symbol)
+        if not quote:
+            return {}
+        
+        # Reliable API endpoints first
+        for attempt in _info_api_attempts(symbol):
+            try:
+                data = await self._make_request(attempt['url'], attempt['params'])
+                if not data:
+                    continue
+                info = _merge_api_response(quote.copy(), data)
+                if len(info) > len(quote) + 2:  # More than just basic quote data
+                    return info
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                continue
+        
+        # Alternative endpoints
+        info = quote.copy()
+        for url in _alternative_info_endpoints(symbol):
+            try:
+                data = await self._make_request(url)
+                if data:
+                    info, complete = _merge_alternative_response(info, data)
+                    if complete:
+                        break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                continue
+        
+        return info
+    
+    async def _get_info_hedged(self, symbol):
+        """get_info with the quote and info endpoints raced under INFO_DEADLINE"""
+        deadline = time.monotonic() + INFO_DEADLINE
+        race = _InfoRace(symbol)
+        
+        quote_task = asyncio.ensure_future(self.get_quote(symbol))
+        tasks = {}
+        next_launch = 0
+        winner = None
         
         try:
-            quotes = data.get('quotes', [])
-            results = []
+            while True:
+                winner = race.winner()
+                if winner is not None or race.exhausted():
+                    break
+                
+                if race.should_launch(next_launch):
+                    name, url, params = race.plan[race.launched]
+                    tasks[asyncio.ensure_future(self._make_request(url, params, 1))] = race.launched
+                    race.launched += 1
+                    next_launch = time.monotonic() + INFO_HEDGE_DELAY
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                
+                pending = [task for task, index in tasks.items() if index not in race.fragments]
+                wait_for = deadline - now
+                if race.launched < len(race.plan):
+                    wait_for = min(wait_for, max(next_launch - now, 0))
+                done, _ = await asyncio.wait(pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    race.record(tasks[task], None if task.exception() else task.result())
             
-            for quote in quotes:
-                if quote.get('typeDisp') in ['Equity', 'ETF']:
-                    results.append({
-                        'symbol': quote.get('symbol'),
-                        'name': quote.get('longname', quote.get('shortname', '')),
-                        'type': quote.get('typeDisp'),
-                        'exchange': quote.get('exchDisp', ''),
-                        'score': quote.get('score', 0)
-                    })
+            # Cancelling a racer cancels its request unless another caller shares it
+            losers = [task for task, index in tasks.items() if index not in race.fragments and not task.done()]
+            for task in losers:
+                task.cancel()
             
-            return results
+            deadline_hit = winner is None and not race.exhausted()
+            if winner is None:
+                winner = race.best()
+            _info_hedge_stats.record(race, winner, len(losers), deadline_hit)
             
-        except (KeyError, TypeError) as e:
-            print(f"Error parsing search results: {e}")
-            return []
+            try:
+                quote = await asyncio.wait_for(quote_task, timeout=max(deadline - time.monotonic(), 0.001))
+            except Exception:
+                quote = None
+        finally:
+            # Nothing started here outlives the call, even when the call itself is cancelled
+            spawned = [quote_task, *tasks]
+            for task in spawned:
+                task.cancel()
+            await asyncio.gather(*spawned, return_exceptions=True)
+        
+        if not quote:
+            return {}
+        
+        info = quote.copy()
+        if winner is not None:
+            info.update(race.fragments[winner])
+        return info
+    
+    async def search(self, query):
+        """Search for symbols by company name"""
+        url = "https://query1.finance.yahoo.com/v1/finance/search"
+        return _parse_search_results(await self._make_request(url, _search_params(query)))
+
+# Field groups behind DirectTicker.info: (quoteSummary modules, keys they provide)
+INFO_FIELD_GROUPS = {
+    'price': (None, (
+        'symbol', 'currentPrice', 'regularMarketPrice', 'previousClose', 'regularMarketOpen',
+        'regularMarketDayHigh', 'regularMarketDayLow', 'regularMarketVolume', 'currency',
+        'exchangeName', 'longName', 'shortName'
+    )),
+    'valuation': ('summaryDetail,defaultKeyStatistics', (
+        'marketCap', 'trailingPE', 'forwardPE', 'priceToBook', 'trailingEps', 'forwardEps',
+        'bookValue', 'sharesOutstanding', 'floatShares', 'dividendYield', 'dividendRate',
+        'payoutRatio', 'trailingAnnualDividendYield', 'trailingAnnualDividendRate',
+        'fiveYearAvgDividendYield', 'exDividendDate', 'beta', 'pegRatio', 'enterpriseValue',
+        'enterpriseToRevenue', 'enterpriseToEbitda', 'priceToSalesTrailing12Months',
+        'fiftyTwoWeekHigh', 'fiftyTwoWeekLow', 'fiftyDayAverage', 'twoHundredDayAverage',
+        'averageVolume', 'heldPercentInsiders', 'heldPercentInstitutions', 'shortRatio',
+        'earningsQuarterlyGrowth', 'netIncomeToCommon', 'lastSplitFactor'
+    )),
+    'financialData': ('financialData', (
+        'totalRevenue', 'revenueGrowth', 'earningsGrowth', 'grossMargins', 'operatingMargins',
+        'profitMargins', 'ebitdaMargins', 'returnOnEquity', 'returnOnAssets', 'totalDebt',
+        'totalCash', 'totalCashPerShare', 'debtToEquity', 'currentRatio', 'quickRatio',
+        'freeCashflow', 'operatingCashflow', 'ebitda', 'grossProfits', 'revenuePerShare',
+        'financialCurrency'
+    )),
+    'profile': ('assetProfile', (
+        'sector', 'industry', 'longBusinessSummary', 'country', 'city', 'state', 'address1',
+        'zip', 'phone', 'website', 'fullTimeEmployees', 'companyOfficers'
+    )),
+    'analyst': ('financialData,recommendationTrend,upgradeDowngradeHistory', (
+        'targetMeanPrice', 'targetHighPrice', 'targetLowPrice', 'targetMedianPrice',
+        'recommendationMean', 'recommendationKey', 'numberOfAnalystOpinions', 'trend', 'history'
+    )),
+}
+
+_INFO_KEY_GROUPS = {
+    key: group for group, (modules, keys) in INFO_FIELD_GROUPS.items() for key in keys
+}
+
+class LazyInfo(dict):
+    """Ticker info dict that fetches its field groups on first access
+    
+    Reading a key from a known group (info['trailingPE'], info.get('sector'),
+    'currentPrice' in info) loads just that group: price from the chart quote,
+    the rest from one quoteSummary request for the group's modules. Anything
+    that needs the whole dict (len, iteration, items, copy, pickling) or an
+    unmapped key runs the full get_info once, so callers that treat info as
+    a complete dict see the same data as before.
+    """
+    
+    def __init__(self, api, symbol):
+        super().__init__()
+        self._api = api
+        self._symbol = symbol
+        self._loaded = set()
+        self._complete = False
+        self._lock = threading.RLock()
+        
+        # A fresh stored snapshot plus one batch quote answers every field
+        snapshot = _stored_info(symbol)
+        if snapshot:
+            snapshot = _overlay_quote(snapshot, api.get_quotes([symbol]).get(symbol.upper()))
+        if snapshot:
+            self._merge(snapshot)
+            self._loaded = set(INFO_FIELD_GROUPS)
+            self._complete = True
+    
+    def _merge(self, fragment):
+        # Values already present (or set by the caller) win
+        for key, value in (fragment or {}).items():
+            if not dict.__contains__(self, key):
+                dict.__setitem__(self, key, value)
+    
+    def _load_group(self, group):
+        with self._lock:
+            if group in self._loaded:
+                return
+            modules = INFO_FIELD_GROUPS[group][0]
+            
+            if modules is None:
+                fragment = self._api.get_quote(self._symbol) or {}
+                if fragment.get('currentPrice') is not None:
+                    fragment.setdefault('regularMarketPrice', fragment['currentPrice'])
+            else:
+                url = f"https://query2.finance.yahoo.com/v10/finance/quoteSummary/{self._symbol}"
+                data = self._api._make_request(url, {'modules': modules})
+                try:
+                    fragment = _merge_api_response({}, data) if data else {}
+                except (KeyError, IndexError, TypeError, AttributeError):
+                    fragment = {}
+                
+                if group == 'valuation' and not _info_complete(fragment):
+                    # quoteSummary refused - the batch quote carries the core ratios
+                    quote = self._api.get_quotes([self._symbol], fallback=False).get(self._symbol) or {}
+                    fragment.update({key: value for key, value in quote.items() if value is not None})
+            
+            self._merge(fragment)
+            self._loaded.add(group)
+    
+    def _load_all(self):
+        with self._lock:
+            if self._complete:
+                return
+            self._merge(self._api.get_info(self._symbol))
+            
+            # Groups the full response already covered won't be requested again
+            for group, (modules, keys) in INFO_FIELD_GROUPS.items():
+                if any(dict.__contains__(self, key) for key in keys):
+                    self._loaded.add(group)
+            self._complete = True
+    
+    def _ensure(self, key):
+        if dict.__contains__(self, key):
+            return
+        group = _INFO_KEY_GROUPS.get(key)
+        if group is None:
+            self._load_all()
+        elif group not in self._loaded:
+            self._load_group(group)
+    
+    def loaded_groups(self):
+        return set(self._loaded)
+    
+    def is_complete(self):
+        """True once the full get_info has been merged in (no access can trigger a fetch)"""
+        return self._complete
+    
+    def __getitem__(self, key):
+        self._ensure(key)
+        return dict.__getitem__(self, key)
+    
+    def get(self, key, default=None):
+        self._ensure(key)
+        return dict.get(self, key, default)
+    
+    def __contains__(self, key):
+        self._ensure(key)
+        return dict.__contains__(self, key)
+    
+    def __len__(self):
+        self._load_all()
+        return dict.__len__(self)
+    
+    def __bool__(self):
+        # Truthiness only needs the price group, unless that came back empty
+        if not self._complete and not dict.__len__(self):
+            self._load_group('price')
+        return bool(dict.__len__(self)) or self.__len__() > 0
+    
+    def __iter__(self):
+        self._load_all()
+        return dict.__iter__(self)
+    
+    def keys(self):
+        self._load_all()
+        return dict.keys(self)
+    
+    def values(self):
+        self._load_all()
+        return dict.values(self)
+    
+    def items(self):
+        self._load_all()
+        return dict.items(self)
+    
+    def copy(self):
+        self._load_all()
+        return dict(dict.items(self))
+    
+    def __eq__(self, other):
+        self._load_all()
+        return dict.__eq__(self, other)
+    
+    def __ne__(self, other):
+        self._load_all()
+        return dict.__ne__(self, other)
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        self._load_all()
+        return dict.__repr__(self)
+    
+    def __reduce__(self):
+        # Pickle/deepcopy as a plain dict - the client holds locks and sockets
+        return (dict, (self.copy(),))
 
 class DirectTicker:
     """yfinance-compatible wrapper using direct API"""
     
     def __init__(self, symbol, session=None):
         self.symbol = symbol.upper()
-        self.api = DirectYahooFinance()
+        # An injected session gets its own client; otherwise share the default one
+        self.api = DirectYahooFinance(session=session) if session is not None else get_default_client()
         self._info = None
         self._history_cache = {}
+        self._statements = None
     
     @property
     def info(self):
-        """Get stock info (cached)"""
+        """Get stock info (cached, field groups fetched on first access)"""
         if self._info is None:
-            self._info = self.api.get_info(self.symbol)
+            self._info = LazyInfo(self.api, self.symbol)
         return self._info
     
     def history(self, period='2y', **kwargs):
@@ -1285,41 +3093,59 @@ class DirectTicker:
             self._history_cache[period] = self.api.get_history(self.symbol, period)
         return self._history_cache[period]
     
+    def _statement(self, name):
+        # All six statements arrive together from one request
+        if self._statements is None:
+            self._statements = self.api.get_statements(self.symbol)
+        return self._statements[name].copy()
+    
     @property
     def financials(self):
-        """Placeholder for financials (would need separate implementation)"""
-        return pd.DataFrame()
+        """Annual income statement (line items x fiscal year ends, newest first)"""
+        return self._statement('financials')
     
     @property
     def balance_sheet(self):
-        """Placeholder for balance sheet (would need separate implementation)"""  
-        return pd.DataFrame()
+        """Annual balance sheet"""
+        return self._statement('balance_sheet')
     
     @property
     def cashflow(self):
-        """Placeholder for cash flow (would need separate implementation)"""
-        return pd.DataFrame()
+        """Annual cash flow statement"""
+        return self._statement('cashflow')
     
     @property
     def quarterly_financials(self):
-        """Placeholder for quarterly financials"""
-        return pd.DataFrame()
+        """Quarterly income statement"""
+        return self._statement('quarterly_financials')
     
     @property
     def quarterly_balance_sheet(self):
-        """Placeholder for quarterly balance sheet"""
-        return pd.DataFrame()
+        """Quarterly balance sheet"""
+        return self._statement('quarterly_balance_sheet')
     
     @property
     def quarterly_cashflow(self):
-        """Placeholder for quarterly cash flow"""
-        return pd.DataFrame()
+        """Quarterly cash flow statement"""
+        return self._statement('quarterly_cashflow')
     
     @property
     def news(self):
         """Placeholder for news"""
         return []
 
+_default_client = None
+_default_client_lock = threading.Lock()
+
+def get_default_client():
+    """Shared DirectYahooFinance instance used by DirectTicker"""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = DirectYahooFinance()
+    return _default_client
+
 # Function to replace yfinance.Ticker
 def Ticker(symbol, session=None):
     """Drop-in replacement for yf.Ticker"""
@@ -1367,6 +3193,42 @@ def test_direct_api():
         print(f"✅ MSFT via Ticker: ${info['currentPrice']}")
     else:
         print("❌ Ticker wrapper failed")
+    
+    # Connection reuse across all of the calls above
+    stats = http_pool_stats()
+    print(f"\\n5. Connection pool: {stats['requests']} requests over "
+          f"{stats['connections_opened']} connections ({stats['connections_reused']} reused)")
+    
+    flight = single_flight_stats()
+    print(f"   Single-flight: {flight['requests_sent']} sent, {flight['coalesced']} coalesced")
+    
+    # Adaptive rate per host and endpoint family
+    for bucket, limiter_stats in rate_limiter_stats().items():
+        print(f"   {bucket}: {limiter_stats['rate']} req/s ({limiter_stats['throttled']} throttled)")
+    
+    # Circuit breakers per endpoint family
+    for family, breaker_stats in circuit_breaker_stats().items():
+        print(f"   {family}: {breaker_stats['state']} ({breaker_stats['rejected']} rejected)")
+    
+    hedge = info_hedge_stats()
+    print(f"   Hedged info: {hedge['calls']} calls, {hedge['hedges_fired']} hedges fired, "
+          f"{hedge['cancelled']} cancelled, wins {hedge['wins']}")
+    
+    cache_stats = response_cache_stats()
+    if cache_stats:
+        print(f"   Response cache: {cache_stats['entries']} entries, {cache_stats['bytes'] / 1024:.0f} KiB, "
+              f"{cache_stats['hits']} hits, {cache_stats['stale_hits']} stale")
+    
+    history = history_store_stats()
+    print(f"   History store: {history['symbols']} symbols ({history['bytes'] / 1024:.0f} KiB), "
+          f"{history['full_fetches']} full / {history['incremental_fetches']} incremental fetches, "
+          f"{history['hits']} hits")
+    
+    store_stats = market_store_stats()
+    if store_stats:
+        print(f"   Market data store: {store_stats['history_symbols']} histories, "
+              f"{store_stats['info_snapshots']} info snapshots, {store_stats['statements']} statements, "
+              f"{store_stats['bytes'] / 1024:.0f} KiB")
 
 if __name__ == '__main__':
     test_direct_api()
\ No newline at end of file
@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Yahoo Finance API
+Serves the chart, quoteSummary, v7 quote/options, search and fundamentals
+time-series endpoints from recorded fixtures (see YAHOO_RECORD_DIR in
+yahoo_api_direct) or from deterministic synthetic data, with configurable
+latency, error rate and 429 injection for offline benchmarks.
+
+Usage: python yahoo_standin_server.py [--port 8765] [--fixtures DIR] [--latency-ms 80]
+       [--jitter-ms 40] [--error-rate 0.01] [--rate-429 0.02]
+Then run the dashboard or a benchmark with YAHOO_API_BASE=http://127.0.0.1:8765
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+import numpy as np
+
+# Params that don't change which fixture answers a request
+FIXTURE_IGNORED_PARAMS = ('period1', 'period2', 'crumb', 'lang', 'region', 'corsDomain', 'formatted')
+
+def fixture_key(url, params=None):
+    """Host-independent key for a recorded response: path plus the meaningful params"""
+    parts = urlsplit(url)
+    merged = dict(parse_qsl(parts.query, keep_blank_values=True))
+    merged.update({str(key): str(value) for key, value in (params or {}).items()})
+    items = sorted((key, value) for key, value in merged.items() if key not in FIXTURE_IGNORED_PARAMS)
+    return parts.path + '?' + '&'.join(f"{key}={value}" for key, value in items)
+
+def _fixture_path(directory, url, key):
+    path = urlsplit(url).path.rstrip('/')
+    family = 'other'
+    for marker in ('chart', 'quoteSummary', 'quote', 'options', 'search', 'timeseries'):
+        if f'/{marker}' in path:
+            family = marker
+            break
+    name = path.rsplit('/', 1)[-1] if family not in ('quote', 'search') else family
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(directory, family, f"{name}-{digest}.json")
+
+def record_fixture(directory, url, params, response):
+    """Save one live response as a fixture file the stand-in server can replay"""
+    key = fixture_key(url, params)
+    path = _fixture_path(directory, url, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = {
+        'key': key,
+        'url': url,
+        'params': {str(k): str(v) for k, v in (params or {}).items()},
+        'recorded_at': time.time(),
+        'response': response
+    }
+    # Write-then-rename so a concurrent reader never sees half a file
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f)
+    os.replace(temp_path, path)
+    return path
+
+def load_fixtures(directory):
+    """{fixture key: response} for every fixture file under directory"""
+    fixtures = {}
+    if not directory or not os.path.isdir(directory):
+        return fixtures
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(root, name), encoding='utf-8') as f:
+                    payload = json.load(f)
+                fixtures[payload['key']] = payload['response']
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Skipping fixture {name}: {e}")
+    return fixtures
+
+# Deterministic synthetic market data
+
+SUFFIX_CURRENCIES = {
+    '.L': 'GBP', '.PA': 'EUR', '.AS': 'EUR', '.BR': 'EUR', '.DE': 'EUR', '.F': 'EUR', '.MI': 'EUR',
+    '.MC': 'EUR', '.HE': 'EUR', '.SW': 'CHF', '.ST': 'SEK', '.CO': 'DKK', '.OL': 'NOK', '.T': 'JPY',
+    '.HK': 'HKD', '.TO': 'CAD', '.AX': 'AUD'
+}
+SECTORS = [
+    ('Technology', 'Software - Infrastructure'), ('Healthcare', 'Drug Manufacturers - General'),
+    ('Financial Services', 'Banks - Diversified'), ('Consumer Cyclical', 'Auto Manufacturers'),
+    ('Consumer Defensive', 'Household & Personal Products'), ('Industrials', 'Aerospace & Defense'),
+    ('Energy', 'Oil & Gas Integrated'), ('Utilities', 'Utilities - Regulated Electric'),
+    ('Communication Services', 'Internet Content & Information'), ('Basic Materials', 'Specialty Chemicals')
+]
+HISTORY_ORIGIN_DAY = 7305  # 1990-01-01, first day of the synthetic price path
+
+def _seed(symbol, salt=''):
+    return zlib.crc32(f"{symbol.upper()}|{salt}".encode('utf-8'))
+
+def _wrap(value):
+    if value is None:
+        return {}
+    return {'raw': value, 'fmt': f"{value:.2f}" if isinstance(value, float) else str(value)}
+
+def company_profile(symbol):
+    """Stable fake fundamentals for a symbol (the same numbers on every call)"""
+    r = random.Random(_seed(symbol))
+    suffix = '.' + symbol.rsplit('.', 1)[1].upper() if '.' in symbol else ''
+    price = round(math.exp(r.uniform(math.log(5), math.log(800))), 2)
+    shares = math.exp(r.uniform(math.log(5e7), math.log(1.5e10)))
+    trailing_pe = r.uniform(5, 60)
+    eps = price / trailing_pe
+    price_to_book = r.uniform(0.4, 15)
+    sector, industry = r.choice(SECTORS)
+    revenue = price * shares / r.uniform(0.5, 10)
+    return {
+        'symbol': symbol.upper(),
+        'name': f"{symbol.split('.')[0].title()} Holdings",
+        'currency': SUFFIX_CURRENCIES.get(suffix, 'USD'),
+        'price': price,
+        'previousClose': round(price * (1 + r.uniform(-0.03, 0.03)), 2),
+        'sharesOutstanding': int(shares),
+        'marketCap': int(price * shares),
+        'trailingPE': trailing_pe,
+        'forwardPE': trailing_pe * r.uniform(0.7, 1.1),
+        'trailingEps': eps,
+        'forwardEps': eps * r.uniform(0.95, 1.3),
+        'priceToBook': price_to_book,
+        'bookValue': price / price_to_book,
+        'dividendYield': r.choice([0.0, r.uniform(0.005, 0.07)]),
+        'beta': r.uniform(0.4, 2.0),
+        'pegRatio': r.uniform(0.5, 3.5),
+        'totalRevenue': int(revenue),
+        'revenueGrowth': r.uniform(-0.1, 0.45),
+        'earningsGrowth': r.uniform(-0.3, 0.6),
+        'profitMargins': r.uniform(-0.05, 0.35),
+        'grossMargins': r.uniform(0.15, 0.8),
+        'operatingMargins': r.uniform(0.0, 0.4),
+        'returnOnEquity': r.uniform(-0.05, 0.45),
+        'returnOnAssets': r.uniform(-0.02, 0.2),
+        'debtToEquity': r.uniform(0, 250),
+        'currentRatio': r.uniform(0.6, 3.5),
+        'quickRatio': r.uniform(0.4, 3.0),
+        'freeCashflow': int(revenue * r.uniform(-0.02, 0.25)),
+        'operatingCashflow': int(revenue * r.uniform(0.05, 0.35)),
+        'totalDebt': int(revenue * r.uniform(0, 1.2)),
+        'totalCash': int(revenue * r.uniform(0.02, 0.6)),
+        'targetMeanPrice': round(price * r.uniform(0.85, 1.35), 2),
+        'recommendationMean': round(r.uniform(1.5, 3.8), 1),
+        'numberOfAnalystOpinions': r.randint(3, 45),
+        'sector': sector,
+        'industry': industry,
+        'fullTimeEmployees': r.randint(200, 250000),
+    }
+
+def synthetic_bars(symbol, period1, period2):
+    """Daily (weekday) bars between two epoch times; a given day's bar is the same in every window"""
+    profile = company_profile(symbol)
+    today = int(time.time()) // 86400
+    first_day = max(int(period1) // 86400, HISTORY_ORIGIN_DAY)
+    last_day = min(int(period2) // 86400, today)
+    if last_day < first_day:
+        return [], {}
+    
+    generator = np.random.default_rng(_seed(symbol, 'path'))
+    returns = generator.normal(0.0003, 0.018, today - HISTORY_ORIGIN_DAY + 1)
+    # Price path anchored at today's price and walked backwards
+    closes = profile['price'] * np.exp(-(np.cumsum(returns[::-1]) - returns[::-1]))[::-1]
+    
+    days = np.arange(first_day, last_day + 1)
+    days = days[(days + 3) % 7 < 5]  # Epoch day 0 was a Thursday
+    close = closes[days - HISTORY_ORIGIN_DAY]
+    noise = np.random.default_rng(_seed(symbol, f"{first_day}-{last_day}")).uniform(0, 0.015, (3, len(days)))
+    quote = {
+        'open': np.round(close * (1 - noise[0] + noise[1]), 4).tolist(),
+        'high': np.round(close * (1 + noise[1]), 4).tolist(),
+        'low': np.round(close * (1 - noise[2]), 4).tolist(),
+        'close': np.round(close, 4).tolist(),
+        'volume': (np.abs(noise[0]) * 1e9 / max(profile['price'], 1)).astype(int).tolist(),
+    }
+    timestamps = (days * 86400 + 14 * 3600 + 30 * 60).tolist()
+    return timestamps, quote
+
+def synthetic_chart(symbol, query):
+    profile = company_profile(symbol)
+    now = int(time.time())
+    if 'period1' in query:
+        period1, period2 = int(query['period1']), int(query.get('period2', now))
+    else:
+        days = {'1d': 1, '5d': 7, '1mo': 31, '3mo': 92, '6mo': 183, '1y': 366, '2y': 731,
+                '5y': 1827, '10y': 3653, 'max': 7300}.get(query.get('range', '1mo'), 31)
+        period1, period2 = now - days * 86400, now
+    
+    timestamps, quote = synthetic_bars(symbol, period1, period2)
+    meta = {
+        'symbol': profile['symbol'],
+        'currency': profile['currency'],
+        'exchangeName': 'SYN',
+        'fullExchangeName': 'Synthetic Exchange',
+        'instrumentType': 'EQUITY',
+        'regularMarketPrice': profile['price'],
+        'previousClose': profile['previousClose'],
+        'chartPreviousClose': profile['previousClose'],
+        'regularMarketDayHigh': round(profile['price'] * 1.01, 2),
+        'regularMarketDayLow': round(profile['price'] * 0.99, 2),
+        'regularMarketVolume': 1000000,
+        'longName': profile['name'],
+        'shortName': profile['name'],
+        'timezone': 'EST',
+        'dataGranularity': query.get('interval', '1d')
+    }
+    return {'chart': {'result': [{
+        'meta': meta,
+        'timestamp': timestamps,
+        'indicators': {'quote': [quote], 'adjclose': [{'adjclose': quote.get('close', [])}]}
+    }], 'error': None}}
+
+def synthetic_quote_summary(symbol, query):
+    profile = company_profile(symbol)
+    modules = {}
+    requested = query.get('modules', 'price').split(',')
+    if 'price' in requested:
+        modules['price'] = {
+            'symbol': profile['symbol'], 'longName': profile['name'], 'shortName': profile['name'],
+            'currency': profile['currency'], 'quoteType': 'EQUITY',
+            'regularMarketPrice': _wrap(profile['price']),
+            'regularMarketPreviousClose': _wrap(profile['previousClose']),
+            'marketCap': _wrap(profile['marketCap'])
+        }
+    if 'summaryDetail' in requested:
+        modules['summaryDetail'] = {key: _wrap(profile[key]) for key in (
+            'marketCap', 'trailingPE', 'forwardPE', 'dividendYield', 'beta', 'previousClose')}
+    if 'defaultKeyStatistics' in requested:
+        modules['defaultKeyStatistics'] = {key: _wrap(profile[key]) for key in (
+            'priceToBook', 'trailingEps', 'forwardEps', 'bookValue', 'sharesOutstanding', 'pegRatio')}
+    if 'financialData' in requested:
+        modules['financialData'] = {key: _wrap(profile[key]) for key in (
+            'totalRevenue', 'revenueGrowth', 'earningsGrowth', 'profitMargins', 'grossMargins',
+            'operatingMargins', 'returnOnEquity', 'returnOnAssets', 'debtToEquity', 'currentRatio',
+            'quickRatio', 'freeCashflow', 'operatingCashflow', 'totalDebt', 'totalCash',
+            'targetMeanPrice', 'recommendationMean', 'numberOfAnalystOpinions')}
+        modules['financialData']['currentPrice'] = _wrap(profile['price'])
+    if 'assetProfile' in requested:
+        modules['assetProfile'] = {
+            'sector': profile['sector'], 'industry': profile['industry'],
+            'fullTimeEmployees': profile['fullTimeEmployees'], 'country': 'United States',
+            'longBusinessSummary': f"{profile['name']} is a synthetic company used for offline benchmarks."
+        }
+    if 'recommendationTrend' in requested:
+        modules['recommendationTrend'] = {'trend': [
+            {'period': '0m', 'strongBuy': 5, 'buy': 10, 'hold': 8, 'sell': 1, 'strongSell': 0}]}
+    if 'upgradeDowngradeHistory' in requested:
+        modules['upgradeDowngradeHistory'] = {'history': []}
+    return {'quoteSummary': {'result': [modules], 'error': None}}
+
+def synthetic_v7_quote(symbol):
+    profile = company_profile(symbol)
+    change = (profile['price'] - profile['previousClose']) / profile['previousClose'] * 100
+    return {
+        'symbol': profile['symbol'], 'quoteType': 'EQUITY', 'currency': profile['currency'],
+        'longName': profile['name'], 'shortName': profile['name'],
+        'exchange': 'SYN', 'fullExchangeName': 'Synthetic Exchange',
+        'regularMarketPrice': profile['price'], 'regularMarketPreviousClose': profile['previousClose'],
+        'regularMarketChangePercent': change, 'marketCap': profile['marketCap'],
+        'trailingPE': profile['trailingPE'], 'forwardPE': profile['forwardPE'],
+        'priceToBook': profile['priceToBook'], 'sharesOutstanding': profile['sharesOutstanding'],
+        'dividendYield': profile['dividendYield'] * 100, 'epsTrailingTwelveMonths': profile['trailingEps'],
+        'bookValue': profile['bookValue']
+    }
+
+def synthetic_search(query):
+    text = query.get('q', '').strip()
+    symbol = ''.join(ch for ch in text.upper() if ch.isalnum())[:4] or 'X'
+    return {'quotes': [{
+        'symbol': symbol, 'shortname': text.title(), 'longname': f"{text.title()} Inc.",
+        'exchDisp': 'NASDAQ', 'quoteType': 'EQUITY', 'typeDisp': 'Equity', 'score': 100000
+    }], 'news': []}
+
+def synthetic_timeseries(symbol, query):
+    profile = company_profile(symbol)
+    r = random.Random(_seed(symbol, 'statements'))
+    revenue = profile['totalRevenue']
+    # Rough scale of each line item relative to revenue
+    scales = {
+        'TotalRevenue': 1.0, 'OperatingRevenue': 1.0, 'CostOfRevenue': 1 - profile['grossMargins'],
+        'GrossProfit': profile['grossMargins'], 'OperatingIncome': profile['operatingMargins'],
+        'EBIT': profile['operatingMargins'], 'NetIncome': profile['profitMargins'],
+        'NetIncomeCommonStockholders': profile['profitMargins'], 'TotalAssets': 1.8,
+        'CurrentAssets': 0.6, 'CurrentLiabilities': 0.45, 'TotalLiabilitiesNetMinorityInterest': 1.0,
+        'StockholdersEquity': 0.8, 'RetainedEarnings': 0.5, 'LongTermDebt': 0.4,
+        'OperatingCashFlow': profile['operatingCashflow'] / revenue,
+        'FreeCashFlow': profile['freeCashflow'] / revenue, 'CapitalExpenditure': -0.06
+    }
+    results = []
+    this_year = time.gmtime().tm_year
+    for type_name in query.get('type', '').split(','):
+        if type_name.startswith('annual'):
+            key, dates = type_name[len('annual'):], [f"{this_year - i}-12-31" for i in range(1, 5)]
+        elif type_name.startswith('quarterly'):
+            key = type_name[len('quarterly'):]
+            dates = [f"{this_year - (i + 1) // 4}-{['12', '09', '06', '03'][i % 4]}-{['31', '30', '30', '31'][i % 4]}"
+                     for i in range(1, 6)]
+        else:
+            continue
+        scale = scales.get(key, r.uniform(0.01, 0.5))
+        factor = 1.0 if type_name.startswith('annual') else 0.25
+        points = [{
+            'asOfDate': date, 'periodType': '12M' if factor == 1.0 else '3M', 'currencyCode': profile['currency'],
+            'reportedValue': _wrap(float(int(revenue * scale * factor * (1 - 0.06 * i))))
+        } for i, date in enumerate(dates)]
+        results.append({'meta': {'symbol': [profile['symbol']], 'type': [type_name]}, 'timestamp': [0], type_name: points})
+    return {'timeseries': {'result': results, 'error': None}}
+
+def _slice_chart(response, query):
+    """Trim a recorded chart response to the requested period1/period2 window"""
+    try:
+        result = response['chart']['result'][0]
+        timestamps = result.get('timestamp') or []
+    except (KeyError, IndexError, TypeError):
+        return response
+    if 'period1' not in query or not timestamps:
+        return response
+    
+    low, high = int(query['period1']), int(query.get('period2', time.time()))
+    keep = [i for i, ts in enumerate(timestamps) if low <= ts <= high]
+    quote = result['indicators']['quote'][0]
+    trimmed = dict(result)
+    trimmed['timestamp'] = [timestamps[i] for i in keep]
+    trimmed['indicators'] = dict(result['indicators'])
+    trimmed['indicators']['quote'] = [{key: [values[i] for i in keep] for key, values in quote.items()}]
+    return {'chart': {'result': [trimmed], 'error': None}}
+
+class StandinConfig:
+    """Latency and fault injection settings shared by the handler threads"""
+    
+    def __init__(self, fixtures=None, latency_ms=0, jitter_ms=0, error_rate=0.0, rate_429=0.0,
+                 strict=False, seed=None):
+        self.fixtures = fixtures or {}
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.strict = strict
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counters = {'requests': 0, 'fixture_hits': 0, 'synthetic': 0, 'injected_429': 0,
+                         'injected_errors': 0, 'not_found': 0}
+    
+    def count(self, name):
+        with self.lock:
+            self.counters[name] += 1
+    
+    def roll(self):
+        """Decide this request's fate: (delay seconds, forced status or None)"""
+        with self.lock:
+            delay = max(self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms), 0) / 1000
+            draw = self.random.random()
+        if draw < self.rate_429:
+            return delay, 429
+        if draw < self.rate_429 + self.error_rate:
+            return delay, 500
+        return delay, None
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server_version = 'YahooStandin/1.0'
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like the real API
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client gave up (e.g. a hedged request that lost its race)
+    
+    def do_GET(self):
+        config = self.server.config
+        parts = urlsplit(self.path)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        path = parts.path.rstrip('/')
+        
+        if path == '/__stats':
+            with config.lock:
+                return self._send_json(200, dict(config.counters))
+        
+        config.count('requests')
+        delay, forced_status = config.roll()
+        if delay:
+            time.sleep(delay)
+        if forced_status == 429:
+            config.count('injected_429')
+            return self._send_json(429, {'finance': {'error': {'code': 'Too Many Requests'}}})
+        if forced_status:
+            config.count('injected_errors')
+            return self._send_json(forced_status, {'finance': {'error': {'code': 'Internal Server Error'}}})
+        
+        response = self._from_fixtures(path, query)
+        if response is not None:
+            config.count('fixture_hits')
+            return self._send_json(200, response)
+        if config.strict:
+            config.count('not_found')
+            return self._send_json(404, {'finance': {'error': {'code': 'Not Found'}}})
+        
+        response = self._synthesize(path, query)
+        if response is None:
+            config.count('not_found')
+            return self._send_json(404, {'finance': {'error': {'code': 'Not Found'}}})
+        config.count('synthetic')
+        return self._send_json(200, response)
+    
+    def _from_fixtures(self, path, query):
+        fixtures = self.server.config.fixtures
+        if not fixtures:
+            return None
+        response = fixtures.get(fixture_key(path, query))
+        if response is not None and '/finance/chart/' in path:
+            return _slice_chart(response, query)
+        return response
+    
+    def _synthesize(self, path, query):
+        symbol = path.rsplit('/', 1)[-1]
+        if '/finance/chart/' in path:
+            return synthetic_chart(symbol, query)
+        if '/finance/quoteSummary/' in path:
+            return synthetic_quote_summary(symbol, query)
+        if path.endswith('/v7/finance/quote'):
+            symbols = [s for s in query.get('symbols', '').split(',') if s]
+            return {'quoteResponse': {'result': [synthetic_v7_quote(s) for s in symbols], 'error': None}}
+        if '/v7/finance/options/' in path:
+            return {'optionChain': {'result': [{'quote': synthetic_v7_quote(symbol)}], 'error': None}}
+        if path.endswith('/finance/search'):
+            return synthetic_search(query)
+        if '/fundamentals-timeseries/' in path:
+            return synthetic_timeseries(symbol, query)
+        return None
+
+def start_standin_server(port=0, host='127.0.0.1', fixtures_dir=None, **options):
+    """Run the stand-in server on a background thread; returns (server, base_url)
+    
+    Pass base_url to yahoo_api_direct.configure_api_base() (or set
+    YAHOO_API_BASE) and stop it with server.shutdown().
+    """
+    server = ThreadingHTTPServer((host, port), StandinHandler)
+    server.daemon_threads = True
+    server.config = StandinConfig(fixtures=load_fixtures(fixtures_dir), **options)
+    thread = threading.Thread(target=server.serve_forever, name='yahoo-standin', daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the Yahoo Finance API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fixtures', help='directory recorded with YAHOO_RECORD_DIR')
+    parser.add_argument('--strict', action='store_true', help='404 instead of synthetic data when no fixture matches')
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 500')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='fraction of requests answered with 429')
+    parser.add_argument('--seed', type=int, help='seed for latency/fault injection')
+    args = parser.parse_args()
+    
+    server = ThreadingHTTPServer((args.host, args.port), StandinHandler)
+    server.daemon_threads = True
+    server.config = StandinConfig(
+        fixtures=load_fixtures(args.fixtures), latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, rate_429=args.rate_429, strict=args.strict, seed=args.seed
+    )
+    print(f"Yahoo stand-in on http://{args.host}:{args.port} "
+          f"({len(server.config.fixtures)} fixtures, latency {args.latency_ms}±{args.jitter_ms} ms, "
+          f"429 rate {args.rate_429}, error rate {args.error_rate})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()